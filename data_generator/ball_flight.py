@@ -0,0 +1,246 @@
+"""
+Trackman Golf Simulator - Ball Flight
+Vectorized drag/lift/spin trajectory solver for batches of shots, plus a precomputed
+lookup table that interpolates the same solver's results for high-volume generation
+"""
+
+from functools import lru_cache
+from typing import Dict, Optional
+
+import numpy as np
+
+# Ball and air (USGA ball, sea level at 20C)
+BALL_MASS_KG = 0.04593
+BALL_RADIUS_M = 0.021335
+AIR_DENSITY = 1.204
+GRAVITY = 9.81
+AERO_K = 0.5 * AIR_DENSITY * np.pi * BALL_RADIUS_M ** 2 / BALL_MASS_KG
+
+# Aerodynamic coefficients as functions of the spin ratio S = r * omega / v; drag rises
+# below DRAG_CRISIS_SPEED as the dimples lose their effect, which steepens the descent.
+# Fitted to typical launch-monitor carry / apex / landing angle for driver through wedge.
+DRAG_BASE = 0.20
+DRAG_SPIN = 0.20
+DRAG_LOW_SPEED = 0.40
+DRAG_CRISIS_SPEED = 40.0
+LIFT_COEFF = 0.40
+LIFT_EXPONENT = 0.40
+SPIN_DECAY_PER_S = 0.04
+
+# Bounce and roll: horizontal speed kept through the first bounce falls with landing
+# angle and remaining backspin; the ball then covers ROLL_SECONDS worth of that speed
+ROLL_STOP_ANGLE = 75.0
+ROLL_SPIN_BRAKE = 3000.0
+ROLL_SECONDS = 3.7
+
+MPH_TO_MS = 0.44704
+M_TO_YD = 1.0 / 0.9144
+RPM_TO_RAD_S = 2 * np.pi / 60
+
+DEFAULT_DT = 0.05
+MAX_FLIGHT_S = 20.0
+DEFAULT_CHUNK = 65_536
+
+FLIGHT_COLUMNS = ["carry", "total", "apex", "lateral", "landing_angle", "flight_time"]
+
+
+def _acceleration(vx, vy, vz, omega, ax_y, ax_z):
+    """Drag + Magnus lift + gravity for the ball-frame velocity (x downrange, y up, z right).
+
+    The spin axis has no downrange component: (0, ax_y, ax_z) with ax_z = cos(tilt) for
+    backspin and ax_y = -sin(tilt), so a positive tilt curves the ball to the right.
+    """
+    speed = np.sqrt(vx * vx + vy * vy + vz * vz)
+    ratio = BALL_RADIUS_M * omega / np.maximum(speed, 1e-6)
+    low_speed = np.clip(1 - speed / DRAG_CRISIS_SPEED, 0, 1)
+    drag = AERO_K * (DRAG_BASE + DRAG_SPIN * ratio + DRAG_LOW_SPEED * low_speed) * speed
+    lift = AERO_K * LIFT_COEFF * ratio ** LIFT_EXPONENT * speed
+    # spin_axis x v with the axis (0, ax_y, ax_z)
+    cx = ax_y * vz - ax_z * vy
+    cy = ax_z * vx
+    cz = -ax_y * vx
+    return (
+        -drag * vx + lift * cx,
+        -drag * vy + lift * cy - GRAVITY,
+        -drag * vz + lift * cz,
+    )
+
+
+def _integrate(speed, launch, spin, tilt, dt: float) -> np.ndarray:
+    """Midpoint (RK2) steps for every shot at once until all have landed.
+
+    Landed shots are dropped from the working arrays as they come down, so late steps
+    only touch the long flights. Returns an (n, 6) array in SI units: downrange and
+    lateral landing position, apex, landing angle (deg), flight time and the roll
+    distance from the horizontal speed and remaining spin at touchdown.
+    """
+    n = len(speed)
+    out = np.zeros((n, 6))
+    idx = np.arange(n)
+    vx = speed * np.cos(launch)
+    vy = speed * np.sin(launch)
+    vz = np.zeros(n)
+    x = np.zeros(n)
+    y = np.zeros(n)
+    z = np.zeros(n)
+    apex = np.zeros(n)
+    omega0 = spin
+    ax_y = -np.sin(tilt)
+    ax_z = np.cos(tilt)
+    t = 0.0
+    half = 0.5 * dt
+
+    while len(idx) and t < MAX_FLIGHT_S:
+        omega = omega0 * np.exp(-SPIN_DECAY_PER_S * (t + half))
+        ax1, ay1, az1 = _acceleration(vx, vy, vz, omega, ax_y, ax_z)
+        mx, my, mz = vx + ax1 * half, vy + ay1 * half, vz + az1 * half
+        ax2, ay2, az2 = _acceleration(mx, my, mz, omega, ax_y, ax_z)
+        nx, ny, nz = x + mx * dt, y + my * dt, z + mz * dt
+        nvx, nvy, nvz = vx + ax2 * dt, vy + ay2 * dt, vz + az2 * dt
+        t += dt
+
+        landed = ny <= 0
+        if landed.any():
+            # Linear interpolation back to y == 0 inside the step
+            frac = np.where(landed, y / np.maximum(y - ny, 1e-12), 1.0)[landed]
+            lvx = vx[landed] + (nvx[landed] - vx[landed]) * frac
+            lvy = vy[landed] + (nvy[landed] - vy[landed]) * frac
+            lvz = vz[landed] + (nvz[landed] - vz[landed]) * frac
+            horizontal = np.hypot(lvx, lvz)
+            angle = np.degrees(np.arctan2(-lvy, horizontal))
+            spin_left = omega0[landed] * np.exp(-SPIN_DECAY_PER_S * t) / RPM_TO_RAD_S
+            kept = horizontal * np.clip(1 - angle / ROLL_STOP_ANGLE, 0, 1) / (1 + spin_left / ROLL_SPIN_BRAKE)
+            rows = idx[landed]
+            out[rows, 0] = x[landed] + (nx[landed] - x[landed]) * frac
+            out[rows, 1] = z[landed] + (nz[landed] - z[landed]) * frac
+            out[rows, 2] = apex[landed]
+            out[rows, 3] = angle
+            out[rows, 4] = t - dt + dt * frac
+            out[rows, 5] = kept * ROLL_SECONDS
+            keep = ~landed
+            idx = idx[keep]
+            x, y, z = nx[keep], ny[keep], nz[keep]
+            vx, vy, vz = nvx[keep], nvy[keep], nvz[keep]
+            apex = np.maximum(apex[keep], y)
+            omega0, ax_y, ax_z = omega0[keep], ax_y[keep], ax_z[keep]
+        else:
+            x, y, z, vx, vy, vz = nx, ny, nz, nvx, nvy, nvz
+            apex = np.maximum(apex, y)
+    return out
+
+
+def _finish(raw: np.ndarray, direction: np.ndarray) -> Dict[str, np.ndarray]:
+    """Rotate ball-frame landing points by the start direction and convert to yards"""
+    heading = np.radians(direction)
+    cos_h, sin_h = np.cos(heading), np.sin(heading)
+    downrange, side, roll = raw[:, 0], raw[:, 1], raw[:, 5]
+    carry = downrange * cos_h - side * sin_h
+    return {
+        "carry": carry * M_TO_YD,
+        "total": (carry + roll) * M_TO_YD,
+        "apex": raw[:, 2] * M_TO_YD,
+        "lateral": (downrange * sin_h + side * cos_h) * M_TO_YD,
+        "landing_angle": raw[:, 3],
+        "flight_time": raw[:, 4],
+    }
+
+
+def _as_arrays(ball_speed, launch_angle, spin_rate, spin_axis, launch_direction):
+    arrays = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (ball_speed, launch_angle, spin_rate, spin_axis, launch_direction)))
+    return [np.atleast_1d(a).ravel() for a in arrays]
+
+
+def simulate_flight(
+    ball_speed,
+    launch_angle,
+    spin_rate,
+    spin_axis,
+    launch_direction=0.0,
+    dt: float = DEFAULT_DT,
+    chunk_size: int = DEFAULT_CHUNK,
+) -> Dict[str, np.ndarray]:
+    """Integrate full trajectories for a batch of shots.
+
+    Inputs are per-shot arrays (or scalars): ball speed in mph, vertical launch,
+    spin axis tilt and start direction in degrees (positive = right), spin in rpm.
+    Returns FLIGHT_COLUMNS arrays: carry, total, apex and lateral in yards, landing
+    angle in degrees and flight time in seconds. Shots are solved chunk_size at a time
+    to keep the working arrays cache-sized.
+    """
+    speed, launch, spin, axis, direction = _as_arrays(ball_speed, launch_angle, spin_rate, spin_axis, launch_direction)
+    raw = np.empty((len(speed), 6))
+    for start in range(0, len(speed), chunk_size):
+        part = slice(start, start + chunk_size)
+        raw[part] = _integrate(
+            speed[part] * MPH_TO_MS,
+            np.radians(launch[part]),
+            np.maximum(spin[part], 0) * RPM_TO_RAD_S,
+            np.radians(axis[part]),
+            dt,
+        )
+    return _finish(raw, direction)
+
+
+class FlightTable:
+    """simulate_flight results precomputed on a (ball speed, launch, spin, |spin axis|) grid.
+
+    lookup() interpolates multilinearly between the 16 surrounding grid points, which
+    is orders of magnitude cheaper than integrating every shot; negative spin axes
+    mirror the positive side, and the start direction is applied afterwards exactly as
+    simulate_flight does. Inputs outside the grid are clamped to its edges.
+    """
+
+    def __init__(
+        self,
+        speeds: Optional[np.ndarray] = None,
+        launches: Optional[np.ndarray] = None,
+        spins: Optional[np.ndarray] = None,
+        axes: Optional[np.ndarray] = None,
+        dt: float = DEFAULT_DT,
+    ):
+        self.grid = [
+            np.linspace(10, 200, 39) if speeds is None else np.asarray(speeds, dtype=float),
+            np.linspace(0, 50, 21) if launches is None else np.asarray(launches, dtype=float),
+            np.linspace(0, 14000, 29) if spins is None else np.asarray(spins, dtype=float),
+            np.linspace(0, 45, 10) if axes is None else np.asarray(axes, dtype=float),
+        ]
+        mesh = np.meshgrid(*self.grid, indexing="ij")
+        shape = mesh[0].shape
+        raw = np.empty((mesh[0].size, 6))
+        flat = [m.ravel() for m in mesh]
+        for start in range(0, len(raw), DEFAULT_CHUNK):
+            part = slice(start, start + DEFAULT_CHUNK)
+            raw[part] = _integrate(
+                flat[0][part] * MPH_TO_MS, np.radians(flat[1][part]), flat[2][part] * RPM_TO_RAD_S, np.radians(flat[3][part]), dt
+            )
+        self.values = raw.reshape(*shape, 6)
+        self.shape = shape
+
+    def lookup(self, ball_speed, launch_angle, spin_rate, spin_axis, launch_direction=0.0) -> Dict[str, np.ndarray]:
+        """Same inputs and outputs as simulate_flight, interpolated from the table"""
+        speed, launch, spin, axis, direction = _as_arrays(ball_speed, launch_angle, spin_rate, spin_axis, launch_direction)
+        lower, weight = [], []
+        for axis_values, value in zip(self.grid, (speed, launch, spin, np.abs(axis))):
+            i = np.clip(np.searchsorted(axis_values, value, side="right") - 1, 0, len(axis_values) - 2)
+            lo, hi = axis_values[i], axis_values[i + 1]
+            lower.append(i)
+            weight.append(np.clip((value - lo) / (hi - lo), 0.0, 1.0))
+
+        flat_values = self.values.reshape(-1, 6)
+        strides = np.array([int(np.prod(self.shape[d + 1:])) for d in range(4)])
+        base = sum(lower[d] * strides[d] for d in range(4))
+        raw = np.zeros((len(speed), 6))
+        for corner in range(16):
+            bits = [(corner >> d) & 1 for d in range(4)]
+            w = np.ones(len(speed))
+            for d in range(4):
+                w = w * (weight[d] if bits[d] else 1 - weight[d])
+            raw += w[:, None] * flat_values[base + sum(bits[d] * strides[d] for d in range(4))]
+        raw[:, 1] *= np.sign(axis) + (axis == 0)
+        return _finish(raw, direction)
+
+
+@lru_cache(maxsize=1)
+def default_flight_table() -> FlightTable:
+    """The default-grid FlightTable, built once per process on first use"""
+    return FlightTable()
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Trackman Golf Simulator - Generator Benchmarks
+Micro-benchmarks of generator hot paths, and a per-stage harness that records wall time,
+rows/sec, peak RSS and output bytes at several scales and compares them with a stored baseline
+"""
+
+import argparse
+import json
+import random
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+import generate_trackman_data as gen
+from ball_flight import FlightTable, simulate_flight
+from generate_trackman_data import build_course_hole_index, generate_courses_and_holes
+
+STAGES = ["facilities", "sessions", "bay_bookings", "events"]
+SESSION_ENGINES = ["legacy", "columnar", "stream"]
+DEFAULT_SESSION_SCALES = [10_000, 100_000, 1_000_000]
+DEFAULT_FACILITY_SCALES = [50, 500, 5000]
+DEFAULT_TOLERANCE = 0.20
+DEFAULT_REPEATS = 3
+# Throughput drops smaller than this in wall time are timer noise, whatever their relative size
+MIN_WALL_DELTA_S = 0.25
+BENCH_END_DATE = datetime(2025, 1, 1)
+BASELINE_PATH = Path(__file__).parent / "benchmark_baseline.json"
+
+
+def _time_per_call(fn: Callable[[], Any], calls: int) -> float:
+    """Average wall time of fn() in microseconds"""
+    started = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+def bench_course_hole_lookup(lookups: int = 20_000) -> Dict[str, float]:
+    """Per-scorecard course hole lookup: holes_df boolean filter vs the prebuilt course index"""
+    courses_df, holes_df = generate_courses_and_holes()
+    course_ids = courses_df["course_id"].tolist()
+    picks = [(random.choice(course_ids), random.choice([18, 9])) for _ in range(lookups)]
+
+    def filtered():
+        for course_id, holes_played in picks:
+            course_holes = holes_df[holes_df["course_id"] == course_id].to_dict('records')
+            sum(h["par"] for h in course_holes[:holes_played])
+
+    def indexed():
+        hole_index = build_course_hole_index(holes_df)
+        for course_id, holes_played in picks:
+            course_holes = hole_index[course_id]
+            course_holes["holes"][:holes_played]
+            int(course_holes["cum_par"][holes_played - 1])
+
+    filtered_us = _time_per_call(filtered, 1) / lookups
+    indexed_us = _time_per_call(indexed, 1) / lookups
+    return {
+        "lookups": lookups,
+        "filtered_us_per_lookup": round(filtered_us, 3),
+        "indexed_us_per_lookup": round(indexed_us, 3),
+        "speedup": round(filtered_us / indexed_us, 1),
+    }
+
+
+def bench_ball_flight(shots: int = 1_000_000, seed: int = 42) -> Dict[str, float]:
+    """Shots per minute of the trajectory solver and the lookup table on one core, on tour-like launch conditions"""
+    rng = np.random.default_rng(seed)
+    conditions = (
+        rng.uniform(60, 175, shots), rng.uniform(5, 35, shots), rng.uniform(2000, 11000, shots),
+        rng.normal(0, 8, shots), rng.normal(0, 3, shots),
+    )
+    started = time.perf_counter()
+    table = FlightTable()
+    build_s = time.perf_counter() - started
+    started = time.perf_counter()
+    looked_up = table.lookup(*conditions)
+    lookup_s = time.perf_counter() - started
+    started = time.perf_counter()
+    solved = simulate_flight(*conditions)
+    solve_s = time.perf_counter() - started
+    return {
+        "shots": shots,
+        "physics_s": round(solve_s, 2),
+        "physics_shots_per_min": round(shots / solve_s * 60),
+        "lut_build_s": round(build_s, 2),
+        "lut_s": round(lookup_s, 2),
+        "lut_shots_per_min": round(shots / lookup_s * 60),
+        "lut_mean_carry_error_yd": round(float(np.abs(looked_up["carry"] - solved["carry"]).mean()), 3),
+    }
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident set size of this process (ru_maxrss is KiB on Linux, bytes on macOS)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _dir_bytes(path: Path) -> int:
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+
+def _run_stage(stage: str, scale: int, config: Dict[str, Any], output_dir: str) -> Dict[str, Any]:
+    """Run one stage in a fresh process: build its inputs, then time generation and the Parquet write.
+
+    Peak RSS is the high-water mark of this worker process, so every stage runs in its own
+    process; setup_rss_mb is the mark reached before the timed stage started.
+    """
+    np.random.seed(config["seed"])
+    random.seed(config["seed"])
+    out = Path(output_dir)
+    end_date = BENCH_END_DATE
+    start_date = end_date - timedelta(days=config["days"])
+    n_facilities = scale if stage in ("facilities", "bay_bookings") else config["facilities"]
+
+    players_df = gen.generate_players(config["players"], as_of=end_date)
+    courses_df, holes_df = generate_courses_and_holes()
+    if stage != "facilities":
+        facilities_df = gen.generate_facilities(n_facilities)
+        bays_df = gen.generate_bays(facilities_df)
+    setup_rss_mb = _peak_rss_mb()
+
+    write_s = None
+    started = time.perf_counter()
+    if stage == "facilities":
+        facilities_df = gen.generate_facilities(n_facilities)
+        bays_df = gen.generate_bays(facilities_df)
+        frames = {"dim_facilities": facilities_df, "dim_bays": bays_df}
+    elif stage == "sessions" and config["engine"] == "stream":
+        counts = gen.generate_sessions_streaming(
+            players_df, bays_df, courses_df, holes_df, start_date, end_date, out,
+            target_sessions=scale, seed=config["seed"],
+        )
+        frames = None
+    elif stage == "sessions":
+        generate_sessions = gen.generate_sessions_comprehensive if config["engine"] == "legacy" else gen.generate_sessions_columnar
+        frames = dict(zip(gen.SESSION_FACT_TABLES, generate_sessions(
+            players_df, bays_df, courses_df, holes_df, start_date, end_date, target_sessions=scale,
+        )))
+    elif stage == "bay_bookings":
+        frames = {"fact_bay_bookings": gen.generate_bay_bookings(bays_df, start_date, end_date, seed=config["seed"])}
+    elif stage == "events":
+        frames = {
+            "subscription_events": gen.generate_subscription_events(players_df, start_date, end_date, seed=config["seed"]),
+            "marketing_events": gen.generate_marketing_events(players_df, start_date, end_date, seed=config["seed"] + 1),
+        }
+    else:
+        raise ValueError(f"Unknown stage {stage!r}, expected one of {STAGES}")
+    generate_s = time.perf_counter() - started
+
+    if frames is not None:
+        started = time.perf_counter()
+        for name, df in frames.items():
+            gen.save_parquet(df, out / f"{name}.parquet")
+        write_s = time.perf_counter() - started
+        counts = {name: len(df) for name, df in frames.items()}
+
+    rows = sum(counts.values())
+    wall_s = generate_s + (write_s or 0.0)
+    return {
+        "stage": stage,
+        "scale": scale,
+        "engine": config["engine"] if stage == "sessions" else None,
+        "rows": rows,
+        "generate_s": round(generate_s, 3),
+        "write_s": None if write_s is None else round(write_s, 3),
+        "wall_s": round(wall_s, 3),
+        "rows_per_s": round(rows / wall_s, 1) if wall_s else None,
+        "setup_rss_mb": round(setup_rss_mb, 1),
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+        "output_bytes": _dir_bytes(out),
+        "tables": counts,
+    }
+
+
+def run_stage_benchmarks(
+    stages: List[str],
+    session_scales: List[int],
+    facility_scales: List[int],
+    config: Dict[str, Any],
+    repeats: int = DEFAULT_REPEATS,
+) -> List[Dict[str, Any]]:
+    """Run every requested (stage, scale) pair repeats times, each in its own spawned process.
+
+    The run with the median wall time is kept, so one slow or fast run does not move the result.
+    """
+    scales = {
+        "facilities": facility_scales,
+        "sessions": session_scales,
+        "bay_bookings": facility_scales,
+        "events": [config["players"]],
+    }
+    results = []
+    for stage in stages:
+        for scale in scales[stage]:
+            print(f"\n[{stage} @ {scale:,}]")
+            runs = []
+            for _ in range(repeats):
+                with tempfile.TemporaryDirectory(prefix=f"bench_{stage}_") as output_dir:
+                    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+                        runs.append(pool.submit(_run_stage, stage, scale, config, output_dir).result())
+            runs.sort(key=lambda r: r["wall_s"])
+            result = dict(runs[len(runs) // 2], repeats=len(runs), wall_s_runs=[r["wall_s"] for r in runs])
+            print(
+                f"  {result['rows']:,} rows in {result['wall_s']:.2f}s ({result['rows_per_s']:,.0f} rows/s), "
+                f"peak RSS {result['peak_rss_mb']:,.0f} MB, {result['output_bytes'] / (1024 * 1024):,.2f} MB written"
+            )
+            results.append(result)
+    return results
+
+
+def _result_key(result: Dict[str, Any]) -> str:
+    engine = f"[{result['engine']}]" if result.get("engine") else ""
+    return f"{result['stage']}{engine}@{result['scale']}"
+
+
+def compare_to_baseline(
+    results: List[Dict[str, Any]], baseline: List[Dict[str, Any]], tolerance: float = DEFAULT_TOLERANCE
+) -> pd.DataFrame:
+    """Relative change of rows/sec and peak RSS against the baseline run of the same stage and scale.
+
+    A result regresses when peak RSS grows by more than tolerance, or throughput drops by
+    more than tolerance and the stage also got slower by at least MIN_WALL_DELTA_S.
+    """
+    previous = {_result_key(r): r for r in baseline}
+    rows = []
+    for result in results:
+        key = _result_key(result)
+        if key not in previous:
+            continue
+        base = previous[key]
+        throughput = result["rows_per_s"] / base["rows_per_s"] - 1
+        rss = result["peak_rss_mb"] / base["peak_rss_mb"] - 1
+        slower_s = result["wall_s"] - base["wall_s"]
+        rows.append({
+            "run": key,
+            "rows_per_s": result["rows_per_s"],
+            "baseline_rows_per_s": base["rows_per_s"],
+            "throughput_change": round(throughput, 3),
+            "peak_rss_mb": result["peak_rss_mb"],
+            "baseline_peak_rss_mb": base["peak_rss_mb"],
+            "rss_change": round(rss, 3),
+            "regression": (throughput < -tolerance and slower_s >= MIN_WALL_DELTA_S) or rss > tolerance,
+        })
+    return pd.DataFrame(rows)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Trackman Golf Simulator - generator benchmarks")
+    parser.add_argument("--micro", action="store_true", help="Run the hot-path micro-benchmarks instead of the stage harness")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=STAGES, help="Generator stages to benchmark")
+    parser.add_argument("--sessions", nargs="+", type=int, default=DEFAULT_SESSION_SCALES, help="Session counts for the sessions stage")
+    parser.add_argument("--facilities", nargs="+", type=int, default=DEFAULT_FACILITY_SCALES, help="Facility counts for the facilities and bay_bookings stages")
+    parser.add_argument("--engine", choices=SESSION_ENGINES, default="stream", help="Session generator to benchmark (stream keeps 1M sessions in bounded memory)")
+    parser.add_argument("--players", type=int, default=500, help="Players generated as input to every stage")
+    parser.add_argument("--days", type=int, default=90, help="Length of the generated date range")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for every stage")
+    parser.add_argument("--output", type=Path, default=Path("benchmark_results.json"), help="JSON file the results are written to")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS, help="Runs per stage and scale; the median run is kept")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="Results JSON of an earlier run to compare against")
+    parser.add_argument("--no-baseline", action="store_true", help="Skip the baseline comparison")
+    parser.add_argument("--update-baseline", action="store_true", help="Also write the results to --baseline, replacing it")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="Allowed relative throughput drop / peak RSS growth")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    print("=" * 70)
+    print("Trackman Generator Benchmarks")
+    print("=" * 70)
+
+    if args.micro:
+        print("\nCourse hole lookup (per scorecard)...")
+        result = bench_course_hole_lookup()
+        print(pd.Series(result).to_string())
+        print("\nBall flight (1M shots)...")
+        print(pd.Series(bench_ball_flight(), dtype=object).to_string())
+        return 0
+
+    config = {"players": args.players, "facilities": DEFAULT_FACILITY_SCALES[0], "days": args.days, "seed": args.seed, "engine": args.engine}
+    results = run_stage_benchmarks(args.stages, args.sessions, args.facilities, config, args.repeats)
+    report = json.dumps({"created_at": datetime.now().isoformat(), "config": config, "results": results}, indent=2)
+    args.output.write_text(report)
+    print(f"\nResults written to {args.output}")
+
+    if args.update_baseline:
+        args.baseline.write_text(report + "\n")
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+    if args.no_baseline:
+        return 0
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --update-baseline to record one")
+        return 0
+    comparison = compare_to_baseline(results, json.loads(args.baseline.read_text())["results"], args.tolerance)
+    print("\n" + "=" * 70)
+    print(f"Comparison with {args.baseline} (tolerance {args.tolerance:.0%})")
+    print("=" * 70)
+    if comparison.empty:
+        print("No matching stage/scale runs in the baseline")
+        return 0
+    print(comparison.to_string(index=False))
+    regressions = comparison[comparison["regression"]]
+    if not regressions.empty:
+        print(f"\n{len(regressions)} regression(s): {', '.join(regressions['run'])}")
+        return 1
+    print("\nNo regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
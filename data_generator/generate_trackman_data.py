@@ -6,19 +6,54 @@ Supports: Scorecards, Bay Occupation, Course Play, Games, Practice, Tournaments
 
 import os
 import json
+import argparse
 import random
+import shutil
 import uuid
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from multiprocessing import get_context
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from pathlib import Path
+from urllib.parse import quote
+
+from ball_flight import default_flight_table, simulate_flight
+from sampling import HOUR_PROFILES, SKEW_PRESETS, CategoricalSampler, SessionSampler, SkewProfile, skew_preset, skew_summary
 
 np.random.seed(42)
 random.seed(42)
 
 OUTPUT_DIR = Path(__file__).parent.parent / "sample_data"
 
+SESSION_FACT_TABLES = ["fact_sessions", "fact_scorecards", "fact_hole_scores", "fact_shots", "fact_game_sessions"]
+FACT_DATE_COLUMNS = {
+    "fact_sessions": "session_date",
+    "fact_scorecards": "round_date",
+    "fact_hole_scores": "score_date",
+    "fact_shots": "shot_date",
+    "fact_game_sessions": "game_date",
+    "fact_bay_bookings": "booking_date",
+}
+FACT_SORT_COLUMNS = {
+    "fact_sessions": ["facility_id", "bay_id", "started_at"],
+    "fact_scorecards": ["course_id", "round_datetime"],
+    "fact_hole_scores": ["course_id", "scorecard_id", "hole_number"],
+    "fact_shots": ["bay_id", "shot_timestamp"],
+    "fact_game_sessions": ["game_type_id", "started_at"],
+    "fact_bay_bookings": ["facility_id", "bay_id", "hour"],
+}
+PARTITION_SCHEMES = ["date", "date-facility", "date-region", "none"]
+PARTITION_KEY_NAMES = {"date": None, "date-facility": "facility_id", "date-region": "region"}
+DEFAULT_CHUNK_SESSIONS = 2_000
+DEFAULT_ROW_GROUP_SIZE = 100_000
+PARQUET_COMPRESSIONS = ["snappy", "zstd", "gzip", "brotli", "lz4", "none"]
+
 VIRTUAL_COURSES = [
     {"course_id": "pebble_beach", "name": "Pebble Beach Golf Links", "country": "USA", "par": 72, "yardage": 6828, "rating": 4.8, "slope": 145},
     {"course_id": "st_andrews", "name": "St Andrews Old Course", "country": "Scotland", "par": 72, "yardage": 6721, "rating": 4.7, "slope": 132},
@@ -104,6 +139,33 @@ REGIONS = {
     "Middle East": {"countries": ["UAE", "Saudi Arabia"], "weight": 0.05},
 }
 
+SESSION_TYPE_WEIGHTS = [0.25, 0.20, 0.10, 0.08, 0.18, 0.10, 0.05, 0.04]
+HOUR_WEIGHTS = HOUR_PROFILES["default"]
+
+# Categorical distributions, each precomputed once as an alias table (O(1) per draw, batch draws)
+HOUR_SAMPLER = CategoricalSampler(range(24), HOUR_WEIGHTS)
+SESSION_TYPE_SAMPLER = CategoricalSampler(SESSION_TYPES, SESSION_TYPE_WEIGHTS)
+GROUP_SIZE_SAMPLER = CategoricalSampler([1, 2, 3, 4], [0.35, 0.35, 0.20, 0.10])
+ROUND_HOLES_SAMPLER = CategoricalSampler([18, 9], [0.55, 0.45])
+REGION_SAMPLER = CategoricalSampler(list(REGIONS), [r["weight"] for r in REGIONS.values()])
+MEMBERSHIP_TIER_SAMPLER = CategoricalSampler(["basic", "performance", "pro", "facility"], [0.40, 0.35, 0.20, 0.05])
+FACILITY_TYPE_SAMPLER = CategoricalSampler(FACILITY_TYPES, [0.20, 0.35, 0.20, 0.10, 0.10, 0.05])
+SIMULATOR_MODEL_SAMPLER = CategoricalSampler(SIMULATOR_MODELS, [0.35, 0.50, 0.15])
+HANDICAP_BAND_SAMPLER = CategoricalSampler([(-2, 5), (5, 15), (15, 25), (25, 36)], [0.05, 0.35, 0.45, 0.15])
+
+
+def _record_columns(records: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """Turn a list of dimension records into per-field arrays indexed like the list"""
+    return {
+        field: np.array([r[field] for r in records], dtype=object if isinstance(records[0][field], str) else None)
+        for field in records[0]
+    }
+
+
+COURSE_TABLE = _record_columns(VIRTUAL_COURSES)
+GAME_TYPE_TABLE = _record_columns(GAME_TYPES)
+SESSION_TYPE_TABLE = _record_columns(SESSION_TYPES)
+
 FIRST_NAMES = ["James", "John", "Michael", "David", "Robert", "William", "Thomas", "Charles", "Daniel", "Matthew",
                "Emma", "Olivia", "Sophia", "Isabella", "Mia", "Charlotte", "Amelia", "Harper", "Evelyn", "Abigail",
                "Liam", "Noah", "Oliver", "Lucas", "Mason", "Ethan", "Alexander", "Henry", "Sebastian", "Jack",
@@ -156,11 +218,112 @@ def generate_course_holes(course: Dict) -> List[Dict]:
     return holes
 
 
-def generate_player_skill_profile() -> Dict[str, float]:
-    handicap = np.random.choice(
-        [np.random.uniform(-2, 5), np.random.uniform(5, 15), np.random.uniform(15, 25), np.random.uniform(25, 36)],
-        p=[0.05, 0.35, 0.45, 0.15]
-    )
+ID_STRATEGIES = ["seeded", "uuid4", "deterministic", "binary", "int64"]
+INT64_SHARD_BITS = 40
+# Shards each key layout can hold: 16 bits in a deterministic UUID, the bits above the counter in an int64
+SHARD_LIMITS = {"deterministic": 1 << 16, "int64": 1 << (63 - INT64_SHARD_BITS)}
+# Shards from here up belong to shot_stream.py; batch and --append shards stay below it
+STREAM_SHARD_BASE = 0xF000
+
+_HEX_DIGITS = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)
+_UUID_GROUPS = [(0, 8), (8, 12), (12, 16), (16, 20), (20, 32)]
+
+
+def _seeded_uuid() -> str:
+    """UUID4 string drawn from the (seeded) global random state instead of os.urandom"""
+    return str(uuid.UUID(int=random.getrandbits(128), version=4))
+
+
+def _format_uuids(raw: np.ndarray) -> np.ndarray:
+    """(n, 16) uint8 array -> canonical 36-char UUID strings, without a per-row Python loop"""
+    n = len(raw)
+    hex_chars = np.stack([_HEX_DIGITS[raw >> 4], _HEX_DIGITS[raw & 0x0F]], axis=2).reshape(n, 32)
+    chars = np.full((n, 36), ord("-"), dtype=np.uint8)
+    for group, (lo, hi) in enumerate(_UUID_GROUPS):
+        chars[:, lo + group:hi + group] = hex_chars[:, lo:hi]
+    strings = pa.FixedSizeBinaryArray.from_buffers(pa.binary(36), n, [None, pa.py_buffer(chars)])
+    return strings.cast(pa.string()).to_numpy(zero_copy_only=False)
+
+
+class IdFactory:
+    """Primary keys for generated rows under a configurable strategy.
+
+    seeded         UUID4 strings from a seeded 128-bit Generator (default)
+    uuid4          UUID4 strings from os.urandom, one syscall per id
+    deterministic  UUIDv8 strings packing (seed, shard, counter); identical on every run
+    binary         16 random bytes per id from the seeded Generator, stored as Parquet binary
+    int64          surrogate keys shard << 40 | counter, unique across shards
+
+    Give every process/stage that generates rows concurrently its own shard number.
+    """
+
+    def __init__(self, strategy: str = "seeded", seed: int = 42, shard: int = 0, rng: Optional[np.random.Generator] = None):
+        if strategy not in ID_STRATEGIES:
+            raise ValueError(f"Unknown id strategy {strategy!r}, expected one of {ID_STRATEGIES}")
+        limit = SHARD_LIMITS.get(strategy)
+        if limit is not None and not 0 <= shard < limit:
+            raise ValueError(f"Id shard {shard} does not fit the {strategy} key layout (0-{limit - 1})")
+        self.strategy = strategy
+        self.seed = seed
+        self.shard = shard
+        self.rng = rng if rng is not None else np.random.default_rng([seed, shard])
+        self.counter = 0
+        self._buffer: List[Any] = []
+
+    def take(self, n: int) -> np.ndarray:
+        first = self.counter
+        self.counter += n
+        if self.strategy == "int64":
+            if self.counter >= 1 << INT64_SHARD_BITS:
+                raise ValueError(f"int64 ids of shard {self.shard} ran past {1 << INT64_SHARD_BITS} keys")
+            return (np.int64(self.shard) << INT64_SHARD_BITS) + np.arange(first + 1, first + n + 1, dtype=np.int64)
+        if self.strategy == "uuid4":
+            return np.array([str(uuid.uuid4()) for _ in range(n)], dtype=object)
+        if self.strategy == "deterministic":
+            raw = np.zeros((n, 16), dtype=np.uint8)
+            raw[:, 0:4] = np.frombuffer(np.array(self.seed & 0xFFFFFFFF, dtype=">u4").tobytes(), dtype=np.uint8)
+            raw[:, 4:6] = np.frombuffer(np.array(self.shard, dtype=">u2").tobytes(), dtype=np.uint8)
+            raw[:, 6] = 0x80  # version 8: custom layout
+            raw[:, 8:16] = np.arange(first, first + n, dtype=">u8").view(np.uint8).reshape(n, 8)
+            raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80  # RFC 4122 variant
+            return _format_uuids(raw)
+        raw = self.rng.integers(0, 256, (n, 16), dtype=np.uint8)
+        if self.strategy == "binary":
+            values = pa.FixedSizeBinaryArray.from_buffers(pa.binary(16), n, [None, pa.py_buffer(raw)])
+            return values.to_numpy(zero_copy_only=False)
+        raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40  # version 4
+        raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80  # RFC 4122 variant
+        return _format_uuids(raw)
+
+    def next(self) -> Any:
+        """Single id for row-at-a-time generators; drawn from a pre-generated block"""
+        if not self._buffer:
+            self._buffer = self.take(1024).tolist()[::-1]
+        return self._buffer.pop()
+
+
+def _generator(rng=None, seed: Optional[int] = None) -> np.random.Generator:
+    """Return a numpy Generator: rng itself, one seeded with seed, or one seeded from the global numpy state"""
+    if rng is not None:
+        return rng
+    if seed is None:
+        seed = np.random.randint(0, 2**31 - 1)
+    return np.random.default_rng(seed)
+
+
+def _choose(rng: np.random.Generator, options: List[Any], n: int) -> List[Any]:
+    """n uniform picks from options, as the Python values themselves"""
+    return [options[k] for k in rng.integers(0, len(options), n)]
+
+
+def generate_player_skill_profile(
+    band: Optional[Tuple[float, float]] = None, rng: Optional[np.random.Generator] = None
+) -> Dict[str, float]:
+    """Skill profile for a player whose handicap falls in band (drawn from HANDICAP_BAND_SAMPLER if omitted)"""
+    rng = _generator(rng)
+    if band is None:
+        band = HANDICAP_BAND_SAMPLER.sample(rng, 1)[0]
+    handicap = rng.uniform(*band)
     skill_factor = max(0.3, 1.0 - (handicap / 36))
     
     return {
@@ -172,23 +335,37 @@ def generate_player_skill_profile() -> Dict[str, float]:
     }
 
 
-def generate_players(n: int = 500) -> pd.DataFrame:
+def generate_players(
+    n: int = 500, ids: Optional[IdFactory] = None, as_of: Optional[datetime] = None, rng: Optional[np.random.Generator] = None
+) -> pd.DataFrame:
     players = []
-    region_weights = [r["weight"] for r in REGIONS.values()]
-    region_names = list(REGIONS.keys())
+    as_of = as_of or datetime.now()
+    new_id = ids.next if ids is not None else _seeded_uuid
+    rng = _generator(rng)
+    regions = REGION_SAMPLER.sample(rng, n)
+    tiers = MEMBERSHIP_TIER_SAMPLER.sample(rng, n)
+    handicap_bands = HANDICAP_BAND_SAMPLER.sample(rng, n)
+    name_picks = [_choose(rng, names, n) for names in (FIRST_NAMES, LAST_NAMES, FIRST_NAMES, LAST_NAMES)]
+    account_days = rng.integers(30, 366, n)
+    ages = rng.integers(18, 76, n)
+    genders = np.where(rng.random(n) > 0.15, _choose(rng, ["M", "F"], n), "M")
+    tees = _choose(rng, ["Gold", "Blue", "White", "Red"], n)
+    active = rng.random(n) > 0.1
+    guest = rng.random(n) > 0.7
     
     for i in range(n):
-        region = np.random.choice(region_names, p=region_weights)
-        country = random.choice(REGIONS[region]["countries"])
-        skill = generate_player_skill_profile()
+        region = regions[i]
+        countries = REGIONS[region]["countries"]
+        country = countries[rng.integers(len(countries))]
+        skill = generate_player_skill_profile(handicap_bands[i], rng)
         
-        created_at = datetime.now() - timedelta(days=random.randint(30, 365))
+        created_at = as_of - timedelta(days=int(account_days[i]))
         
         player = {
-            "player_id": str(uuid.uuid4()),
-            "player_name": f"{random.choice(FIRST_NAMES)}{random.choice(LAST_NAMES)[0]}",
-            "first_name": random.choice(FIRST_NAMES),
-            "last_name": random.choice(LAST_NAMES),
+            "player_id": new_id(),
+            "player_name": f"{name_picks[0][i]}{name_picks[1][i][0]}",
+            "first_name": name_picks[2][i],
+            "last_name": name_picks[3][i],
             "email": f"player_{i+1}@example.com",
             "country": country,
             "region": region,
@@ -197,20 +374,17 @@ def generate_players(n: int = 500) -> pd.DataFrame:
             "club_speed_base": round(skill["club_speed_base"], 1),
             "consistency_rating": round(skill["consistency"], 3),
             "accuracy_rating": round(skill["accuracy"], 3),
-            "age": random.randint(18, 75),
-            "gender": random.choice(["M", "F"]) if random.random() > 0.15 else "M",
-            "membership_tier": random.choices(
-                ["basic", "performance", "pro", "facility"],
-                weights=[0.40, 0.35, 0.20, 0.05]
-            )[0],
-            "tee_preference": random.choice(["Gold", "Blue", "White", "Red"]),
-            "created_at": created_at.isoformat(),
-            "is_active": random.random() > 0.1,
-            "is_guest": random.random() > 0.7,
+            "age": int(ages[i]),
+            "gender": str(genders[i]),
+            "membership_tier": tiers[i],
+            "tee_preference": tees[i],
+            "created_at": created_at,
+            "is_active": bool(active[i]),
+            "is_guest": bool(guest[i]),
         }
         players.append(player)
     
-    return pd.DataFrame(players)
+    return to_native_types(pd.DataFrame(players))
 
 
 def generate_courses_and_holes() -> Tuple[pd.DataFrame, pd.DataFrame]:
@@ -223,7 +397,7 @@ def generate_courses_and_holes() -> Tuple[pd.DataFrame, pd.DataFrame]:
             "course_name": c["name"],
             "country": c["country"],
             "par": c["par"],
-            "total_yardage": c["yardage"],
+            "yardage": c["yardage"],
             "course_rating": c["rating"],
             "slope_rating": c["slope"],
             "num_holes": 18,
@@ -259,10 +433,15 @@ def generate_clubs() -> pd.DataFrame:
     return pd.DataFrame(clubs)
 
 
-def generate_facilities(n: int = 50) -> pd.DataFrame:
+def generate_facilities(
+    n: int = 50, ids: Optional[IdFactory] = None, as_of: Optional[datetime] = None, rng: Optional[np.random.Generator] = None
+) -> pd.DataFrame:
     facilities = []
-    region_weights = [r["weight"] for r in REGIONS.values()]
-    region_names = list(REGIONS.keys())
+    as_of = as_of or datetime.now()
+    new_id = ids.next if ids is not None else _seeded_uuid
+    rng = _generator(rng)
+    regions = REGION_SAMPLER.sample(rng, n)
+    facility_types = FACILITY_TYPE_SAMPLER.sample(rng, n)
     
     facility_names = [
         "Carl's Place", "Golf Lab", "Swing Studio", "Indoor Golf Center", "Pro Golf Academy",
@@ -270,162 +449,353 @@ def generate_facilities(n: int = 50) -> pd.DataFrame:
         "Links Indoor", "Drive Zone", "Golf Performance Center", "Virtual Golf Club", "Tour Golf"
     ]
     
+    names = _choose(rng, facility_names, n)
+    suffixes = rng.integers(0, 3, n)
+    bay_counts = rng.integers(1, 9, n)
+    open_hours = _choose(rng, [6, 7, 8, 9], n)
+    close_hours = _choose(rng, [20, 21, 22, 23], n)
+    opened_days = rng.integers(30, 1001, n)
+    active = rng.random(n) > 0.05
+    
     for i in range(n):
-        region = np.random.choice(region_names, p=region_weights)
-        country = random.choice(REGIONS[region]["countries"])
-        facility_type = random.choices(
-            FACILITY_TYPES,
-            weights=[0.20, 0.35, 0.20, 0.10, 0.10, 0.05]
-        )[0]
+        region = regions[i]
+        countries = REGIONS[region]["countries"]
+        country = countries[rng.integers(len(countries))]
+        facility_type = facility_types[i]
         
-        num_bays = random.randint(1, 8) if facility_type != "home_residential" else 1
+        num_bays = int(bay_counts[i]) if facility_type != "home_residential" else 1
+        suffix = ["", country[:3], str(i+1)][suffixes[i]]
         
         facility = {
-            "facility_id": str(uuid.uuid4()),
-            "facility_name": f"{random.choice(facility_names)} {random.choice(['', country[:3], str(i+1)])}".strip(),
+            "facility_id": new_id(),
+            "facility_name": f"{names[i]} {suffix}".strip(),
             "facility_type": facility_type,
             "country": country,
             "region": region,
             "city": f"City_{i+1}",
             "num_bays": num_bays,
-            "operating_hours_start": random.choice([6, 7, 8, 9]),
-            "operating_hours_end": random.choice([20, 21, 22, 23]),
+            "operating_hours_start": open_hours[i],
+            "operating_hours_end": close_hours[i],
             "is_commercial": facility_type != "home_residential",
-            "opening_date": (datetime.now() - timedelta(days=random.randint(30, 1000))).date().isoformat(),
-            "is_active": random.random() > 0.05,
+            "opening_date": (as_of - timedelta(days=int(opened_days[i]))).date(),
+            "is_active": bool(active[i]),
         }
         facilities.append(facility)
-    return pd.DataFrame(facilities)
+    return to_native_types(pd.DataFrame(facilities))
 
 
-def generate_bays(facilities_df: pd.DataFrame) -> pd.DataFrame:
+def generate_bays(
+    facilities_df: pd.DataFrame, ids: Optional[IdFactory] = None, as_of: Optional[datetime] = None, rng: Optional[np.random.Generator] = None
+) -> pd.DataFrame:
     bays = []
+    as_of = as_of or datetime.now()
+    new_id = ids.next if ids is not None else _seeded_uuid
+    rng = _generator(rng)
+    n = int(facilities_df["num_bays"].sum())
+    models = SIMULATOR_MODEL_SAMPLER.sample(rng, n)
+    serials = rng.integers(100000, 1000000, n)
+    installed_days = rng.integers(30, 731, n)
+    active = rng.random(n) > 0.02
+    rates = np.round(rng.uniform(30, 80, n), 2)
+    i = 0
     
     for _, facility in facilities_df.iterrows():
         num_bays = facility["num_bays"]
         for j in range(num_bays):
-            model = random.choices(SIMULATOR_MODELS, weights=[0.35, 0.50, 0.15])[0]
+            model = models[i]
             
             bay = {
-                "bay_id": str(uuid.uuid4()),
+                "bay_id": new_id(),
                 "facility_id": facility["facility_id"],
                 "bay_name": f"{facility['facility_name']} Bay" if num_bays == 1 else f"Bay {j+1}",
                 "bay_number": j + 1,
                 "simulator_model": model[0],
                 "simulator_name": model[1],
-                "serial_number": f"TM-{random.randint(100000, 999999)}",
-                "installation_date": (datetime.now() - timedelta(days=random.randint(30, 730))).date().isoformat(),
-                "is_active": random.random() > 0.02,
-                "hourly_rate": round(random.uniform(30, 80), 2) if facility["is_commercial"] else 0,
+                "serial_number": f"TM-{serials[i]}",
+                "installation_date": (as_of - timedelta(days=int(installed_days[i]))).date(),
+                "is_active": bool(active[i]),
+                "hourly_rate": float(rates[i]) if facility["is_commercial"] else 0,
             }
             bays.append(bay)
+            i += 1
     
-    return pd.DataFrame(bays)
+    return to_native_types(pd.DataFrame(bays))
 
 
-def generate_shot_data(player: Dict, club_name: str) -> Dict[str, Any]:
-    specs = CLUB_SPECS[club_name]
-    skill = player["skill_factor"]
-    consistency = player["consistency_rating"]
-    
-    club_speed = player["club_speed_base"] * (specs["smash_target"] / 1.48)
-    club_speed *= np.random.normal(1.0, 0.05 * (1 - consistency))
-    club_speed = max(40, min(130, club_speed))
-    
-    quality = np.random.beta(2 + skill * 3, 2)
-    smash = specs["smash_target"] * (0.85 + 0.15 * quality)
-    smash *= np.random.normal(1.0, 0.02)
-    smash = min(smash, 1.52)
-    
+CLUB_NAMES = list(CLUB_SPECS.keys())
+CLUB_IDS = [c.lower().replace("-", "_") for c in CLUB_NAMES]
+CLUB_INDEX = {name: i for i, name in enumerate(CLUB_NAMES)}
+PRACTICE_CLUB_INDICES = np.array([CLUB_INDEX[c] for c in CLUB_NAMES if c != "Putter"])
+
+SHOT_METRIC_COLUMNS = [
+    "club_speed", "ball_speed", "smash_factor", "attack_angle", "club_path", "face_angle",
+    "face_to_path", "spin_rate", "spin_axis", "launch_angle", "apex_height", "carry_distance",
+    "total_distance", "dynamic_loft", "lateral_deviation",
+]
+# empirical: carry/apex from club distance ranges; physics: integrate every trajectory;
+# lut: interpolate the same physics from a precomputed ball_flight.FlightTable
+BALL_FLIGHT_MODES = ["empirical", "physics", "lut"]
+
+
+def _build_club_table() -> Dict[str, np.ndarray]:
+    """Turn CLUB_SPECS into per-club lookup arrays indexed like CLUB_NAMES"""
+    wedges = ["PW", "GW", "SW", "LW"]
+    short_roll = ["SW", "LW", "Putter"]
+    specs = [CLUB_SPECS[c] for c in CLUB_NAMES]
+    return {
+        "loft": np.array([s["loft"] for s in specs]),
+        "distance_min": np.array([s["typical_distance"][0] for s in specs], dtype=float),
+        "distance_max": np.array([s["typical_distance"][1] for s in specs], dtype=float),
+        "spin_min": np.array([s["spin_range"][0] for s in specs], dtype=float),
+        "spin_max": np.array([s["spin_range"][1] for s in specs], dtype=float),
+        "smash_target": np.array([s["smash_target"] for s in specs]),
+        "attack_angle_mean": np.array([
+            -2.0 if "Iron" in c or c in wedges else 2.0 if c == "Driver" else 0.0
+            for c in CLUB_NAMES
+        ]),
+        "roll_min": np.array([0.01 if c in short_roll else 0.02 for c in CLUB_NAMES]),
+        "roll_max": np.array([0.05 if c in short_roll else 0.12 for c in CLUB_NAMES]),
+    }
+
+
+CLUB_TABLE = _build_club_table()
+
+
+def generate_shot_batch(
+    skill_factor,
+    consistency,
+    club_speed_base,
+    club_idx: np.ndarray,
+    rng=None,
+    seed: Optional[int] = None,
+    ball_flight: str = "empirical",
+) -> Dict[str, np.ndarray]:
+    """Generate launch/flight metrics for a batch of shots in one vectorized pass.
+
+    skill_factor, consistency and club_speed_base are per-shot arrays (or scalars);
+    club_idx indexes CLUB_NAMES. Without rng/seed the Generator is seeded from the global numpy state.
+    ball_flight picks how carry, total, apex and lateral deviation follow from the
+    launch conditions (see BALL_FLIGHT_MODES).
+    """
+    if ball_flight not in BALL_FLIGHT_MODES:
+        raise ValueError(f"Unknown ball flight mode {ball_flight!r}, expected one of {BALL_FLIGHT_MODES}")
+    rng = _generator(rng, seed)
+    club_idx = np.asarray(club_idx, dtype=np.intp)
+    n = len(club_idx)
+    skill = np.asarray(skill_factor, dtype=float)
+    consistency = np.asarray(consistency, dtype=float)
+    smash_target = CLUB_TABLE["smash_target"][club_idx]
+    spin_min = CLUB_TABLE["spin_min"][club_idx]
+    spin_max = CLUB_TABLE["spin_max"][club_idx]
+    distance_min = CLUB_TABLE["distance_min"][club_idx]
+    distance_max = CLUB_TABLE["distance_max"][club_idx]
+
+    club_speed = np.asarray(club_speed_base, dtype=float) * (smash_target / 1.48)
+    club_speed = club_speed * rng.normal(1.0, 0.05 * (1 - consistency), n)
+    club_speed = np.clip(club_speed, 40, 130)
+
+    quality = rng.beta(2 + skill * 3, 2, n)
+    smash = smash_target * (0.85 + 0.15 * quality)
+    smash = np.minimum(smash * rng.normal(1.0, 0.02, n), 1.52)
+
     ball_speed = club_speed * smash
-    
-    attack_angle = np.random.normal(
-        -2 if "Iron" in club_name or club_name in ["PW", "GW", "SW", "LW"] 
-        else 2 if club_name == "Driver" 
-        else 0,
-        2 * (1 - consistency)
-    )
-    
-    optimal_launch = specs["loft"] * 0.75
-    launch_angle = optimal_launch + np.random.normal(0, 3 * (1 - consistency))
-    launch_angle = max(0, min(45, launch_angle))
-    
-    club_path = np.random.normal(0, max(0.1, 4 * (1 - skill)))
-    face_angle = np.random.normal(0, max(0.1, 3 * (1 - skill)))
+
+    attack_angle = rng.normal(CLUB_TABLE["attack_angle_mean"][club_idx], 2 * (1 - consistency), n)
+
+    optimal_launch = CLUB_TABLE["loft"][club_idx] * 0.75
+    launch_angle = np.clip(optimal_launch + rng.normal(0, 3 * (1 - consistency), n), 0, 45)
+
+    club_path = rng.normal(0, np.maximum(0.1, 4 * (1 - skill)), n)
+    face_angle = rng.normal(0, np.maximum(0.1, 3 * (1 - skill)), n)
     face_to_path = face_angle - club_path
-    
-    spin_base = np.mean(specs["spin_range"])
-    spin_rate = spin_base * np.random.normal(1.0, 0.15)
-    spin_rate = max(specs["spin_range"][0] * 0.7, min(specs["spin_range"][1] * 1.3, spin_rate))
-    
-    spin_axis = face_to_path * 8
-    spin_axis = max(-30, min(30, spin_axis))
-    
-    base_carry = np.mean(specs["typical_distance"])
-    speed_factor = ball_speed / (club_speed * specs["smash_target"])
-    carry = base_carry * speed_factor * quality
-    carry *= np.random.normal(1.0, 0.08 * (1 - consistency))
-    carry = max(specs["typical_distance"][0] * 0.6, min(specs["typical_distance"][1] * 1.15, carry))
-    
-    roll = carry * np.random.uniform(0.02, 0.12) if club_name not in ["SW", "LW", "Putter"] else carry * np.random.uniform(0.01, 0.05)
-    total_distance = carry + roll
-    
-    apex_height = carry * np.sin(np.radians(launch_angle)) * 0.4
-    apex_height = max(5, min(150, apex_height))
-    
+
+    spin_rate = (spin_min + spin_max) / 2 * rng.normal(1.0, 0.15, n)
+    spin_rate = np.clip(spin_rate, spin_min * 0.7, spin_max * 1.3)
+
+    spin_axis = np.clip(face_to_path * 8, -30, 30)
+
+    # Launch = attack + ~85% of the loft delivered relative to it; the ball starts
+    # mostly where the face points
+    dynamic_loft = attack_angle + (launch_angle - attack_angle) / 0.85
+    launch_direction = 0.75 * face_angle + 0.25 * club_path
+
+    if ball_flight == "empirical":
+        base_carry = (distance_min + distance_max) / 2
+        speed_factor = ball_speed / (club_speed * smash_target)
+        carry = base_carry * speed_factor * quality
+        carry = carry * rng.normal(1.0, 0.08 * (1 - consistency), n)
+        carry = np.clip(carry, distance_min * 0.6, distance_max * 1.15)
+
+        roll = carry * rng.uniform(CLUB_TABLE["roll_min"][club_idx], CLUB_TABLE["roll_max"][club_idx], n)
+        total_distance = carry + roll
+
+        apex_height = np.clip(carry * np.sin(np.radians(launch_angle)) * 0.4, 5, 150)
+        # Start line plus curvature; the factor matches the physics model's curve per degree of axis tilt
+        lateral = carry * (np.sin(np.radians(launch_direction)) + 0.36 * np.sin(np.radians(spin_axis)))
+    else:
+        solve = simulate_flight if ball_flight == "physics" else default_flight_table().lookup
+        flight = solve(ball_speed, launch_angle, spin_rate, spin_axis, launch_direction)
+        carry, total_distance = flight["carry"], flight["total"]
+        apex_height, lateral = flight["apex"], flight["lateral"]
+
     return {
-        "club_speed": round(club_speed, 1),
-        "ball_speed": round(ball_speed, 1),
-        "smash_factor": round(smash, 3),
-        "attack_angle": round(attack_angle, 1),
-        "club_path": round(club_path, 1),
-        "face_angle": round(face_angle, 1),
-        "face_to_path": round(face_to_path, 1),
-        "spin_rate": int(spin_rate),
-        "spin_axis": round(spin_axis, 1),
-        "launch_angle": round(launch_angle, 1),
-        "apex_height": round(apex_height, 1),
-        "carry_distance": round(carry, 1),
-        "total_distance": round(total_distance, 1),
+        "club_speed": np.round(club_speed, 1),
+        "ball_speed": np.round(ball_speed, 1),
+        "smash_factor": np.round(smash, 3),
+        "attack_angle": np.round(attack_angle, 1),
+        "club_path": np.round(club_path, 1),
+        "face_angle": np.round(face_angle, 1),
+        "face_to_path": np.round(face_to_path, 1),
+        "spin_rate": spin_rate.astype(np.int64),
+        "spin_axis": np.round(spin_axis, 1),
+        "launch_angle": np.round(launch_angle, 1),
+        "apex_height": np.round(apex_height, 1),
+        "carry_distance": np.round(carry, 1),
+        "total_distance": np.round(total_distance, 1),
+        "dynamic_loft": np.round(dynamic_loft, 1),
+        "lateral_deviation": np.round(lateral, 1),
     }
 
 
-def generate_hole_score(player: Dict, hole: Dict) -> Dict:
-    """Generate a realistic hole score based on player skill and hole difficulty"""
-    skill = player["skill_factor"]
-    par = hole["par"]
-    
-    score_probs = {
-        3: {"eagle": 0.01 * skill, "birdie": 0.15 * skill, "par": 0.35 + 0.2 * skill, "bogey": 0.35 - 0.1 * skill, "double": 0.14 - 0.05 * skill},
-        4: {"eagle": 0.005 * skill, "birdie": 0.12 * skill, "par": 0.40 + 0.15 * skill, "bogey": 0.33 - 0.08 * skill, "double": 0.12 - 0.04 * skill},
-        5: {"eagle": 0.03 * skill, "birdie": 0.18 * skill, "par": 0.38 + 0.15 * skill, "bogey": 0.30 - 0.08 * skill, "double": 0.11 - 0.04 * skill},
-    }
-    
-    probs = score_probs.get(par, score_probs[4])
-    total = sum(probs.values())
-    probs = {k: v/total for k, v in probs.items()}
-    
-    outcome = np.random.choice(list(probs.keys()), p=list(probs.values()))
-    score_map = {"eagle": -2, "birdie": -1, "par": 0, "bogey": 1, "double": 2}
-    strokes = par + score_map[outcome]
-    
-    if random.random() > 0.95:
-        strokes += random.choice([1, 2])
-    
-    putts = min(strokes, random.choices([1, 2, 3], weights=[0.15 + 0.1*skill, 0.70, 0.15 - 0.1*skill])[0])
-    gir = strokes - putts <= par - 2
-    fir = random.random() < (0.4 + 0.4 * skill) if par >= 4 else None
-    
+def generate_shot_data(player: Dict, club_name: str) -> Dict[str, Any]:
+    """Generate a single shot; thin wrapper around generate_shot_batch"""
+    batch = generate_shot_batch(
+        player["skill_factor"],
+        player["consistency_rating"],
+        player["club_speed_base"],
+        np.array([CLUB_INDEX[club_name]]),
+    )
+    return {col: batch[col][0].item() for col in SHOT_METRIC_COLUMNS}
+
+
+HOLE_COLUMNS = ["hole_number", "par", "yardage", "stroke_index"]
+
+
+def build_course_hole_index(holes_df: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+    """Group dim_course_holes once into per-course arrays ordered by hole_number.
+
+    Each entry holds hole_number/par/yardage/stroke_index arrays, the running
+    cum_par and the hole records, so scorecard generation never filters holes_df.
+    """
+    index = {}
+    for course_id, group in holes_df.groupby("course_id", sort=False):
+        group = group.sort_values("hole_number")
+        entry = {col: group[col].to_numpy() for col in HOLE_COLUMNS}
+        entry["cum_par"] = np.cumsum(entry["par"])
+        entry["holes"] = group.to_dict('records')
+        index[course_id] = entry
+    return index
+
+
+def course_hole_matrix(hole_index: Dict[str, Dict[str, Any]], course_ids) -> Dict[str, np.ndarray]:
+    """Stack the per-course hole arrays into (n_courses, 18) matrices aligned with course_ids"""
+    return {col: np.stack([hole_index[cid][col][:18] for cid in course_ids]) for col in HOLE_COLUMNS}
+
+
+SCORE_TYPES = np.array(["eagle", "birdie", "par", "bogey", "double"], dtype=object)
+SCORE_OFFSETS = np.array([-2, -1, 0, 1, 2])
+
+
+def _build_score_prob_matrices() -> Tuple[np.ndarray, np.ndarray]:
+    """Outcome probabilities per par as base + slope * skill_factor, rows indexed by par (0-5)"""
+    base = {3: [0, 0, 0.35, 0.35, 0.14], 4: [0, 0, 0.40, 0.33, 0.12], 5: [0, 0, 0.38, 0.30, 0.11]}
+    slope = {3: [0.01, 0.15, 0.2, -0.1, -0.05], 4: [0.005, 0.12, 0.15, -0.08, -0.04], 5: [0.03, 0.18, 0.15, -0.08, -0.04]}
+    return (
+        np.array([base.get(par, base[4]) for par in range(6)]),
+        np.array([slope.get(par, slope[4]) for par in range(6)]),
+    )
+
+
+SCORE_PROB_BASE, SCORE_PROB_SLOPE = _build_score_prob_matrices()
+
+
+def simulate_holes(skill, par: np.ndarray, rng=None, seed: Optional[int] = None) -> Dict[str, Any]:
+    """Simulate scores for aligned skill/par arrays with one categorical draw per hole.
+
+    Outcomes come from the precomputed probability matrices, followed by the
+    5% penalty strokes, putts, GIR and FIR, all vectorized. fir is a nullable
+    BooleanArray (NA on par 3s).
+    """
+    rng = _generator(rng, seed)
+    par = np.asarray(par)
+    n = len(par)
+    skill = np.broadcast_to(np.asarray(skill, dtype=float), (n,))
+    cdf = np.cumsum(SCORE_PROB_BASE[par] + SCORE_PROB_SLOPE[par] * skill[:, None], axis=1)
+    cdf /= cdf[:, -1:]
+    outcome = (rng.random(n)[:, None] > cdf[:, :-1]).sum(axis=1)
+
+    strokes = par + SCORE_OFFSETS[outcome]
+    penalty = rng.random(n) > 0.95
+    strokes += np.where(penalty, 1 + (rng.random(n) < 0.5), 0)
+
+    putt_draw = rng.random(n)
+    putts = np.where(putt_draw < 0.15 + 0.1 * skill, 1, np.where(putt_draw < 0.85 + 0.1 * skill, 2, 3))
+    putts = np.minimum(strokes, putts)
+    has_fairway = par >= 4
+    fir = rng.random(n) < (0.4 + 0.4 * skill)
+
     return {
-        "strokes": max(1, strokes),
+        "strokes": np.maximum(1, strokes),
         "putts": putts,
-        "gir": gir,
-        "fir": fir,
-        "score_type": outcome,
+        "gir": strokes - putts <= par - 2,
+        "fir": pd.arrays.BooleanArray(fir & has_fairway, ~has_fairway),
+        "score_type": pd.Categorical.from_codes(outcome, categories=SCORE_TYPES),
         "vs_par": strokes - par,
     }
 
 
+def round_aggregates(card: np.ndarray, position: np.ndarray, par: np.ndarray, holes: Dict[str, Any], n_cards: int) -> Dict[str, Any]:
+    """Scorecard totals from simulated hole arrays; card maps each hole row to its scorecard"""
+    def per_card(values) -> np.ndarray:
+        return np.bincount(card, weights=values, minlength=n_cards).astype(np.int64)
+
+    holes_played = np.bincount(card, minlength=n_cards)
+    fir_holes = per_card(par >= 4)
+    fir_count = per_card(holes["fir"].to_numpy(dtype=bool, na_value=False))
+    return {
+        "total_strokes": per_card(holes["strokes"]),
+        "putts_total": per_card(holes["putts"]),
+        "played_par": per_card(par),
+        "front_nine": per_card(holes["strokes"] * (position < 9)),
+        "back_nine": pd.arrays.IntegerArray(per_card(holes["strokes"] * (position >= 9)), holes_played != 18),
+        "gir_count": per_card(holes["gir"]),
+        "fir_percentage": np.where(fir_holes > 0, np.round(fir_count / np.maximum(fir_holes, 1) * 100, 1), np.nan),
+    }
+
+
+def simulate_round(skill_factor: float, par: np.ndarray, rng=None) -> Tuple[Dict[str, list], Dict[str, Any]]:
+    """Simulate one player's round over a course's par array.
+
+    Returns the per-hole columns as lists and the scorecard aggregates
+    (total_strokes, putts_total, played_par, front_nine, back_nine, gir_count,
+    fir_percentage), both derived from the same arrays.
+    """
+    par = np.asarray(par)
+    holes = simulate_holes(skill_factor, par, rng)
+    position = np.arange(len(par))
+    aggregates = round_aggregates(np.zeros(len(par), dtype=np.intp), position, par, holes, 1)
+    rows = {col: values.tolist() for col, values in holes.items() if col != "fir"}
+    rows["fir"] = holes["fir"].to_numpy(dtype=object, na_value=None).tolist()
+    totals = {
+        col: (None if pd.isna(values[0]) else values[0].item())
+        for col, values in aggregates.items()
+    }
+    return rows, totals
+
+
+def generate_hole_score(player: Dict, hole: Dict) -> Dict:
+    """Generate a realistic hole score based on player skill and hole difficulty"""
+    holes = simulate_holes(player["skill_factor"], np.array([hole["par"]]))
+    return {
+        "strokes": holes["strokes"][0].item(),
+        "putts": holes["putts"][0].item(),
+        "gir": bool(holes["gir"][0]),
+        "fir": None if pd.isna(holes["fir"][0]) else bool(holes["fir"][0]),
+        "score_type": holes["score_type"][0],
+        "vs_par": holes["vs_par"][0].item(),
+    }
+
+
 def generate_sessions_comprehensive(
     players_df: pd.DataFrame,
     bays_df: pd.DataFrame,
@@ -433,7 +803,10 @@ def generate_sessions_comprehensive(
     holes_df: pd.DataFrame,
     start_date: datetime,
     end_date: datetime,
-    target_sessions: int = 8000
+    target_sessions: int = 8000,
+    hole_index: Optional[Dict[str, Dict[str, Any]]] = None,
+    ids: Optional[IdFactory] = None,
+    ball_flight: str = "empirical",
 ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     
     sessions = []
@@ -442,13 +815,17 @@ def generate_sessions_comprehensive(
     shots = []
     game_sessions = []
     
-    session_weights = [0.25, 0.20, 0.10, 0.08, 0.18, 0.10, 0.05, 0.04]
-    
     date_range = (end_date - start_date).days
     players_list = players_df.to_dict('records')
     bays_list = bays_df.to_dict('records')
     courses_list = courses_df.to_dict('records')
-    club_names = [c for c in CLUB_SPECS.keys() if c != "Putter"]
+    hole_index = hole_index or build_course_hole_index(holes_df)
+    new_id = ids.next if ids is not None else _seeded_uuid
+    rng = _generator()
+    group_sizes = GROUP_SIZE_SAMPLER.sample(rng, target_sessions)
+    session_types = SESSION_TYPE_SAMPLER.sample(rng, target_sessions)
+    hours = HOUR_SAMPLER.sample(rng, target_sessions)
+    round_holes = ROUND_HOLES_SAMPLER.sample(rng, target_sessions)
     
     print(f"Generating {target_sessions} sessions...")
     
@@ -456,35 +833,35 @@ def generate_sessions_comprehensive(
         if session_idx % 1000 == 0:
             print(f"  Progress: {session_idx}/{target_sessions} sessions")
         
-        num_players = random.choices([1, 2, 3, 4], weights=[0.35, 0.35, 0.20, 0.10])[0]
+        num_players = int(group_sizes[session_idx])
         session_players = random.sample(players_list, min(num_players, len(players_list)))
         player = session_players[0]
         bay = random.choice(bays_list)
-        session_type = random.choices(SESSION_TYPES, weights=session_weights)[0]
+        session_type = session_types[session_idx]
         
         session_date = start_date + timedelta(days=random.randint(0, date_range))
-        hour_weights = [0.01]*6 + [0.03, 0.05, 0.08, 0.10, 0.10, 0.12, 0.10, 0.08, 0.06, 0.08, 0.06, 0.04, 0.02, 0.01, 0.01, 0.01, 0.01, 0.01]
-        hour = np.random.choice(range(24), p=[w/sum(hour_weights[:24]) for w in hour_weights[:24]])
+        hour = int(hours[session_idx])
         session_start = session_date.replace(hour=hour, minute=random.randint(0, 59))
         
         duration = session_type["avg_duration"] + random.randint(-20, 40)
         duration = max(15, duration)
         
-        session_id = str(uuid.uuid4())
+        session_id = new_id()
         is_logged_in = not player["is_guest"]
         
         session = {
             "session_id": session_id,
+            "player_id": player["player_id"],
             "facility_id": bay["facility_id"],
             "bay_id": bay["bay_id"],
             "bay_name": bay["bay_name"],
             "session_type": session_type["type_id"],
             "session_category": session_type["category"],
-            "started_at": session_start.isoformat(),
-            "ended_at": (session_start + timedelta(minutes=duration)).isoformat(),
+            "started_at": session_start,
+            "ended_at": session_start + timedelta(minutes=duration),
             "duration_minutes": duration,
-            "session_date": session_start.date().isoformat(),
-            "day_of_week": session_start.strftime("%A"),
+            "session_date": session_start.date(),
+            "day_of_week": session_start.weekday(),
             "hour_of_day": hour,
             "num_players": num_players,
             "is_logged_in": is_logged_in,
@@ -494,51 +871,27 @@ def generate_sessions_comprehensive(
         
         if session_type["type_id"] == "course_play":
             course = random.choice(courses_list)
-            holes_played = random.choices([18, 9], weights=[0.55, 0.45])[0]
+            holes_played = int(round_holes[session_idx])
             
             for sp in session_players:
-                scorecard_id = str(uuid.uuid4())
-                course_holes = holes_df[holes_df["course_id"] == course["course_id"]].to_dict('records')
-                
-                total_strokes = 0
-                total_putts = 0
-                gir_count = 0
-                fir_count = 0
-                fir_holes = 0
+                scorecard_id = new_id()
+                course_holes = hole_index[course["course_id"]]
+                holes, totals = simulate_round(sp["skill_factor"], course_holes["par"][:holes_played])
                 
-                for hole in course_holes[:holes_played]:
-                    score_data = generate_hole_score(sp, hole)
-                    total_strokes += score_data["strokes"]
-                    total_putts += score_data["putts"]
-                    if score_data["gir"]:
-                        gir_count += 1
-                    if score_data["fir"] is not None:
-                        fir_holes += 1
-                        if score_data["fir"]:
-                            fir_count += 1
-                    
+                for i in range(holes_played):
                     hole_scores.append({
-                        "hole_score_id": str(uuid.uuid4()),
+                        "hole_score_id": new_id(),
                         "scorecard_id": scorecard_id,
                         "session_id": session_id,
                         "player_id": sp["player_id"],
                         "course_id": course["course_id"],
-                        "hole_number": hole["hole_number"],
-                        "par": hole["par"],
-                        "yardage": hole["yardage"],
-                        "stroke_index": hole["stroke_index"],
-                        "strokes": score_data["strokes"],
-                        "putts": score_data["putts"],
-                        "gir": score_data["gir"],
-                        "fir": score_data["fir"],
-                        "score_type": score_data["score_type"],
-                        "vs_par": score_data["vs_par"],
-                        "score_date": session_start.date().isoformat(),
+                        **{col: course_holes["holes"][i][col] for col in HOLE_COLUMNS},
+                        **{col: values[i] for col, values in holes.items()},
+                        "score_date": session_start.date(),
                     })
                 
-                expected_par = sum(h["par"] for h in course_holes[:holes_played])
-                front_nine = sum(hs["strokes"] for hs in hole_scores[-holes_played:][:9]) if holes_played >= 9 else None
-                back_nine = sum(hs["strokes"] for hs in hole_scores[-holes_played:][9:]) if holes_played == 18 else None
+                total_strokes = totals["total_strokes"]
+                expected_par = int(course_holes["cum_par"][holes_played - 1])
                 
                 scorecards.append({
                     "scorecard_id": scorecard_id,
@@ -550,21 +903,21 @@ def generate_sessions_comprehensive(
                     "tee": sp.get("tee_preference", "Gold"),
                     "holes_played": holes_played,
                     "total_strokes": total_strokes,
-                    "front_nine": front_nine,
-                    "back_nine": back_nine,
+                    "front_nine": totals["front_nine"],
+                    "back_nine": totals["back_nine"],
                     "total_par": expected_par,
                     "score_vs_par": total_strokes - expected_par,
                     "gross_score": total_strokes,
                     "net_score": total_strokes - int(sp["handicap_index"] * holes_played / 18),
                     "handicap": sp["handicap_index"],
-                    "gir_count": gir_count,
-                    "gir_percentage": round(gir_count / holes_played * 100, 1),
-                    "fir_percentage": round(fir_count / fir_holes * 100, 1) if fir_holes > 0 else None,
-                    "putts_total": total_putts,
-                    "putts_per_hole": round(total_putts / holes_played, 2),
+                    "gir_count": totals["gir_count"],
+                    "gir_percentage": round(totals["gir_count"] / holes_played * 100, 1),
+                    "fir_percentage": totals["fir_percentage"],
+                    "putts_total": totals["putts_total"],
+                    "putts_per_hole": round(totals["putts_total"] / holes_played, 2),
                     "is_complete": holes_played == 18,
-                    "round_date": session_start.date().isoformat(),
-                    "round_datetime": session_start.isoformat(),
+                    "round_date": session_start.date(),
+                    "round_datetime": session_start,
                 })
         
         elif session_type["type_id"] == "game":
@@ -573,7 +926,7 @@ def generate_sessions_comprehensive(
             score = random.randint(50, 100) * num_players
             
             game_sessions.append({
-                "game_session_id": str(uuid.uuid4()),
+                "game_session_id": new_id(),
                 "session_id": session_id,
                 "game_type_id": game["game_type_id"],
                 "game_name": game["name"],
@@ -582,60 +935,53 @@ def generate_sessions_comprehensive(
                 "total_strokes": num_shots,
                 "score": score,
                 "duration_minutes": duration,
-                "game_date": session_start.date().isoformat(),
-                "started_at": session_start.isoformat(),
+                "game_date": session_start.date(),
+                "started_at": session_start,
             })
         
         elif session_type["category"] == "practice":
             num_shots = random.randint(80, 150)
+            club_idx = np.random.choice(PRACTICE_CLUB_INDICES, num_shots)
+            batch = generate_shot_batch(
+                player["skill_factor"], player["consistency_rating"], player["club_speed_base"], club_idx,
+                ball_flight=ball_flight,
+            )
+            metrics = {col: batch[col].tolist() for col in SHOT_METRIC_COLUMNS}
             for i in range(num_shots):
-                club = random.choice(club_names)
-                shot_data = generate_shot_data(player, club)
                 shots.append({
-                    "shot_id": str(uuid.uuid4()),
+                    "shot_id": new_id(),
                     "session_id": session_id,
                     "player_id": player["player_id"],
                     "bay_id": bay["bay_id"],
-                    "club_id": club.lower().replace("-", "_"),
+                    "club_id": CLUB_IDS[club_idx[i]],
                     "shot_number": i + 1,
-                    "shot_timestamp": (session_start + timedelta(seconds=i*30)).isoformat(),
-                    "shot_date": session_start.date().isoformat(),
-                    **shot_data,
+                    "shot_timestamp": session_start + timedelta(seconds=i*30),
+                    "shot_date": session_start.date(),
+                    **{col: metrics[col][i] for col in SHOT_METRIC_COLUMNS},
                 })
         
         elif session_type["type_id"] == "tournament":
             course = random.choice(courses_list)
             for sp in session_players:
-                scorecard_id = str(uuid.uuid4())
-                course_holes = holes_df[holes_df["course_id"] == course["course_id"]].to_dict('records')
-                
-                total_strokes = 0
-                total_putts = 0
+                scorecard_id = new_id()
+                course_holes = hole_index[course["course_id"]]
+                holes, totals = simulate_round(sp["skill_factor"], course_holes["par"])
                 
-                for hole in course_holes:
-                    score_data = generate_hole_score(sp, hole)
-                    total_strokes += score_data["strokes"]
-                    total_putts += score_data["putts"]
-                    
+                for i in range(len(course_holes["holes"])):
                     hole_scores.append({
-                        "hole_score_id": str(uuid.uuid4()),
+                        "hole_score_id": new_id(),
                         "scorecard_id": scorecard_id,
                         "session_id": session_id,
                         "player_id": sp["player_id"],
                         "course_id": course["course_id"],
-                        "hole_number": hole["hole_number"],
-                        "par": hole["par"],
-                        "yardage": hole["yardage"],
-                        "stroke_index": hole["stroke_index"],
-                        "strokes": score_data["strokes"],
-                        "putts": score_data["putts"],
-                        "gir": score_data["gir"],
-                        "fir": score_data["fir"],
-                        "score_type": score_data["score_type"],
-                        "vs_par": score_data["vs_par"],
-                        "score_date": session_start.date().isoformat(),
+                        **{col: course_holes["holes"][i][col] for col in HOLE_COLUMNS},
+                        **{col: values[i] for col, values in holes.items()},
+                        "score_date": session_start.date(),
                     })
                 
+                total_strokes = totals["total_strokes"]
+                total_putts = totals["putts_total"]
+                
                 scorecards.append({
                     "scorecard_id": scorecard_id,
                     "session_id": session_id,
@@ -646,256 +992,1366 @@ def generate_sessions_comprehensive(
                     "tee": sp.get("tee_preference", "Gold"),
                     "holes_played": 18,
                     "total_strokes": total_strokes,
-                    "front_nine": sum(hs["strokes"] for hs in hole_scores[-18:][:9]),
-                    "back_nine": sum(hs["strokes"] for hs in hole_scores[-18:][9:]),
+                    "front_nine": totals["front_nine"],
+                    "back_nine": totals["back_nine"],
                     "total_par": course["par"],
                     "score_vs_par": total_strokes - course["par"],
                     "gross_score": total_strokes,
                     "net_score": total_strokes - int(sp["handicap_index"]),
                     "handicap": sp["handicap_index"],
-                    "gir_count": sum(1 for hs in hole_scores[-18:] if hs["gir"]),
-                    "gir_percentage": round(sum(1 for hs in hole_scores[-18:] if hs["gir"]) / 18 * 100, 1),
+                    "gir_count": totals["gir_count"],
+                    "gir_percentage": round(totals["gir_count"] / 18 * 100, 1),
                     "fir_percentage": None,
                     "putts_total": total_putts,
                     "putts_per_hole": round(total_putts / 18, 2),
                     "is_complete": True,
                     "is_tournament": True,
-                    "round_date": session_start.date().isoformat(),
-                    "round_datetime": session_start.isoformat(),
+                    "round_date": session_start.date(),
+                    "round_datetime": session_start,
                 })
     
     print(f"Generated: {len(sessions)} sessions, {len(scorecards)} scorecards, {len(hole_scores)} hole scores, {len(shots)} shots, {len(game_sessions)} game sessions")
     
-    return (
-        pd.DataFrame(sessions),
-        pd.DataFrame(scorecards),
-        pd.DataFrame(hole_scores),
-        pd.DataFrame(shots),
-        pd.DataFrame(game_sessions)
+    categories = FactCategories(players_df, bays_df, courses_df)
+    return tuple(
+        categories.encode(to_native_types(pd.DataFrame(rows)))
+        for rows in (sessions, scorecards, hole_scores, shots, game_sessions)
     )
 
 
+WEEKDAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+
+def _epoch_days(ts: np.ndarray) -> np.ndarray:
+    return ts.astype("datetime64[D]").astype(np.int32)
+
+
+def _dates(days: np.ndarray) -> pd.arrays.ArrowExtensionArray:
+    """Days since epoch -> Arrow date32 column (written to Parquet as DATE)"""
+    return pd.arrays.ArrowExtensionArray(pa.array(days, type=pa.int32()).cast(pa.date32()))
+
+
+def _day_of_week(days: np.ndarray) -> pd.Categorical:
+    """Days since epoch -> weekday-name categorical (1970-01-01 was a Thursday)"""
+    return pd.Categorical.from_codes((days + 3) % 7, categories=WEEKDAY_NAMES)
+
+
+TIMESTAMP_COLUMNS = ["created_at", "started_at", "ended_at", "shot_timestamp", "round_datetime"]
+DATE_COLUMNS = [
+    "session_date", "score_date", "shot_date", "round_date", "game_date", "booking_date",
+    "opening_date", "installation_date",
+]
+# Integer columns that are null for some rows (back nine of a 9-hole round); row-built
+# frames would otherwise turn them into float
+NULLABLE_INT_COLUMNS = ["back_nine"]
+
+
+def to_native_types(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert row-built datetime/date columns to datetime64[us]/date32, nullable ints to Int64 and day_of_week to a categorical"""
+    for col in df.columns.intersection(TIMESTAMP_COLUMNS):
+        df[col] = pd.to_datetime(df[col]).astype("datetime64[us]")
+    for col in df.columns.intersection(DATE_COLUMNS):
+        df[col] = _dates(_epoch_days(pd.to_datetime(df[col]).to_numpy()))
+    for col in df.columns.intersection(NULLABLE_INT_COLUMNS):
+        df[col] = df[col].astype("Int64")
+    if "day_of_week" in df.columns:
+        weekday = df["day_of_week"]
+        df["day_of_week"] = (
+            pd.Categorical.from_codes(weekday, categories=WEEKDAY_NAMES)
+            if pd.api.types.is_integer_dtype(weekday)
+            else pd.Categorical(weekday, categories=WEEKDAY_NAMES)
+        )
+    return df
+
+
+class FactCategories:
+    """Dictionary encodings for the repeated string and dimension-key columns of the session fact tables.
+
+    Categories come from the dimension tables rather than from the rows drawn, so every
+    chunk, shard and append delta writes the same Parquet dictionary and index width,
+    and they are kept in value order so codes sort like the strings. Built once per
+    run; lookup() maps dimension-row indices straight to codes.
+    """
+
+    def __init__(self, players_df: pd.DataFrame, bays_df: pd.DataFrame, courses_df: pd.DataFrame):
+        sources = {
+            "player_id": players_df["player_id"],
+            "bay_id": bays_df["bay_id"],
+            "facility_id": bays_df["facility_id"],
+            "bay_name": bays_df["bay_name"],
+            "player_name": players_df["player_name"],
+            "tee": players_df["tee_preference"],
+            "course_id": courses_df["course_id"],
+            "course_name": courses_df["course_name"],
+            "session_type": SESSION_TYPE_TABLE["type_id"],
+            "session_category": SESSION_TYPE_TABLE["category"],
+            "game_type_id": GAME_TYPE_TABLE["game_type_id"],
+            "game_name": GAME_TYPE_TABLE["name"],
+            "club_id": np.array(CLUB_IDS, dtype=object),
+            "score_type": SCORE_TYPES,
+        }
+        self.row_codes: Dict[str, np.ndarray] = {}
+        self.categories: Dict[str, pd.Index] = {}
+        for column, values in sources.items():
+            self.row_codes[column], self.categories[column] = pd.factorize(np.asarray(values, dtype=object), sort=True)
+
+    def lookup(self, column: str, idx: np.ndarray) -> pd.Categorical:
+        """The column's values for dimension rows idx, as a categorical"""
+        return pd.Categorical.from_codes(self.row_codes[column][idx], categories=self.categories[column])
+
+    def encode(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Convert a row-built frame's string columns to the same categoricals"""
+        for column in df.columns.intersection(list(self.categories)):
+            df[column] = pd.Categorical(df[column], categories=self.categories[column])
+        return df
+
+
+def _group_positions(counts: np.ndarray) -> np.ndarray:
+    """Position of every row inside its group once groups are expanded with np.repeat(..., counts)"""
+    offsets = np.cumsum(counts) - counts
+    return np.arange(counts.sum()) - np.repeat(offsets, counts)
+
+
+def _sample_players(rng: np.random.Generator, n_players: int, n_sessions: int, k: int) -> np.ndarray:
+    """Draw k distinct player indices per session (row-wise sampling without replacement)"""
+    picks = np.empty((n_sessions, k), dtype=np.int64)
+    for j in range(k):
+        draw = rng.integers(0, n_players - j, n_sessions)
+        taken = np.sort(picks[:, :j], axis=1)
+        for t in range(j):
+            draw += draw >= taken[:, t]
+        picks[:, j] = draw
+    return picks
+
+
+def generate_sessions_columnar(
+    players_df: pd.DataFrame,
+    bays_df: pd.DataFrame,
+    courses_df: pd.DataFrame,
+    holes_df: pd.DataFrame,
+    start_date: datetime,
+    end_date: datetime,
+    target_sessions: int = 8000,
+    rng: Optional[np.random.Generator] = None,
+    seed: Optional[int] = None,
+    hole_index: Optional[Dict[str, Dict[str, Any]]] = None,
+    ids: Optional[IdFactory] = None,
+    verbose: bool = True,
+    skew: Optional[SkewProfile] = None,
+    sampler: Optional[SessionSampler] = None,
+    ball_flight: str = "empirical",
+    categories: Optional[FactCategories] = None,
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Columnar variant of generate_sessions_comprehensive.
+
+    Samples every session attribute for all target_sessions at once, expands
+    scorecards, hole scores, games and shots with repeat/cumsum offsets and
+    builds each fact table straight from typed arrays. Returns the same five
+    frames with the same columns.
+
+    With a skew profile (or a prebuilt sampler) bays, players, courses, days
+    and hours are drawn from its alias tables instead of uniformly. Repeated
+    strings are emitted as categoricals encoded by categories (built from the
+    dimensions when not given).
+    """
+    rng = _generator(rng, seed)
+    ids = ids or IdFactory(rng=rng)
+    n = target_sessions
+    date_range = (end_date - start_date).days
+    if sampler is None and skew is not None:
+        sampler = SessionSampler(skew, players_df, bays_df, courses_df, start_date, date_range + 1)
+    categories = categories or FactCategories(players_df, bays_df, courses_df)
+
+    if verbose:
+        print(f"Generating {n} sessions (columnar)...")
+
+    skill = players_df["skill_factor"].to_numpy(dtype=float)
+    handicap = players_df["handicap_index"].to_numpy(dtype=float)
+    is_guest = players_df["is_guest"].to_numpy(dtype=bool)
+
+    type_ids = SESSION_TYPE_TABLE["type_id"]
+    type_categories = SESSION_TYPE_TABLE["category"]
+    type_durations = SESSION_TYPE_TABLE["avg_duration"]
+
+    # Session-level attributes, one draw per column
+    max_players = min(4, len(players_df))
+    num_players = np.minimum(GROUP_SIZE_SAMPLER.sample(rng, n), max_players)
+    if sampler is None:
+        session_players = _sample_players(rng, len(players_df), n, max_players)
+        bay_idx = rng.integers(0, len(bays_df), n)
+    else:
+        session_players = sampler.sample_players(rng, n, max_players)
+        bay_idx = sampler.bays.sample(rng, n)
+    primary = session_players[:, 0]
+    type_idx = SESSION_TYPE_SAMPLER.sample_indices(rng, n)
+    if sampler is None:
+        day_offset = rng.integers(0, date_range + 1, n)
+        hour = HOUR_SAMPLER.sample(rng, n)
+    else:
+        day_offset = sampler.days.sample(rng, n)
+        hour = sampler.hours.sample(rng, n)
+    minute = rng.integers(0, 60, n)
+    duration = np.maximum(15, type_durations[type_idx] + rng.integers(-20, 41, n))
+
+    day_start = np.datetime64(start_date.replace(hour=0, minute=0), "us")
+    started = (
+        day_start
+        + day_offset.astype("timedelta64[D]")
+        + hour.astype("timedelta64[h]")
+        + minute.astype("timedelta64[m]")
+    )
+    session_ids = ids.take(n)
+    session_days = _epoch_days(started)
+    is_logged_in = ~is_guest[primary]
+    session_type = type_ids[type_idx]
+
+    sessions_df = pd.DataFrame({
+        "session_id": session_ids,
+        "player_id": categories.lookup("player_id", primary),
+        "facility_id": categories.lookup("facility_id", bay_idx),
+        "bay_id": categories.lookup("bay_id", bay_idx),
+        "bay_name": categories.lookup("bay_name", bay_idx),
+        "session_type": categories.lookup("session_type", type_idx),
+        "session_category": categories.lookup("session_category", type_idx),
+        "started_at": started,
+        "ended_at": started + duration.astype("timedelta64[m]"),
+        "duration_minutes": duration,
+        "session_date": _dates(session_days),
+        "day_of_week": _day_of_week(session_days),
+        "hour_of_day": hour,
+        "num_players": num_players,
+        "is_logged_in": is_logged_in,
+        "is_guest": ~is_logged_in,
+    })
+
+    # Scorecards: one per player in every course_play / tournament session
+    course_ids = courses_df["course_id"].to_numpy(dtype=object)
+    hole_matrix = course_hole_matrix(hole_index or build_course_hole_index(holes_df), course_ids)
+    is_tournament = session_type == "tournament"
+    round_sessions = np.flatnonzero((session_type == "course_play") | is_tournament)
+    if sampler is None:
+        round_course = rng.integers(0, len(courses_df), len(round_sessions))
+    else:
+        round_course = sampler.courses.sample(rng, len(round_sessions))
+    round_holes = np.where(
+        is_tournament[round_sessions], 18, ROUND_HOLES_SAMPLER.sample(rng, len(round_sessions))
+    )
+    round_players = num_players[round_sessions]
+
+    sc_session = np.repeat(round_sessions, round_players)
+    sc_player = session_players[round_sessions][np.arange(max_players) < round_players[:, None]]
+    sc_course = np.repeat(round_course, round_players)
+    sc_holes = np.repeat(round_holes, round_players)
+    sc_tournament = is_tournament[sc_session]
+    n_sc = len(sc_session)
+    scorecard_ids = ids.take(n_sc)
+
+    hs_sc = np.repeat(np.arange(n_sc), sc_holes)
+    hs_pos = _group_positions(sc_holes)
+    hs_course = sc_course[hs_sc]
+    hs_par = hole_matrix["par"][hs_course, hs_pos]
+    holes = simulate_holes(skill[sc_player][hs_sc], hs_par, rng)
+
+    hole_scores_df = pd.DataFrame({
+        "hole_score_id": ids.take(len(hs_sc)),
+        "scorecard_id": scorecard_ids[hs_sc],
+        "session_id": session_ids[sc_session][hs_sc],
+        "player_id": categories.lookup("player_id", sc_player[hs_sc]),
+        "course_id": categories.lookup("course_id", hs_course),
+        "hole_number": hole_matrix["hole_number"][hs_course, hs_pos],
+        "par": hs_par,
+        "yardage": hole_matrix["yardage"][hs_course, hs_pos],
+        "stroke_index": hole_matrix["stroke_index"][hs_course, hs_pos],
+        **holes,
+        "score_date": _dates(session_days[sc_session][hs_sc]),
+    })
+
+    totals = round_aggregates(hs_sc, hs_pos, hs_par, holes, n_sc)
+    total_strokes = totals["total_strokes"]
+    total_putts = totals["putts_total"]
+    gir_count = totals["gir_count"]
+    sc_handicap = handicap[sc_player]
+    total_par = np.where(sc_tournament, courses_df["par"].to_numpy()[sc_course], totals["played_par"])
+
+    scorecards_df = pd.DataFrame({
+        "scorecard_id": scorecard_ids,
+        "session_id": session_ids[sc_session],
+        "player_id": categories.lookup("player_id", sc_player),
+        "player_name": categories.lookup("player_name", sc_player),
+        "course_id": categories.lookup("course_id", sc_course),
+        "course_name": categories.lookup("course_name", sc_course),
+        "tee": categories.lookup("tee", sc_player),
+        "holes_played": sc_holes,
+        "total_strokes": total_strokes,
+        "front_nine": totals["front_nine"],
+        "back_nine": totals["back_nine"],
+        "total_par": total_par,
+        "score_vs_par": total_strokes - total_par,
+        "gross_score": total_strokes,
+        "net_score": total_strokes - np.trunc(
+            np.where(sc_tournament, sc_handicap, sc_handicap * sc_holes / 18)
+        ).astype(np.int64),
+        "handicap": sc_handicap,
+        "gir_count": gir_count,
+        "gir_percentage": np.round(gir_count / sc_holes * 100, 1),
+        "fir_percentage": np.where(sc_tournament, np.nan, totals["fir_percentage"]),
+        "putts_total": total_putts,
+        "putts_per_hole": np.round(total_putts / sc_holes, 2),
+        "is_complete": sc_holes == 18,
+        "is_tournament": pd.arrays.BooleanArray(sc_tournament, ~sc_tournament),
+        "round_date": _dates(session_days[sc_session]),
+        "round_datetime": started[sc_session],
+    })
+
+    # Game sessions
+    game_sessions = np.flatnonzero(session_type == "game")
+    game_idx = rng.integers(0, len(GAME_TYPES), len(game_sessions))
+    min_shots = GAME_TYPE_TABLE["min_shots"][game_idx]
+    max_shots = GAME_TYPE_TABLE["max_shots"][game_idx]
+    game_shots = rng.integers(min_shots, max_shots + 1)
+    game_sessions_df = pd.DataFrame({
+        "game_session_id": ids.take(len(game_sessions)),
+        "session_id": session_ids[game_sessions],
+        "game_type_id": categories.lookup("game_type_id", game_idx),
+        "game_name": categories.lookup("game_name", game_idx),
+        "num_players": num_players[game_sessions],
+        "num_shots": game_shots,
+        "total_strokes": game_shots,
+        "score": rng.integers(50, 101, len(game_sessions)) * num_players[game_sessions],
+        "duration_minutes": duration[game_sessions],
+        "game_date": _dates(session_days[game_sessions]),
+        "started_at": started[game_sessions],
+    })
+
+    # Practice shots, hit by the session's primary player
+    practice_sessions = np.flatnonzero(type_categories[type_idx] == "practice")
+    shot_counts = rng.integers(80, 151, len(practice_sessions))
+    shot_session = np.repeat(practice_sessions, shot_counts)
+    shot_pos = _group_positions(shot_counts)
+    shot_player = primary[shot_session]
+    club_idx = rng.choice(PRACTICE_CLUB_INDICES, len(shot_session))
+    batch = generate_shot_batch(
+        skill[shot_player],
+        players_df["consistency_rating"].to_numpy(dtype=float)[shot_player],
+        players_df["club_speed_base"].to_numpy(dtype=float)[shot_player],
+        club_idx,
+        rng=rng,
+        ball_flight=ball_flight,
+    )
+    shots_df = pd.DataFrame({
+        "shot_id": ids.take(len(shot_session)),
+        "session_id": session_ids[shot_session],
+        "player_id": categories.lookup("player_id", shot_player),
+        "bay_id": categories.lookup("bay_id", bay_idx[shot_session]),
+        "club_id": categories.lookup("club_id", club_idx),
+        "shot_number": shot_pos + 1,
+        "shot_timestamp": started[shot_session] + (shot_pos * 30).astype("timedelta64[s]"),
+        "shot_date": _dates(session_days[shot_session]),
+        **batch,
+    })
+
+    if verbose:
+        print(f"Generated: {len(sessions_df)} sessions, {len(scorecards_df)} scorecards, {len(hole_scores_df)} hole scores, {len(shots_df)} shots, {len(game_sessions_df)} game sessions")
+
+    return sessions_df, scorecards_df, hole_scores_df, shots_df, game_sessions_df
+
+
+def iter_sessions_columnar(
+    players_df: pd.DataFrame,
+    bays_df: pd.DataFrame,
+    courses_df: pd.DataFrame,
+    holes_df: pd.DataFrame,
+    start_date: datetime,
+    end_date: datetime,
+    target_sessions: int = 8000,
+    chunk_sessions: int = DEFAULT_CHUNK_SESSIONS,
+    rng: Optional[np.random.Generator] = None,
+    seed: Optional[int] = None,
+    ids: Optional[IdFactory] = None,
+    skew: Optional[SkewProfile] = None,
+    ball_flight: str = "empirical",
+) -> Iterator[Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]]:
+    """Yield generate_sessions_columnar results for consecutive chunks of at most chunk_sessions"""
+    rng = _generator(rng, seed)
+    ids = ids or IdFactory(rng=rng)
+    hole_index = build_course_hole_index(holes_df)
+    sampler = None
+    if skew is not None:
+        sampler = SessionSampler(skew, players_df, bays_df, courses_df, start_date, (end_date - start_date).days + 1)
+    categories = FactCategories(players_df, bays_df, courses_df)
+    print(f"Generating {target_sessions} sessions in chunks of {chunk_sessions}...")
+    for offset in range(0, target_sessions, chunk_sessions):
+        print(f"  Progress: {offset}/{target_sessions} sessions")
+        yield generate_sessions_columnar(
+            players_df, bays_df, courses_df, holes_df, start_date, end_date,
+            target_sessions=min(chunk_sessions, target_sessions - offset), rng=rng,
+            hole_index=hole_index, ids=ids, verbose=False, sampler=sampler, ball_flight=ball_flight,
+            categories=categories,
+        )
+
+
+def _fact_path(output_dir: Path, name: str, part: Optional[int] = None) -> Path:
+    if part is None:
+        return output_dir / f"{name}.parquet"
+    return output_dir / name / f"part-{part:04d}.parquet"
+
+
+def generate_sessions_streaming(
+    players_df: pd.DataFrame,
+    bays_df: pd.DataFrame,
+    courses_df: pd.DataFrame,
+    holes_df: pd.DataFrame,
+    start_date: datetime,
+    end_date: datetime,
+    output_dir: Path,
+    target_sessions: int = 8000,
+    chunk_sessions: int = DEFAULT_CHUNK_SESSIONS,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    compression: str = "snappy",
+    rng: Optional[np.random.Generator] = None,
+    seed: Optional[int] = None,
+    part: Optional[int] = None,
+    ids: Optional[IdFactory] = None,
+    skew: Optional[SkewProfile] = None,
+    ball_flight: str = "empirical",
+) -> Dict[str, int]:
+    """Generate session facts chunk by chunk straight into Parquet files under output_dir.
+
+    Only one chunk plus one pending row group per table is held in memory.
+    With part set, each table is written as <table>/part-NNNN.parquet.
+    Returns the number of rows written per fact table.
+    """
+    with ExitStack() as stack:
+        writers = {
+            name: stack.enter_context(
+                ParquetStreamWriter(_fact_path(output_dir, name, part), row_group_size, compression)
+            )
+            for name in SESSION_FACT_TABLES
+        }
+        for frames in iter_sessions_columnar(
+            players_df, bays_df, courses_df, holes_df, start_date, end_date,
+            target_sessions=target_sessions, chunk_sessions=chunk_sessions, rng=rng, seed=seed, ids=ids, skew=skew,
+            ball_flight=ball_flight,
+        ):
+            for name, df in zip(SESSION_FACT_TABLES, frames):
+                writers[name].write(df)
+    counts = {name: w.rows_written for name, w in writers.items()}
+    print(f"Generated: {counts['fact_sessions']} sessions, {counts['fact_scorecards']} scorecards, {counts['fact_hole_scores']} hole scores, {counts['fact_shots']} shots, {counts['fact_game_sessions']} game sessions")
+    return counts
+
+
+BOOKING_HOURS = np.arange(6, 24)
+BOOKING_DURATIONS = np.array([1, 1.5, 2, 2.5, 3])
+BOOKING_GRID_CELLS = 2_000_000
+
+
 def generate_bay_bookings(
     bays_df: pd.DataFrame,
-    sessions_df: pd.DataFrame,
     start_date: datetime,
-    end_date: datetime
+    end_date: datetime,
+    rng: Optional[np.random.Generator] = None,
+    seed: Optional[int] = None,
+    ids: Optional[IdFactory] = None,
 ) -> pd.DataFrame:
-    """Generate bay occupancy/booking data for heatmap analysis"""
-    bookings = []
-    
-    for _, bay in bays_df.iterrows():
-        bay_sessions = sessions_df[sessions_df["bay_id"] == bay["bay_id"]]
-        
-        current = start_date
-        while current <= end_date:
-            for hour in range(6, 24):
-                is_occupied = random.random() < (0.15 + 0.25 * (1 if current.weekday() >= 5 else 0) + 0.1 * (1 if 16 <= hour <= 20 else 0))
-                
-                if is_occupied:
-                    bookings.append({
-                        "booking_id": str(uuid.uuid4()),
-                        "bay_id": bay["bay_id"],
-                        "facility_id": bay["facility_id"],
-                        "booking_date": current.date().isoformat(),
-                        "hour_of_day": hour,
-                        "day_of_week": current.strftime("%A"),
-                        "is_weekend": current.weekday() >= 5,
-                        "duration_hours": random.choice([1, 1.5, 2, 2.5, 3]),
-                        "num_players": random.randint(1, 4),
-                        "is_occupied": True,
-                    })
-            current += timedelta(days=1)
-    
-    return pd.DataFrame(bookings)
+    """Generate bay occupancy/booking data for heatmap analysis.
 
+    Builds the bay x date x hour grid as arrays (in blocks of bays to bound
+    memory), draws one Bernoulli per slot with the weekend and 16-20h peak
+    terms and keeps only the occupied slots. Bookings are drawn independently of
+    the generated sessions.
+    """
+    rng = _generator(rng, seed)
+    ids = ids or IdFactory(rng=rng)
+    n_days = (end_date - start_date).days + 1
+    days = _epoch_days(np.datetime64(start_date.date(), "D")) + np.arange(n_days, dtype=np.int32)
+    is_weekend = (days + 3) % 7 >= 5  # 1970-01-01 was a Thursday
+    is_peak = (BOOKING_HOURS >= 16) & (BOOKING_HOURS <= 20)
+    occupancy = 0.15 + 0.25 * is_weekend[:, None] + 0.1 * is_peak[None, :]
 
-def generate_subscription_events(players_df: pd.DataFrame, start_date: datetime, end_date: datetime) -> List[Dict]:
-    events = []
-    players_list = players_df.to_dict('records')
-    
-    for player in players_list:
-        created = datetime.fromisoformat(player["created_at"])
-        current_tier = player["membership_tier"]
-        
-        events.append({
-            "event_id": str(uuid.uuid4()),
-            "event_type": "subscription_started",
-            "player_id": player["player_id"],
-            "event_timestamp": created.isoformat(),
-            "event_date": created.date().isoformat(),
-            "subscription_tier": current_tier,
-            "amount_usd": next(t[2] for t in SUBSCRIPTION_TIERS if t[0] == current_tier),
-            "payment_method": random.choice(["credit_card", "paypal", "apple_pay"]),
-        })
-        
-        current = created
-        while current < end_date:
-            current += timedelta(days=30)
-            if current > end_date:
-                break
-                
-            if random.random() > 0.96:
-                events.append({
-                    "event_id": str(uuid.uuid4()),
-                    "event_type": "subscription_cancelled",
-                    "player_id": player["player_id"],
-                    "event_timestamp": current.isoformat(),
-                    "event_date": current.date().isoformat(),
-                    "subscription_tier": current_tier,
-                    "amount_usd": 0,
-                    "cancellation_reason": random.choice(["price", "not_using", "competitor", "other"]),
-                })
-                break
-            
-            events.append({
-                "event_id": str(uuid.uuid4()),
-                "event_type": "subscription_renewed",
-                "player_id": player["player_id"],
-                "event_timestamp": current.isoformat(),
-                "event_date": current.date().isoformat(),
-                "subscription_tier": current_tier,
-                "amount_usd": next(t[2] for t in SUBSCRIPTION_TIERS if t[0] == current_tier),
-            })
-    
+    bay_ids = bays_df["bay_id"].to_numpy(dtype=object)
+    facility_ids = bays_df["facility_id"].to_numpy(dtype=object)
+    block = max(1, BOOKING_GRID_CELLS // occupancy.size)
+    bay_idx, day_idx, hour_idx = [], [], []
+    for first in range(0, len(bays_df), block):
+        n_bays = min(block, len(bays_df) - first)
+        occupied = rng.random((n_bays, n_days, len(BOOKING_HOURS))) < occupancy
+        b, d, h = np.nonzero(occupied)
+        bay_idx.append(b + first)
+        day_idx.append(d)
+        hour_idx.append(h)
+    bay_idx = np.concatenate(bay_idx) if bay_idx else np.empty(0, dtype=np.int64)
+    day_idx = np.concatenate(day_idx) if day_idx else np.empty(0, dtype=np.int64)
+    hour_idx = np.concatenate(hour_idx) if hour_idx else np.empty(0, dtype=np.int64)
+    n = len(bay_idx)
+    booking_ids = ids.take(n)
+    duration_hours = rng.choice(BOOKING_DURATIONS, n)
+    num_players = rng.integers(1, 5, n)
+    hourly_rate = bays_df["hourly_rate"].to_numpy(dtype=float)
+
+    return pd.DataFrame({
+        "booking_id": booking_ids,
+        "bay_id": bay_ids[bay_idx],
+        "facility_id": facility_ids[bay_idx],
+        "booking_date": _dates(days[day_idx]),
+        "hour": BOOKING_HOURS[hour_idx],
+        "day_of_week": _day_of_week(days[day_idx]),
+        "is_weekend": is_weekend[day_idx],
+        "is_booked": np.ones(n, dtype=bool),
+        "is_occupied": np.ones(n, dtype=bool),
+        "session_type": SESSION_TYPE_TABLE["type_id"][SESSION_TYPE_SAMPLER.sample_indices(rng, n)],
+        "duration_hours": duration_hours,
+        "num_players": num_players,
+        "revenue": np.round(hourly_rate[bay_idx] * duration_hours, 2),
+    })
+
+
+TIER_PRICES = {tier_id: price for tier_id, _, price, _ in SUBSCRIPTION_TIERS}
+SUBSCRIPTION_MONTH = np.timedelta64(30, "D")
+SUBSCRIPTION_CANCEL_RATE = 0.04
+PAYMENT_METHODS = np.array(["credit_card", "paypal", "apple_pay"], dtype=object)
+CANCELLATION_REASONS = np.array(["price", "not_using", "competitor", "other"], dtype=object)
+
+MARKETING_CAMPAIGNS = [
+    ("winter_promo_2025", "Winter Training Promo", "email", 0.25, 0.08),
+    ("new_course_launch", "New Course Announcement", "email", 0.35, 0.12),
+    ("upgrade_offer", "Upgrade Your Experience", "email", 0.22, 0.05),
+    ("feature_release", "New AI Coaching Feature", "in_app", 0.45, 0.15),
+    ("tournament_invite", "Virtual Tournament", "push", 0.30, 0.10),
+]
+
+EVENT_PARTITION_COLS = ["event_type"]
+
+
+def _event_frame(parts: List[Dict[str, Any]], ids: IdFactory) -> pd.DataFrame:
+    """Concatenate per-event-type column dicts, order by event time and assign event ids"""
+    events = pd.concat([pd.DataFrame(part) for part in parts], ignore_index=True)
+    events = events.sort_values("event_timestamp", kind="stable", ignore_index=True)
+    events.insert(0, "event_id", ids.take(len(events)))
+    events["event_timestamp"] = events["event_timestamp"].astype("datetime64[us]")
+    events.insert(events.columns.get_loc("event_timestamp") + 1, "event_date", _dates(_epoch_days(events["event_timestamp"].to_numpy())))
     return events
 
 
-def generate_marketing_events(players_df: pd.DataFrame, start_date: datetime, end_date: datetime) -> List[Dict]:
-    events = []
-    players_list = players_df.to_dict('records')
-    
-    campaigns = [
-        ("winter_promo_2025", "Winter Training Promo", "email", 0.25, 0.08),
-        ("new_course_launch", "New Course Announcement", "email", 0.35, 0.12),
-        ("upgrade_offer", "Upgrade Your Experience", "email", 0.22, 0.05),
-        ("feature_release", "New AI Coaching Feature", "in_app", 0.45, 0.15),
-        ("tournament_invite", "Virtual Tournament", "push", 0.30, 0.10),
-    ]
-    
-    for campaign_id, campaign_name, channel, open_rate, click_rate in campaigns:
-        campaign_date = start_date + timedelta(days=random.randint(0, 60))
-        recipients = random.sample(players_list, int(len(players_list) * random.uniform(0.3, 0.8)))
-        
-        for player in recipients:
-            send_time = campaign_date + timedelta(hours=random.randint(8, 12))
-            
-            events.append({
-                "event_id": str(uuid.uuid4()),
-                "event_type": "campaign_sent",
-                "player_id": player["player_id"],
+def generate_subscription_events(
+    players_df: pd.DataFrame,
+    start_date: datetime,
+    end_date: datetime,
+    rng: Optional[np.random.Generator] = None,
+    seed: Optional[int] = None,
+    ids: Optional[IdFactory] = None,
+) -> pd.DataFrame:
+    """Generate subscription lifecycle events (started / renewed every 30 days / cancelled).
+
+    Each player renews monthly until end_date with a 4% chance of cancelling each
+    month, so the cancellation month is drawn once per player from a geometric
+    distribution instead of one Bernoulli per player-month.
+    """
+    rng = _generator(rng, seed)
+    ids = ids or IdFactory(rng=rng)
+    player_ids = players_df["player_id"].to_numpy()
+    tiers = players_df["membership_tier"].to_numpy(dtype=object)
+    prices = players_df["membership_tier"].map(TIER_PRICES).to_numpy(dtype=float)
+    created = players_df["created_at"].to_numpy().astype("datetime64[us]")
+    n = len(players_df)
+
+    months_available = np.maximum((np.datetime64(end_date, "us") - created) // SUBSCRIPTION_MONTH, 0)
+    cancel_month = rng.geometric(SUBSCRIPTION_CANCEL_RATE, n)
+    cancelled = cancel_month <= months_available
+    renewals = np.where(cancelled, cancel_month - 1, months_available)
+    renewal_player = np.repeat(np.arange(n), renewals)
+    renewal_month = _group_positions(renewals) + 1
+
+    return _event_frame([
+        {
+            "event_type": "subscription_started",
+            "player_id": player_ids,
+            "event_timestamp": created,
+            "subscription_tier": tiers,
+            "amount_usd": prices,
+            "payment_method": rng.choice(PAYMENT_METHODS, n),
+        },
+        {
+            "event_type": "subscription_renewed",
+            "player_id": player_ids[renewal_player],
+            "event_timestamp": created[renewal_player] + renewal_month * SUBSCRIPTION_MONTH,
+            "subscription_tier": tiers[renewal_player],
+            "amount_usd": prices[renewal_player],
+        },
+        {
+            "event_type": "subscription_cancelled",
+            "player_id": player_ids[cancelled],
+            "event_timestamp": created[cancelled] + cancel_month[cancelled] * SUBSCRIPTION_MONTH,
+            "subscription_tier": tiers[cancelled],
+            "amount_usd": np.zeros(cancelled.sum()),
+            "cancellation_reason": rng.choice(CANCELLATION_REASONS, cancelled.sum()),
+        },
+    ], ids)
+
+
+def generate_marketing_events(
+    players_df: pd.DataFrame,
+    start_date: datetime,
+    end_date: datetime,
+    rng: Optional[np.random.Generator] = None,
+    seed: Optional[int] = None,
+    ids: Optional[IdFactory] = None,
+) -> pd.DataFrame:
+    """Generate the sent -> opened -> clicked funnel for every campaign.
+
+    Recipients are sampled as an index array per campaign; each funnel stage is a
+    Bernoulli mask over the previous stage's recipients.
+    """
+    rng = _generator(rng, seed)
+    ids = ids or IdFactory(rng=rng)
+    player_ids = players_df["player_id"].to_numpy()
+    hour = np.timedelta64(1, "h")
+    parts = []
+
+    for campaign_id, campaign_name, channel, open_rate, click_rate in MARKETING_CAMPAIGNS:
+        campaign_date = np.datetime64(start_date, "us") + rng.integers(0, 61) * np.timedelta64(1, "D")
+        n = int(len(player_ids) * rng.uniform(0.3, 0.8))
+        recipients = rng.choice(len(player_ids), n, replace=False)
+        sent_at = campaign_date + rng.integers(8, 13, n) * hour
+        opened = rng.random(n) < open_rate
+        opened_at = sent_at[opened] + rng.integers(1, 49, opened.sum()) * hour
+        clicked = rng.random(opened.sum()) < click_rate / open_rate
+        clicked_at = opened_at[clicked] + rng.integers(1, 31, clicked.sum()) * np.timedelta64(1, "m")
+
+        for event_type, who, at in [
+            ("campaign_sent", recipients, sent_at),
+            ("campaign_opened", recipients[opened], opened_at),
+            ("campaign_clicked", recipients[opened][clicked], clicked_at),
+        ]:
+            parts.append({
+                "event_type": event_type,
+                "player_id": player_ids[who],
                 "campaign_id": campaign_id,
                 "campaign_name": campaign_name,
                 "channel": channel,
-                "event_timestamp": send_time.isoformat(),
-                "event_date": send_time.date().isoformat(),
+                "event_timestamp": at,
             })
-            
-            if random.random() < open_rate:
-                open_time = send_time + timedelta(hours=random.randint(1, 48))
-                events.append({
-                    "event_id": str(uuid.uuid4()),
-                    "event_type": "campaign_opened",
-                    "player_id": player["player_id"],
-                    "campaign_id": campaign_id,
-                    "campaign_name": campaign_name,
-                    "channel": channel,
-                    "event_timestamp": open_time.isoformat(),
-                    "event_date": open_time.date().isoformat(),
-                })
-                
-                if random.random() < (click_rate / open_rate):
-                    click_time = open_time + timedelta(minutes=random.randint(1, 30))
-                    events.append({
-                        "event_id": str(uuid.uuid4()),
-                        "event_type": "campaign_clicked",
-                        "player_id": player["player_id"],
-                        "campaign_id": campaign_id,
-                        "campaign_name": campaign_name,
-                        "channel": channel,
-                        "event_timestamp": click_time.isoformat(),
-                        "event_date": click_time.date().isoformat(),
-                    })
-    
-    return events
 
+    return _event_frame(parts, ids)
+
+
+def _shard_sizes(total: int, shards: int) -> List[int]:
+    base, extra = divmod(total, shards)
+    return [base + (1 if i < extra else 0) for i in range(shards)]
+
+
+def _write_bay_bookings_part(
+    bays_df: pd.DataFrame, start_date: datetime, end_date: datetime, rng: np.random.Generator,
+    ids: IdFactory, output_dir: Path, part: int, compression: str,
+) -> Dict[str, int]:
+    bookings_df = generate_bay_bookings(bays_df, start_date, end_date, rng=rng, ids=ids)
+    save_parquet(bookings_df, _fact_path(output_dir, "fact_bay_bookings", part), compression)
+    return {"fact_bay_bookings": len(bookings_df)}
+
+
+def generate_facts_sharded(
+    players_df: pd.DataFrame,
+    bays_df: pd.DataFrame,
+    courses_df: pd.DataFrame,
+    holes_df: pd.DataFrame,
+    start_date: datetime,
+    end_date: datetime,
+    output_dir: Path,
+    target_sessions: int = 8000,
+    shards: int = 4,
+    workers: int = 4,
+    seed: int = 42,
+    chunk_sessions: int = DEFAULT_CHUNK_SESSIONS,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    compression: str = "snappy",
+    id_strategy: str = "seeded",
+    skew: Optional[SkewProfile] = None,
+    ball_flight: str = "empirical",
+) -> Dict[str, int]:
+    """Generate session facts and bay bookings as independent shards on a process pool.
+
+    target_sessions and the booking date range are split into shards; shard i
+    writes <table>/part-000i.parquet. Every shard draws from its own Generator
+    spawned from SeedSequence(seed), so the files depend only on (seed, shards)
+    and not on the number of workers or scheduling order. Session shards use id
+    shards 1..N and booking shards N+1..2N (0 is left for dimensions).
+    """
+    session_seeds, booking_seeds = np.random.SeedSequence(seed).spawn(2)
+    total_days = (end_date - start_date).days + 1
+    counts = dict.fromkeys(SESSION_FACT_TABLES + ["fact_bay_bookings"], 0)
+
+    # spawn, not fork: forking after pyarrow has started its thread pools can abort the workers
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as pool:
+        futures = []
+        for shard, (seq, size) in enumerate(zip(session_seeds.spawn(shards), _shard_sizes(target_sessions, shards))):
+            futures.append(pool.submit(
+                generate_sessions_streaming,
+                players_df, bays_df, courses_df, holes_df, start_date, end_date, output_dir,
+                target_sessions=size, chunk_sessions=chunk_sessions, row_group_size=row_group_size,
+                compression=compression, rng=np.random.default_rng(seq), part=shard,
+                ids=IdFactory(id_strategy, seed, shard=1 + shard), skew=skew, ball_flight=ball_flight,
+            ))
+        first_day = 0
+        for shard, (seq, days) in enumerate(zip(booking_seeds.spawn(shards), _shard_sizes(total_days, shards))):
+            if days == 0:
+                continue
+            shard_start = start_date + timedelta(days=first_day)
+            first_day += days
+            futures.append(pool.submit(
+                _write_bay_bookings_part,
+                bays_df, shard_start, shard_start + timedelta(days=days - 1), np.random.default_rng(seq),
+                IdFactory(id_strategy, seed, shard=1 + shards + shard), output_dir, shard, compression,
+            ))
+        for future in futures:
+            for name, rows in future.result().items():
+                counts[name] += rows
+    return counts
+
+
+DIMENSION_TABLES = ["dim_players", "dim_courses", "dim_course_holes", "dim_facilities", "dim_bays"]
 
-def save_parquet(df: pd.DataFrame, path: Path):
+
+def load_dimensions(output_dir: Path) -> Dict[str, pd.DataFrame]:
+    """Read the dimension tables a previous run wrote under output_dir/dimensions"""
+    dims = {}
+    for name in DIMENSION_TABLES:
+        path = output_dir / "dimensions" / f"{name}.parquet"
+        if not path.exists():
+            raise FileNotFoundError(f"{path} not found - append mode needs the Parquet dimensions of an earlier full run")
+        dims[name] = pd.read_parquet(path)
+    return dims
+
+
+def last_generated_date(facts_dir: Path, table: str = "fact_sessions") -> Optional[datetime]:
+    """Latest date in a fact table, whether written as a snapshot file, part files or date partitions"""
+    date_col = FACT_DATE_COLUMNS[table]
+    prefix = f"{date_col}="
+    table_dir = facts_dir / table
+    candidates = []
+    files = [facts_dir / f"{table}.parquet"]
+    if table_dir.is_dir():
+        candidates += [datetime.strptime(p.name[len(prefix):], "%Y-%m-%d") for p in table_dir.glob(f"{prefix}*")]
+        files += list(table_dir.glob("*.parquet"))
+    for path in files:
+        if path.exists():
+            latest = pc.max(pq.read_table(path, columns=[date_col])[date_col]).as_py()
+            if latest is not None:
+                candidates.append(pd.Timestamp(str(latest)).to_pydatetime())
+    return max(candidates) if candidates else None
+
+
+def partition_keys(
+    df: pd.DataFrame, partition_by: str, bays_df: pd.DataFrame, facilities_df: pd.DataFrame
+) -> Optional[np.ndarray]:
+    """Secondary partition value per row (facility_id or region), or None for date-only partitioning.
+
+    Rows are tied to a facility through their own facility_id or through bay_id;
+    tables with neither (scorecards, hole scores, game sessions) stay date-only.
+    """
+    if partition_by == "date":
+        return None
+    if "facility_id" in df.columns:
+        facility = df["facility_id"]
+    elif "bay_id" in df.columns:
+        facility = df["bay_id"].map(pd.Series(bays_df["facility_id"].to_numpy(), index=bays_df["bay_id"]))
+    else:
+        return None
+    if partition_by == "date-region":
+        facility = facility.map(pd.Series(facilities_df["region"].to_numpy(), index=facilities_df["facility_id"]))
+    return facility.astype(str).to_numpy(dtype=object)
+
+
+def write_partitioned(
+    df: pd.DataFrame,
+    table_dir: Path,
+    date_col: str,
+    sort_by: List[str],
+    keys: Optional[np.ndarray] = None,
+    key_name: Optional[str] = None,
+    compression: str = "snappy",
+    part: int = 0,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+) -> List[Path]:
+    """Write df as hive-style <date_col>=YYYY-MM-DD[/<key_name>=<key>]/part-NNNN.parquet files.
+
+    Each file is sorted by sort_by, so row-group min/max statistics stay narrow,
+    and records that order in its Parquet sorting_columns metadata. The date
+    column stays in the files as well, so readers that ignore the directory
+    names (e.g. a Snowflake stage) still see it.
+    """
+    if df.empty:
+        return []
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.append_column("__day", table[date_col].cast(pa.int32()))
+    partition_cols = ["__day"]
+    if keys is not None:
+        table = table.append_column("__key", pa.array(keys, type=pa.string()))
+        partition_cols.append("__key")
+    helper_cols = list(partition_cols)
+    sort_keys = []
+    for col in sort_by:
+        if pa.types.is_dictionary(table[col].type):
+            # Arrow cannot sort dictionary columns; FactCategories keeps categories in
+            # value order, so sorting on the codes gives the same order
+            table = table.append_column(f"__{col}", table[col].combine_chunks().indices)
+            helper_cols.append(f"__{col}")
+            sort_keys.append(f"__{col}")
+        else:
+            sort_keys.append(col)
+    table = table.sort_by([(col, "ascending") for col in partition_cols + sort_keys])
+    sorting = pq.SortingColumn.from_ordering(
+        table.drop_columns(helper_cols).schema, [(col, "ascending") for col in sort_by]
+    )
+
+    days = table["__day"].to_numpy()
+    changed = days[1:] != days[:-1]
+    if keys is not None:
+        key_values = table["__key"].to_numpy(zero_copy_only=False)
+        changed |= key_values[1:] != key_values[:-1]
+    bounds = np.concatenate([[0], np.flatnonzero(changed) + 1, [table.num_rows]])
+
+    paths = []
+    for first, last in zip(bounds[:-1], bounds[1:]):
+        path = table_dir / f"{date_col}={np.datetime64(int(days[first]), 'D')}"
+        if keys is not None:
+            path = path / f"{key_name}={quote(str(key_values[first]), safe='')}"
+        path = path / f"part-{part:04d}.parquet"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(
+            _compact_dictionaries(table.slice(first, last - first).drop_columns(helper_cols)), path,
+            row_group_size=row_group_size, compression=None if compression == "none" else compression,
+            sorting_columns=sorting,
+        )
+        paths.append(path)
+    return paths
+
+
+def save_fact_tables(
+    frames: Dict[str, pd.DataFrame],
+    facts_dir: Path,
+    partition_by: str = "date",
+    bays_df: Optional[pd.DataFrame] = None,
+    facilities_df: Optional[pd.DataFrame] = None,
+    fmt: str = "parquet",
+    compression: str = "snappy",
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+) -> Dict[str, int]:
+    """Write in-memory fact tables under facts_dir in the chosen layout; returns rows per table.
+
+    partition_by "none" writes <table>/part-0000.parquet (or <table>.csv), otherwise
+    date partitions, optionally split again by facility or region.
+    """
+    for name, df in frames.items():
+        if fmt != "parquet":
+            save_table(df, facts_dir / f"{name}.parquet", fmt, compression)
+        elif partition_by == "none":
+            save_parquet(df, _fact_path(facts_dir, name, 0), compression)
+        else:
+            keys = partition_keys(df, partition_by, bays_df, facilities_df)
+            paths = write_partitioned(
+                df, facts_dir / name, FACT_DATE_COLUMNS[name], FACT_SORT_COLUMNS[name],
+                keys=keys, key_name=PARTITION_KEY_NAMES[partition_by], compression=compression,
+                row_group_size=row_group_size,
+            )
+            print(f"  Saved {len(df):,} rows to {name}/ in {len(paths)} partition file(s)")
+    return {name: len(df) for name, df in frames.items()}
+
+
+def reset_fact_outputs(facts_dir: Path):
+    """Remove every earlier layout of the fact tables before a full (non-append) run"""
+    for name in FACT_DATE_COLUMNS:
+        shutil.rmtree(facts_dir / name, ignore_errors=True)
+        for suffix in (".parquet", ".csv"):
+            (facts_dir / f"{name}{suffix}").unlink(missing_ok=True)
+
+
+def generate_facts_append(
+    dims: Dict[str, pd.DataFrame],
+    start_date: datetime,
+    end_date: datetime,
+    output_dir: Path,
+    target_sessions: int,
+    seed: int = 42,
+    id_strategy: str = "seeded",
+    compression: str = "snappy",
+    partition_by: str = "date",
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    skew: Optional[SkewProfile] = None,
+    ball_flight: str = "empirical",
+) -> Dict[str, int]:
+    """Generate facts for [start_date, end_date] only and write them as daily partitions under output_dir.
+
+    Random streams and id shards are keyed on the window's first day, so every
+    delta is reproducible and its ids never collide with earlier runs.
+    """
+    window = int(_epoch_days(np.datetime64(start_date.date(), "D")))
+    if 2 * window + 2 >= STREAM_SHARD_BASE:
+        raise ValueError(
+            f"An append window starting {start_date.date()} needs id shard {2 * window + 1}, "
+            f"inside shot_stream's range (from {STREAM_SHARD_BASE})"
+        )
+    rng = np.random.default_rng([seed, window])
+    frames = dict(zip(SESSION_FACT_TABLES, generate_sessions_columnar(
+        dims["dim_players"], dims["dim_bays"], dims["dim_courses"], dims["dim_course_holes"], start_date, end_date,
+        target_sessions=target_sessions, rng=rng, ids=IdFactory(id_strategy, seed, shard=2 * window + 1), skew=skew,
+        ball_flight=ball_flight,
+    )))
+    frames["fact_bay_bookings"] = generate_bay_bookings(
+        dims["dim_bays"], start_date, end_date, rng=rng, ids=IdFactory(id_strategy, seed, shard=2 * window + 2),
+    )
+    return save_fact_tables(
+        frames, output_dir, partition_by, dims["dim_bays"], dims["dim_facilities"],
+        compression=compression, row_group_size=row_group_size,
+    )
+
+
+def _compact_dictionaries(table: pa.Table) -> pa.Table:
+    """Drop the dictionary entries a table does not use, keeping their order and index width.
+
+    Parquet stores a dictionary column's whole dictionary in every column chunk, and
+    FactCategories dictionaries span the full dimension (every player, every bay).
+    """
+    for i, field in enumerate(table.schema):
+        if not pa.types.is_dictionary(field.type):
+            continue
+        column = table.column(i).combine_chunks()
+        used = np.unique(column.indices.drop_null().to_numpy())
+        if len(used) == len(column.dictionary):
+            continue
+        remap = np.zeros(len(column.dictionary), dtype=field.type.index_type.to_pandas_dtype())
+        remap[used] = np.arange(len(used))
+        table = table.set_column(i, field, pa.DictionaryArray.from_arrays(
+            pc.take(pa.array(remap), column.indices), column.dictionary.take(pa.array(used)),
+        ))
+    return table
+
+
+def save_parquet(df: pd.DataFrame, path: Path, compression: str = "snappy"):
     path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_parquet(path, index=False)
+    table = _compact_dictionaries(pa.Table.from_pandas(df, preserve_index=False))
+    pq.write_table(table, path, compression=None if compression == "none" else compression)
     print(f"  Saved {len(df):,} rows to {path.name}")
 
 
-def save_json_lines(data: List[Dict], path: Path):
+class ParquetStreamWriter:
+    """Append DataFrame chunks to a single Parquet file in fixed-size row groups.
+
+    The schema is taken from the first non-empty chunk; later chunks are cast to it.
+    Rows are buffered only until a full row group is available.
+    """
+
+    def __init__(self, path: Path, row_group_size: int = DEFAULT_ROW_GROUP_SIZE, compression: str = "snappy"):
+        self.path = path
+        self.row_group_size = row_group_size
+        self.compression = None if compression == "none" else compression
+        self.rows_written = 0
+        self._writer: Optional[pq.ParquetWriter] = None
+        self._schema: Optional[pa.Schema] = None
+        self._pending: List[pa.Table] = []
+        self._pending_rows = 0
+        self._empty: Optional[pd.DataFrame] = None
+
+    def __enter__(self) -> "ParquetStreamWriter":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def write(self, df: pd.DataFrame):
+        if df.empty:
+            if self._empty is None:
+                self._empty = df
+            return
+        table = pa.Table.from_pandas(df, schema=self._schema, preserve_index=False)
+        if self._writer is None:
+            self._schema = table.schema
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._writer = pq.ParquetWriter(self.path, self._schema, compression=self.compression)
+        self._pending.append(table)
+        self._pending_rows += table.num_rows
+        while self._pending_rows >= self.row_group_size:
+            self._flush(self.row_group_size)
+
+    def _flush(self, num_rows: int):
+        table = pa.concat_tables(self._pending)
+        self._writer.write_table(_compact_dictionaries(table.slice(0, num_rows)), row_group_size=num_rows)
+        rest = table.slice(num_rows)
+        self._pending = [rest] if rest.num_rows else []
+        self._pending_rows = rest.num_rows
+        self.rows_written += num_rows
+
+    def close(self):
+        if self._writer is None:
+            if self._empty is not None:
+                save_parquet(self._empty, self.path, self.compression or "none")
+            return
+        if self._pending_rows:
+            self._flush(self._pending_rows)
+        self._writer.close()
+        self._writer = None
+        print(f"  Saved {self.rows_written:,} rows to {self.path.name}")
+
+
+def save_table(df: pd.DataFrame, path: Path, fmt: str = "parquet", compression: str = "snappy"):
+    """Save one table in the --format chosen on the command line; path carries the .parquet suffix"""
+    if fmt == "parquet":
+        save_parquet(df, path, compression)
+        return
+    path = path.with_suffix(".csv")
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, 'w') as f:
-        for record in data:
-            f.write(json.dumps(record) + '\n')
-    print(f"  Saved {len(data):,} records to {path.name}")
+    _text_ready(df).to_csv(path, index=False)
+    print(f"  Saved {len(df):,} rows to {path.name}")
+
+
+def save_parquet_dataset(df: pd.DataFrame, path: Path, partition_cols: List[str], compression: str = "snappy"):
+    """Write df as a hive-partitioned Parquet dataset (<col>=<value>/part-0.parquet), replacing earlier output"""
+    path.mkdir(parents=True, exist_ok=True)
+    pq.write_to_dataset(
+        pa.Table.from_pandas(df, preserve_index=False), path, partition_cols=partition_cols,
+        basename_template="part-{i}.parquet", existing_data_behavior="delete_matching",
+        compression=None if compression == "none" else compression,
+    )
+    print(f"  Saved {len(df):,} rows to {path.name}/ partitioned by {', '.join(partition_cols)}")
+
+
+NDJSON_COMPRESSIONS = {"gzip": ".gz", "bz2": ".bz2", "xz": ".xz", "none": ""}
+DEFAULT_NDJSON_CHUNK_ROWS = 100_000
+
+
+def _text_ready(df: pd.DataFrame) -> pd.DataFrame:
+    """Binary ids -> hex strings and date32 columns -> YYYY-MM-DD so text formats keep them readable"""
+    df = df.copy()
+    for col in df.columns:
+        values = df[col]
+        if isinstance(values.dtype, pd.ArrowDtype) and pa.types.is_date(values.dtype.pyarrow_dtype):
+            df[col] = values.astype(str)
+        elif values.dtype == object and len(values) and isinstance(values.iloc[0], bytes):
+            df[col] = [v.hex() for v in values]
+    return df
 
 
-def main():
+def save_ndjson_chunks(
+    df: pd.DataFrame, path: Path, chunk_rows: int = DEFAULT_NDJSON_CHUNK_ROWS, compression: str = "gzip"
+) -> List[Path]:
+    """Write df as newline-delimited JSON split into part-NNNN.ndjson[.gz] files of at most chunk_rows"""
+    path.mkdir(parents=True, exist_ok=True)
+    for old in path.glob("part-*.ndjson*"):
+        old.unlink()
+    parts = []
+    for i, first in enumerate(range(0, max(len(df), 1), chunk_rows)):
+        part = path / f"part-{i:04d}.ndjson{NDJSON_COMPRESSIONS[compression]}"
+        _text_ready(df.iloc[first:first + chunk_rows]).to_json(
+            part, orient="records", lines=True, date_format="iso", date_unit="us",
+            compression=None if compression == "none" else compression,
+        )
+        parts.append(part)
+    print(f"  Saved {len(df):,} records to {path.name}/ in {len(parts)} NDJSON chunk(s)")
+    return parts
+
+
+def save_events(df: pd.DataFrame, path: Path, args: argparse.Namespace):
+    if args.event_format in ("parquet", "both"):
+        save_parquet_dataset(df, path, EVENT_PARTITION_COLS, args.compression)
+    if args.event_format in ("ndjson", "both"):
+        save_ndjson_chunks(df, path.with_name(f"{path.name}_ndjson"), args.ndjson_chunk_rows, args.ndjson_compression)
+
+
+OUTPUT_FORMATS = ["parquet", "csv"]
+SCALE_FACTOR_BASE = {"players": 500, "facilities": 50, "sessions": 10_000}
+DEFAULT_DAYS = 90
+
+
+def _scale_factor(value: str) -> float:
+    """argparse type for --scale-factor: SF1/SF10/SF100 presets or any positive number"""
+    try:
+        factor = float(value[2:] if value.upper().startswith("SF") else value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid scale factor {value!r}, expected e.g. SF1, SF10, SF100 or 0.5")
+    if factor <= 0:
+        raise argparse.ArgumentTypeError(f"scale factor must be positive, got {value!r}")
+    return factor
+
+
+def _date(value: str) -> datetime:
+    try:
+        return datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date {value!r}, expected YYYY-MM-DD")
+
+
+def resolve_date_range(args: argparse.Namespace) -> Tuple[datetime, datetime]:
+    """Generation window from --start-date/--end-date/--days; --end-date is inclusive, default end is now"""
+    days = timedelta(days=args.days or DEFAULT_DAYS)
+    end_date = args.end_date + timedelta(days=1, microseconds=-1) if args.end_date else None
+    if args.start_date and end_date:
+        return args.start_date, end_date
+    if args.start_date:
+        return args.start_date, args.start_date + days - timedelta(microseconds=1)
+    end_date = end_date or datetime.now()
+    return end_date - days, end_date
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Trackman Golf Simulator - synthetic data generator")
+    parser.add_argument(
+        "--scale-factor", type=_scale_factor, default=1.0, metavar="SF",
+        help="Scale players, facilities and sessions proportionally: SF1 = 500 players, 50 facilities, 10k sessions; SF10, SF100, ...",
+    )
+    parser.add_argument("--players", type=int, default=None, help="Number of players (overrides the scale factor)")
+    parser.add_argument("--facilities", type=int, default=None, help="Number of facilities (overrides the scale factor)")
+    parser.add_argument("--sessions", type=int, default=None, help="Number of sessions (overrides the scale factor)")
+    parser.add_argument("--days", type=int, default=None, help=f"Length of the generated window in days (default {DEFAULT_DAYS})")
+    parser.add_argument("--start-date", type=_date, default=None, help="First day of the window, YYYY-MM-DD")
+    parser.add_argument("--end-date", type=_date, default=None, help="Last day of the window (inclusive), YYYY-MM-DD (default: now)")
+    parser.add_argument("--output-dir", type=Path, default=None, help="Root directory for dimensions/, facts/ and events/ (default: sample_data/)")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="parquet", help="File format for dimension and fact tables (csv needs --output-dir; the dbt models read Parquet)")
+    parser.add_argument(
+        "--partition-by", choices=PARTITION_SCHEMES, default=None,
+        help="Fact layout: facts/<table>/<date column>=YYYY-MM-DD[/facility_id=|region=]/part-NNNN.parquet, "
+             "or none for facts/<table>/part-NNNN.parquet (default: date; none with --stream/--workers/--format csv)",
+    )
+    parser.add_argument(
+        "--skew", choices=["none"] + list(SKEW_PRESETS), default="none",
+        help="Zipf popularity of facilities/bays/players/courses plus hour-of-day and seasonal burst profiles "
+             "(columnar, --stream and --workers engines)",
+    )
+    parser.add_argument(
+        "--ball-flight", choices=BALL_FLIGHT_MODES, default="empirical",
+        help="Shot outcomes: empirical club-distance model, physics (integrate drag/lift/spin trajectories) "
+             "or lut (interpolate the physics model from a precomputed table; fastest physical option)",
+    )
+    parser.add_argument(
+        "--append", action="store_true",
+        help="Load dim_*.parquet from --output-dir and add only the days after the last generated session_date, "
+             "written as facts/<table>/<date column>=YYYY-MM-DD/ partitions (default window: 1 day)",
+    )
+    parser.add_argument(
+        "--engine", choices=["legacy", "columnar"], default="legacy",
+        help="Session generator: per-row dicts (legacy) or typed arrays built in bulk (columnar)",
+    )
+    parser.add_argument(
+        "--stream", action="store_true",
+        help="Write session facts chunk by chunk through an incremental Parquet writer (implies --engine columnar)",
+    )
+    parser.add_argument("--chunk-sessions", type=int, default=DEFAULT_CHUNK_SESSIONS, help="Sessions generated per chunk in --stream mode")
+    parser.add_argument("--row-group-size", type=int, default=DEFAULT_ROW_GROUP_SIZE, help="Rows per Parquet row group in --stream mode")
+    parser.add_argument("--compression", choices=PARQUET_COMPRESSIONS, default="snappy", help="Parquet compression codec")
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="Generate sessions and bay bookings in shards on this many processes, written as <table>/part-NNNN.parquet",
+    )
+    parser.add_argument("--shards", type=int, default=None, help="Number of shards in --workers mode (default: one per worker)")
+    parser.add_argument("--seed", type=int, default=42, help="Root random seed")
+    parser.add_argument(
+        "--id-strategy", choices=ID_STRATEGIES, default="seeded",
+        help="Primary key format: seeded/uuid4/deterministic UUID strings, 16-byte binary or int64 surrogate keys",
+    )
+    parser.add_argument(
+        "--event-format", choices=["parquet", "ndjson", "both"], default="parquet",
+        help="Event stream output: Parquet partitioned by event_type, chunked NDJSON, or both",
+    )
+    parser.add_argument("--ndjson-compression", choices=list(NDJSON_COMPRESSIONS), default="gzip", help="NDJSON chunk compression")
+    parser.add_argument("--ndjson-chunk-rows", type=int, default=DEFAULT_NDJSON_CHUNK_ROWS, help="Records per NDJSON chunk file")
+    parser.add_argument(
+        "--skip-validation", action="store_true",
+        help="Do not check the written tables against validate.SCHEMAS (schema, ranges, keys) at the end of the run",
+    )
+    args = parser.parse_args(argv)
+    if args.start_date and args.end_date and args.days:
+        parser.error("--days cannot be combined with both --start-date and --end-date")
+    if args.start_date and args.end_date and args.start_date > args.end_date:
+        parser.error("--start-date must not be after --end-date")
+    if args.format != "parquet" and (args.stream or args.workers > 1 or args.shards or args.append):
+        parser.error("--stream, --workers, --shards and --append write Parquet only")
+    if args.format != "parquet" and args.output_dir is None:
+        parser.error("the dbt models read sample_data/ as Parquet; write --format csv to another --output-dir")
+    if args.append and (args.stream or args.workers > 1 or args.shards):
+        parser.error("--append cannot be combined with --stream, --workers or --shards")
+    whole_table_layout = args.stream or args.workers > 1 or args.shards or args.format != "parquet"
+    if args.partition_by is None:
+        args.partition_by = "none" if whole_table_layout else "date"
+    elif args.partition_by != "none" and whole_table_layout:
+        parser.error("--partition-by needs the whole fact table in memory; use none with --stream, --workers, --shards or --format csv")
+    if args.skew != "none" and args.engine == "legacy" and not (args.stream or args.workers > 1 or args.shards or args.append):
+        parser.error("--skew needs the columnar engine (--engine columnar, --stream, --workers or --append)")
+    if args.append and args.partition_by == "none":
+        parser.error("--append writes date partitions; --partition-by none is not supported")
+    for name, base in SCALE_FACTOR_BASE.items():
+        if args.append and name == "sessions":
+            continue  # scaled to the append window in main()
+        if getattr(args, name) is None:
+            setattr(args, name, max(1, round(base * args.scale_factor)))
+    return args
+
+
+def validate_run(output_dir: Path):
+    """Check everything written under output_dir against validate.SCHEMAS; exits non-zero on any issue"""
+    from validate import validate_output
+
+    report = validate_output(output_dir)
+    report.print_summary()
+    if not report.ok:
+        raise SystemExit(f"Validation failed - {output_dir} is not ready for S3 upload")
+
+
+def append_main(args: argparse.Namespace, output_dir: Path):
+    """--append: extend an existing dataset by the days after its last session_date"""
+    last = last_generated_date(output_dir / "facts")
+    if last is None:
+        raise SystemExit(f"No fact_sessions found under {output_dir / 'facts'} - run a full generation first")
+    if args.start_date is None:
+        args.start_date = last + timedelta(days=1)
+    if args.end_date is None and args.days is None:
+        args.days = 1
+    start_date, end_date = resolve_date_range(args)
+    if start_date > end_date:
+        print(f"\nNothing to append: data already runs to {last.date()}")
+        return
+    if args.sessions is None:
+        days = (end_date - start_date).days + 1
+        args.sessions = max(1, round(SCALE_FACTOR_BASE["sessions"] * args.scale_factor * days / DEFAULT_DAYS))
+
+    print(f"\nAppend mode: last generated session_date {last.date()}")
+    print(f"Date range: {start_date.date()} to {end_date.date()}")
+    print(f"Output directory: {output_dir}")
+
+    print("\n[1/2] Loading dimensions...")
+    dims = load_dimensions(output_dir)
+    for name, df in dims.items():
+        print(f"  Loaded {len(df):,} rows from {name}.parquet")
+
+    print(f"\n[2/2] Generating {args.sessions:,} sessions and bay bookings...")
+    fact_counts = generate_facts_append(
+        dims, start_date, end_date, output_dir / "facts", target_sessions=args.sessions,
+        seed=args.seed, id_strategy=args.id_strategy, compression=args.compression,
+        partition_by=args.partition_by, row_group_size=args.row_group_size, skew=skew_preset(args.skew, args.seed),
+        ball_flight=args.ball_flight,
+    )
+
+    print("\n" + "=" * 70)
+    print("APPEND SUMMARY")
+    print("=" * 70)
+    for name, rows in fact_counts.items():
+        print(f"  {name + ':':<25} {rows:>10,}")
+    print("=" * 70)
+
+    if not args.skip_validation:
+        print("\nValidating output...")
+        validate_run(output_dir)
+
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    np.random.seed(args.seed)
+    random.seed(args.seed)
+
     print("=" * 70)
     print("Trackman Golf Simulator - Enhanced Data Generator")
     print("Supports: Scorecards, Bay Occupation, Course Play, Games, Practice")
     print("=" * 70)
     
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=90)
+    output_dir = args.output_dir or OUTPUT_DIR
+    if args.append:
+        return append_main(args, output_dir)
+
+    start_date, end_date = resolve_date_range(args)
     
     print(f"\nDate range: {start_date.date()} to {end_date.date()}")
-    print(f"Output directory: {OUTPUT_DIR}")
+    print(f"Scale: SF{args.scale_factor:g} -> {args.players:,} players, {args.facilities:,} facilities, {args.sessions:,} sessions")
+    print(f"Output directory: {output_dir}")
+    
+    dim_ids = IdFactory(args.id_strategy, args.seed, shard=0)
+    dim_rng = np.random.default_rng(args.seed)  # one Generator for every dimension table, drawn in order
+    skew = skew_preset(args.skew, args.seed)
     
     print("\n[1/9] Generating players...")
-    players_df = generate_players(500)
-    save_parquet(players_df, OUTPUT_DIR / "dimensions" / "dim_players.parquet")
+    players_df = generate_players(args.players, ids=dim_ids, as_of=end_date, rng=dim_rng)
+    save_table(players_df, output_dir / "dimensions" / "dim_players.parquet", args.format, args.compression)
     
     print("\n[2/9] Generating courses and holes...")
     courses_df, holes_df = generate_courses_and_holes()
-    save_parquet(courses_df, OUTPUT_DIR / "dimensions" / "dim_courses.parquet")
-    save_parquet(holes_df, OUTPUT_DIR / "dimensions" / "dim_course_holes.parquet")
+    save_table(courses_df, output_dir / "dimensions" / "dim_courses.parquet", args.format, args.compression)
+    save_table(holes_df, output_dir / "dimensions" / "dim_course_holes.parquet", args.format, args.compression)
     
     print("\n[3/9] Generating clubs...")
     clubs_df = generate_clubs()
-    save_parquet(clubs_df, OUTPUT_DIR / "dimensions" / "dim_clubs.parquet")
+    save_table(clubs_df, output_dir / "dimensions" / "dim_clubs.parquet", args.format, args.compression)
     
     print("\n[4/9] Generating facilities and bays...")
-    facilities_df = generate_facilities(50)
-    bays_df = generate_bays(facilities_df)
-    save_parquet(facilities_df, OUTPUT_DIR / "dimensions" / "dim_facilities.parquet")
-    save_parquet(bays_df, OUTPUT_DIR / "dimensions" / "dim_bays.parquet")
+    facilities_df = generate_facilities(args.facilities, ids=dim_ids, as_of=end_date, rng=dim_rng)
+    bays_df = generate_bays(facilities_df, ids=dim_ids, as_of=end_date, rng=dim_rng)
+    save_table(facilities_df, output_dir / "dimensions" / "dim_facilities.parquet", args.format, args.compression)
+    save_table(bays_df, output_dir / "dimensions" / "dim_bays.parquet", args.format, args.compression)
     
     print("\n[5/9] Generating game types...")
     game_types_df = pd.DataFrame(GAME_TYPES)
-    save_parquet(game_types_df, OUTPUT_DIR / "dimensions" / "dim_game_types.parquet")
-    
-    print("\n[6/9] Generating sessions, scorecards, and shots...")
-    sessions_df, scorecards_df, hole_scores_df, shots_df, game_sessions_df = generate_sessions_comprehensive(
-        players_df, bays_df, courses_df, holes_df, start_date, end_date, target_sessions=10000
-    )
-    save_parquet(sessions_df, OUTPUT_DIR / "facts" / "fact_sessions.parquet")
-    save_parquet(scorecards_df, OUTPUT_DIR / "facts" / "fact_scorecards.parquet")
-    save_parquet(hole_scores_df, OUTPUT_DIR / "facts" / "fact_hole_scores.parquet")
-    save_parquet(shots_df, OUTPUT_DIR / "facts" / "fact_shots.parquet")
-    save_parquet(game_sessions_df, OUTPUT_DIR / "facts" / "fact_game_sessions.parquet")
+    save_table(game_types_df, output_dir / "dimensions" / "dim_game_types.parquet", args.format, args.compression)
     
-    print("\n[7/9] Generating bay bookings...")
-    bay_bookings_df = generate_bay_bookings(bays_df, sessions_df, start_date, end_date)
-    save_parquet(bay_bookings_df, OUTPUT_DIR / "facts" / "fact_bay_bookings.parquet")
+    reset_fact_outputs(output_dir / "facts")
+    if args.workers > 1 or args.shards:
+        shards = args.shards or args.workers
+        print(f"\n[6/9] Generating sessions, scorecards, shots and bay bookings in {shards} shards on {args.workers} workers...")
+        fact_counts = generate_facts_sharded(
+            players_df, bays_df, courses_df, holes_df, start_date, end_date, output_dir / "facts",
+            target_sessions=args.sessions, shards=shards, workers=args.workers, seed=args.seed,
+            chunk_sessions=args.chunk_sessions, row_group_size=args.row_group_size, compression=args.compression,
+            id_strategy=args.id_strategy, skew=skew, ball_flight=args.ball_flight,
+        )
+        print("\n[7/9] Bay bookings generated with the session shards")
+    else:
+        print("\n[6/9] Generating sessions, scorecards, and shots...")
+        if args.stream:
+            fact_counts = generate_sessions_streaming(
+                players_df, bays_df, courses_df, holes_df, start_date, end_date, output_dir / "facts",
+                target_sessions=args.sessions, chunk_sessions=args.chunk_sessions,
+                row_group_size=args.row_group_size, compression=args.compression, part=0,
+                ids=IdFactory(args.id_strategy, args.seed, shard=1), skew=skew, ball_flight=args.ball_flight,
+            )
+        else:
+            if args.engine == "columnar":
+                session_frames = generate_sessions_columnar(
+                    players_df, bays_df, courses_df, holes_df, start_date, end_date, target_sessions=args.sessions,
+                    ids=IdFactory(args.id_strategy, args.seed, shard=1), skew=skew, ball_flight=args.ball_flight,
+                )
+            else:
+                session_frames = generate_sessions_comprehensive(
+                    players_df, bays_df, courses_df, holes_df, start_date, end_date, target_sessions=args.sessions,
+                    ids=IdFactory(args.id_strategy, args.seed, shard=1), ball_flight=args.ball_flight,
+                )
+            if skew is not None:
+                sessions_df = session_frames[0]
+                for entity, counts in [
+                    ("bays", sessions_df["bay_id"].value_counts().reindex(bays_df["bay_id"], fill_value=0)),
+                    ("facilities", sessions_df["facility_id"].value_counts().reindex(facilities_df["facility_id"], fill_value=0)),
+                ]:
+                    print(f"  Skew over {entity}: {skew_summary(counts.to_numpy())}")
+            fact_counts = save_fact_tables(
+                dict(zip(SESSION_FACT_TABLES, session_frames)), output_dir / "facts", args.partition_by,
+                bays_df, facilities_df, args.format, args.compression, args.row_group_size,
+            )
+            del session_frames
+
+        print("\n[7/9] Generating bay bookings...")
+        bay_bookings_df = generate_bay_bookings(
+            bays_df, start_date, end_date, ids=IdFactory(args.id_strategy, args.seed, shard=2)
+        )
+        fact_counts.update(save_fact_tables(
+            {"fact_bay_bookings": bay_bookings_df}, output_dir / "facts", args.partition_by,
+            bays_df, facilities_df, args.format, args.compression, args.row_group_size,
+        ))
     
     print("\n[8/9] Generating subscription events...")
-    subscription_events = generate_subscription_events(players_df, start_date, end_date)
-    save_json_lines(subscription_events, OUTPUT_DIR / "events" / "subscription_events.json")
+    subscription_events = generate_subscription_events(players_df, start_date, end_date, ids=dim_ids)
+    save_events(subscription_events, output_dir / "events" / "subscription_events", args)
     
     print("\n[9/9] Generating marketing events...")
-    marketing_events = generate_marketing_events(players_df, start_date, end_date)
-    save_json_lines(marketing_events, OUTPUT_DIR / "events" / "marketing_events.json")
+    marketing_events = generate_marketing_events(players_df, start_date, end_date, ids=dim_ids)
+    save_events(marketing_events, output_dir / "events" / "marketing_events", args)
     
     tiers_df = pd.DataFrame([
         {"tier_id": t[0], "tier_name": t[1], "monthly_price": t[2], "features": json.dumps(t[3])}
         for t in SUBSCRIPTION_TIERS
     ])
-    save_parquet(tiers_df, OUTPUT_DIR / "dimensions" / "dim_subscription_tiers.parquet")
+    save_table(tiers_df, output_dir / "dimensions" / "dim_subscription_tiers.parquet", args.format, args.compression)
     
     print("\n" + "=" * 70)
     print("SUMMARY")
@@ -909,19 +2365,22 @@ def main():
     print(f"  {'Bays:':<25} {len(bays_df):>10,}")
     print(f"  {'Game Types:':<25} {len(game_types_df):>10,}")
     print(f"\n{'Fact Tables:':<30}")
-    print(f"  {'Sessions:':<25} {len(sessions_df):>10,}")
-    print(f"  {'Scorecards:':<25} {len(scorecards_df):>10,}")
-    print(f"  {'Hole Scores:':<25} {len(hole_scores_df):>10,}")
-    print(f"  {'Shots:':<25} {len(shots_df):>10,}")
-    print(f"  {'Game Sessions:':<25} {len(game_sessions_df):>10,}")
-    print(f"  {'Bay Bookings:':<25} {len(bay_bookings_df):>10,}")
+    print(f"  {'Sessions:':<25} {fact_counts['fact_sessions']:>10,}")
+    print(f"  {'Scorecards:':<25} {fact_counts['fact_scorecards']:>10,}")
+    print(f"  {'Hole Scores:':<25} {fact_counts['fact_hole_scores']:>10,}")
+    print(f"  {'Shots:':<25} {fact_counts['fact_shots']:>10,}")
+    print(f"  {'Game Sessions:':<25} {fact_counts['fact_game_sessions']:>10,}")
+    print(f"  {'Bay Bookings:':<25} {fact_counts['fact_bay_bookings']:>10,}")
     print(f"\n{'Event Streams:':<30}")
     print(f"  {'Subscriptions:':<25} {len(subscription_events):>10,}")
     print(f"  {'Marketing:':<25} {len(marketing_events):>10,}")
     
-    total_size = sum(f.stat().st_size for f in OUTPUT_DIR.rglob("*") if f.is_file()) / (1024 * 1024)
+    total_size = sum(f.stat().st_size for f in output_dir.rglob("*") if f.is_file()) / (1024 * 1024)
     print(f"\n{'Total Data Size:':<25} {total_size:>10.2f} MB")
     print("=" * 70)
+    if not args.skip_validation:
+        print("Validating output...")
+        validate_run(output_dir)
     print("Data generation complete! Ready for S3 upload.")
     print("=" * 70)
 
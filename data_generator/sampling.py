@@ -0,0 +1,218 @@
+"""
+Trackman Golf Simulator - Skewed Sampling
+Alias tables for O(1) weighted draws, Zipf popularity for bays/facilities/players/courses
+and time-of-day / seasonal burst profiles for session start times
+"""
+
+from datetime import datetime
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+
+class AliasTable:
+    """Walker/Vose alias table: O(k) to build, O(1) per draw for a fixed discrete distribution"""
+
+    def __init__(self, weights):
+        weights = np.asarray(weights, dtype=float)
+        if weights.ndim != 1 or len(weights) == 0 or (weights < 0).any() or weights.sum() <= 0:
+            raise ValueError("AliasTable needs a non-empty 1-d array of non-negative weights with a positive sum")
+        k = len(weights)
+        scaled = weights * (k / weights.sum())
+        self.prob = np.ones(k)
+        self.alias = np.arange(k)
+        small = [i for i in range(k) if scaled[i] < 1.0]
+        large = [i for i in range(k) if scaled[i] >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        self.size = k
+
+    def sample(self, rng: np.random.Generator, n: int) -> np.ndarray:
+        """n indices drawn from the table's distribution: one uniform column pick and one coin flip each"""
+        column = rng.integers(0, self.size, n)
+        return np.where(rng.random(n) < self.prob[column], column, self.alias[column])
+
+    def probabilities(self) -> np.ndarray:
+        """The distribution the table encodes (for checks and tests)"""
+        p = self.prob / self.size
+        np.add.at(p, self.alias, (1 - self.prob) / self.size)
+        return p
+
+
+class CategoricalSampler:
+    """A fixed categorical distribution over values, precomputed once as an alias table.
+
+    sample() returns n values in one batch draw; sample_indices() returns positions
+    into values for callers that index parallel arrays.
+    """
+
+    def __init__(self, values, weights=None):
+        values = list(values)
+        if all(isinstance(v, (int, float, np.integer, np.floating)) for v in values):
+            self.values = np.asarray(values)
+        else:
+            self.values = np.empty(len(values), dtype=object)
+            for i, value in enumerate(values):
+                self.values[i] = value
+        self.table = AliasTable(np.ones(len(values)) if weights is None else weights)
+
+    def sample_indices(self, rng: np.random.Generator, n: int) -> np.ndarray:
+        return self.table.sample(rng, n)
+
+    def sample(self, rng: np.random.Generator, n: int) -> np.ndarray:
+        return self.values[self.table.sample(rng, n)]
+
+
+def zipf_weights(n: int, exponent: float, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """Power-law popularity 1 / rank**exponent over n items; exponent 0 is uniform.
+
+    With rng the ranks are shuffled, so which entity is the hot one is random but
+    repeatable for a given seed instead of always being the first row.
+    """
+    weights = 1.0 / np.arange(1, n + 1) ** exponent
+    return rng.permutation(weights) if rng is not None else weights
+
+
+HOUR_PROFILES = {
+    "flat": [1.0] * 24,
+    "default": [0.01] * 6 + [0.03, 0.05, 0.08, 0.10, 0.10, 0.12, 0.10, 0.08, 0.06, 0.08, 0.06, 0.04, 0.02, 0.01, 0.01, 0.01, 0.01, 0.01],
+    "after_work": [0.002] * 6 + [0.02, 0.04, 0.03, 0.03, 0.04, 0.06, 0.07, 0.05, 0.04, 0.05, 0.08, 0.12, 0.14, 0.12, 0.08, 0.05, 0.02, 0.008],
+}
+
+
+class SkewProfile:
+    """How unevenly sessions are spread over entities and time.
+
+    Zipf exponents (0 = uniform) for facilities, bays within a facility, players
+    and courses; an hour-of-day profile from HOUR_PROFILES; and a seasonal curve
+    (peak in mid-winter for indoor golf, amplitude 0..1) with a weekend boost and
+    burst_days randomly chosen days whose traffic is multiplied by burst_multiplier.
+    """
+
+    def __init__(
+        self,
+        facilities: float = 0.0,
+        bays: float = 0.0,
+        players: float = 0.0,
+        courses: float = 0.0,
+        hour_profile: str = "default",
+        seasonal_amplitude: float = 0.0,
+        weekend_boost: float = 1.0,
+        burst_days: int = 0,
+        burst_multiplier: float = 1.0,
+        seed: int = 42,
+    ):
+        if hour_profile not in HOUR_PROFILES:
+            raise ValueError(f"Unknown hour profile {hour_profile!r}, expected one of {list(HOUR_PROFILES)}")
+        self.facilities = facilities
+        self.bays = bays
+        self.players = players
+        self.courses = courses
+        self.hour_profile = hour_profile
+        self.seasonal_amplitude = seasonal_amplitude
+        self.weekend_boost = weekend_boost
+        self.burst_days = burst_days
+        self.burst_multiplier = burst_multiplier
+        self.seed = seed
+
+
+SKEW_PRESETS = {
+    "realistic": dict(
+        facilities=1.0, bays=0.6, players=1.1, courses=0.9, hour_profile="after_work",
+        seasonal_amplitude=0.35, weekend_boost=1.6, burst_days=3, burst_multiplier=3.0,
+    ),
+    "extreme": dict(
+        facilities=1.6, bays=1.2, players=1.5, courses=1.4, hour_profile="after_work",
+        seasonal_amplitude=0.6, weekend_boost=2.0, burst_days=5, burst_multiplier=8.0,
+    ),
+}
+
+
+def skew_preset(name: str, seed: int = 42) -> Optional[SkewProfile]:
+    """SkewProfile for a SKEW_PRESETS name; "none" keeps uniform sampling"""
+    if name == "none":
+        return None
+    return SkewProfile(**SKEW_PRESETS[name], seed=seed)
+
+
+def day_weights(profile: SkewProfile, start_date: datetime, n_days: int, rng: np.random.Generator) -> np.ndarray:
+    """Relative traffic of each day in the window: seasonal curve x weekend boost x burst days"""
+    days = np.datetime64(start_date.date(), "D") + np.arange(n_days)
+    day_of_year = (days - days.astype("datetime64[Y]")).astype(int)
+    seasonal = 1 + profile.seasonal_amplitude * np.cos(2 * np.pi * (day_of_year - 15) / 365.25)
+    weekend = np.where((days.astype(int) + 3) % 7 >= 5, profile.weekend_boost, 1.0)
+    weights = seasonal * weekend
+    if profile.burst_days:
+        bursts = rng.choice(n_days, min(profile.burst_days, n_days), replace=False)
+        weights[bursts] *= profile.burst_multiplier
+    return weights
+
+
+class SessionSampler:
+    """Precomputed alias tables for session placement under a SkewProfile.
+
+    Built once per run from the dimension tables and the date window, so every
+    chunk, shard and append delta draws from the same hot spots.
+    """
+
+    def __init__(
+        self,
+        profile: SkewProfile,
+        players_df: pd.DataFrame,
+        bays_df: pd.DataFrame,
+        courses_df: pd.DataFrame,
+        start_date: datetime,
+        n_days: int,
+    ):
+        rng = np.random.default_rng(profile.seed)
+        facility_codes, facility_of_bay = np.unique(bays_df["facility_id"].to_numpy(dtype=object), return_inverse=True)
+        facility_weight = zipf_weights(len(facility_codes), profile.facilities, rng)
+        # Zipf over the bays of each facility: random rank within the facility, normalised per facility
+        order = np.lexsort((rng.random(len(bays_df)), facility_of_bay))
+        sizes = np.bincount(facility_of_bay, minlength=len(facility_codes))
+        rank = np.empty(len(bays_df), dtype=np.int64)
+        rank[order] = np.arange(len(bays_df)) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        within = 1.0 / (rank + 1.0) ** profile.bays
+        bay_weight = facility_weight[facility_of_bay] * within / np.bincount(facility_of_bay, within)[facility_of_bay]
+
+        self.profile = profile
+        self.bays = AliasTable(bay_weight)
+        self.players = AliasTable(zipf_weights(len(players_df), profile.players, rng))
+        self.courses = AliasTable(zipf_weights(len(courses_df), profile.courses, rng))
+        self.hours = AliasTable(HOUR_PROFILES[profile.hour_profile])
+        self.days = AliasTable(day_weights(profile, start_date, n_days, rng))
+        self.n_players = len(players_df)
+
+    def sample_players(self, rng: np.random.Generator, n_sessions: int, k: int, max_rounds: int = 32) -> np.ndarray:
+        """k distinct popularity-weighted player indices per session.
+
+        Duplicates within a row are redrawn from the alias table; rows still
+        clashing after max_rounds (tiny or extremely skewed populations) fall
+        back to uniform redraws, which always terminate while n_players >= k.
+        """
+        picks = self.players.sample(rng, n_sessions * k).reshape(n_sessions, k)
+        for j in range(1, k):
+            attempt = 0
+            while (clash := (picks[:, [j]] == picks[:, :j]).any(axis=1)).any():
+                redraw = self.players.sample(rng, clash.sum()) if attempt < max_rounds else rng.integers(0, self.n_players, clash.sum())
+                picks[clash, j] = redraw
+                attempt += 1
+        return picks
+
+
+def skew_summary(counts: np.ndarray) -> Dict[str, float]:
+    """Share of traffic on the busiest 1% / 10% of entities, plus the Gini coefficient"""
+    ordered = np.sort(np.asarray(counts, dtype=float))[::-1]
+    total = ordered.sum() or 1.0
+    n = len(ordered)
+    cumulative = np.cumsum(ordered[::-1]) / total
+    return {
+        "top_1pct_share": round(float(ordered[:max(1, n // 100)].sum() / total), 3),
+        "top_10pct_share": round(float(ordered[:max(1, n // 10)].sum() / total), 3),
+        "gini": round(float(1 - 2 * cumulative.sum() / n + 1 / n), 3),
+    }
@@ -0,0 +1,461 @@
+#!/usr/bin/env python3
+"""
+Trackman Golf Simulator - Real-time Shot Stream
+Emits shot events from N concurrent bays at a target rate with asyncio, into rotating
+NDJSON/Parquet micro-batch files or a local socket/HTTP endpoint, and reports the achieved
+throughput and end-to-end latency percentiles
+"""
+
+import abc
+import argparse
+import asyncio
+import json
+import random
+import re
+import threading
+import time
+import urllib.request
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+import generate_trackman_data as gen
+from ball_flight import default_flight_table
+
+SINKS = ["ndjson", "parquet", "socket", "http"]
+DEFAULT_ROTATE_ROWS = 50_000
+DEFAULT_ROTATE_SECONDS = 10.0
+SESSION_SHOTS = (30, 90)
+# IdFactory shards of streamed rows start here, far above the 0..N shards the batch generator
+# and --append use, so streamed keys never collide with generated ones; --shard offsets it
+STREAM_SHARD_BASE = gen.STREAM_SHARD_BASE
+MAX_STREAM_SHARDS = 0x1000
+
+
+class Bay:
+    """One simulator bay: a player works through a session of shots, then the next player steps in"""
+
+    def __init__(
+        self, bay_id: Any, players_df: pd.DataFrame, rng: np.random.Generator, ids: gen.IdFactory, ball_flight: str = "empirical"
+    ):
+        self.bay_id = bay_id
+        self.players_df = players_df
+        self.rng = rng
+        self.ids = ids
+        self.ball_flight = ball_flight
+        self._new_session()
+
+    def _new_session(self):
+        player = self.players_df.iloc[self.rng.integers(len(self.players_df))]
+        self.player_id = player["player_id"]
+        self.skill = (player["skill_factor"], player["consistency_rating"], player["club_speed_base"])
+        self.session_id = self.ids.next()
+        self.shot_number = 0
+        self.shots_left = int(self.rng.integers(*SESSION_SHOTS))
+
+    def shots(self, n: int, interval_s: float) -> pd.DataFrame:
+        """The next n shots of the current session, timestamped interval_s apart and ending now"""
+        club_idx = self.rng.choice(gen.PRACTICE_CLUB_INDICES, n)
+        skill_factor, consistency, club_speed_base = self.skill
+        ends_at = np.datetime64(datetime.now(), "us")
+        timestamps = ends_at - (np.arange(n)[::-1] * interval_s * 1e6).astype("timedelta64[us]")
+        df = pd.DataFrame({
+            "shot_id": self.ids.take(n),
+            "session_id": self.session_id,
+            "player_id": self.player_id,
+            "bay_id": self.bay_id,
+            "club_id": np.array(gen.CLUB_IDS, dtype=object)[club_idx],
+            "shot_number": self.shot_number + np.arange(1, n + 1),
+            "shot_timestamp": timestamps,
+            "shot_date": gen._dates(gen._epoch_days(timestamps)),
+            **gen.generate_shot_batch(skill_factor, consistency, club_speed_base, club_idx, rng=self.rng, ball_flight=self.ball_flight),
+        })
+        self.shot_number += n
+        self.shots_left -= n
+        if self.shots_left <= 0:
+            self._new_session()
+        return df
+
+
+class StreamStats:
+    """Counts delivered events and the emit -> sink latency of every batch"""
+
+    def __init__(self, target_rate: float):
+        self.target_rate = target_rate
+        self.events = 0
+        self.batches = 0
+        self.blocked_s = 0.0
+        self.started = time.perf_counter()
+        self._latencies: List[float] = []
+        self._sizes: List[int] = []
+
+    def record(self, rows: int, latency_s: float):
+        self.events += rows
+        self.batches += 1
+        self._latencies.append(latency_s)
+        self._sizes.append(rows)
+
+    def summary(self) -> Dict[str, Any]:
+        elapsed = time.perf_counter() - self.started
+        per_event = np.repeat(np.array(self._latencies), self._sizes) * 1000 if self._latencies else np.zeros(1)
+        p50, p95, p99 = np.percentile(per_event, [50, 95, 99])
+        return {
+            "events": self.events,
+            "batches": self.batches,
+            "elapsed_s": round(elapsed, 2),
+            "target_events_per_s": self.target_rate,
+            "achieved_events_per_s": round(self.events / elapsed, 1),
+            "latency_p50_ms": round(p50, 2),
+            "latency_p95_ms": round(p95, 2),
+            "latency_p99_ms": round(p99, 2),
+            "latency_max_ms": round(per_event.max(), 2),
+            "backpressure_wait_s": round(self.blocked_s, 2),
+        }
+
+
+class RotatingFileSink(abc.ABC):
+    """Micro-batch files that roll over after rotate_rows rows or rotate_seconds.
+
+    The open file carries a .tmp suffix and is renamed when it is rotated, so
+    directory watchers (stage loaders, Snowpipe) only ever pick up complete files.
+    Numbering continues after the highest file already in output_dir, so a new run
+    never overwrites an earlier one's files.
+    """
+
+    suffix = ""
+
+    def __init__(self, output_dir: Path, rotate_rows: int = DEFAULT_ROTATE_ROWS, rotate_seconds: float = DEFAULT_ROTATE_SECONDS):
+        self.output_dir = output_dir
+        self.rotate_rows = rotate_rows
+        self.rotate_seconds = rotate_seconds
+        self.files_written = 0
+        self._rows = 0
+        self._opened_at = time.monotonic()
+        output_dir.mkdir(parents=True, exist_ok=True)
+        existing = [int(m.group(1)) for f in output_dir.iterdir() if (m := re.match(r"shots-(\d+)", f.name))]
+        self._first_index = max(existing, default=-1) + 1
+
+    def _path(self) -> Path:
+        return self.output_dir / f"shots-{self._first_index + self.files_written:06d}{self.suffix}"
+
+    async def write(self, df: pd.DataFrame):
+        await asyncio.to_thread(self._write, df)
+
+    def _write(self, df: pd.DataFrame):
+        self._append(df)
+        self._rows += len(df)
+        if self._rows >= self.rotate_rows or time.monotonic() - self._opened_at >= self.rotate_seconds:
+            self._rotate()
+
+    def _rotate(self):
+        if self._rows:
+            self._finish(self._path().with_name(self._path().name + ".tmp"))
+            self._path().with_name(self._path().name + ".tmp").rename(self._path())
+            self.files_written += 1
+        self._rows = 0
+        self._opened_at = time.monotonic()
+
+    async def close(self):
+        await asyncio.to_thread(self._rotate)
+
+    @abc.abstractmethod
+    def _append(self, df: pd.DataFrame):
+        """Add rows to the open .tmp file"""
+
+    @abc.abstractmethod
+    def _finish(self, tmp_path: Path):
+        """Complete the open file at tmp_path before it is renamed"""
+
+
+class NDJSONSink(RotatingFileSink):
+    suffix = ".ndjson"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._handle = None
+
+    def _append(self, df: pd.DataFrame):
+        if self._handle is None:
+            self._handle = open(self._path().with_name(self._path().name + ".tmp"), "w")
+        self._handle.write(_ndjson(df))
+
+    def _finish(self, tmp_path: Path):
+        self._handle.close()
+        self._handle = None
+
+
+class ParquetSink(RotatingFileSink):
+    suffix = ".parquet"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._tables: List[pa.Table] = []
+
+    def _append(self, df: pd.DataFrame):
+        self._tables.append(pa.Table.from_pandas(df, preserve_index=False))
+
+    def _finish(self, tmp_path: Path):
+        pq.write_table(pa.concat_tables(self._tables), tmp_path)
+        self._tables = []
+
+
+class SocketSink:
+    """NDJSON over TCP; awaiting drain() pushes socket backpressure back to the bays"""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def write(self, df: pd.DataFrame):
+        if self._writer is None:
+            _, self._writer = await asyncio.open_connection(self.host, self.port)
+        self._writer.write(_ndjson(df).encode())
+        await self._writer.drain()
+
+    async def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            await self._writer.wait_closed()
+
+
+class HttpSink:
+    """POST every micro-batch as an application/x-ndjson body"""
+
+    def __init__(self, url: str):
+        self.url = url
+
+    async def write(self, df: pd.DataFrame):
+        await asyncio.to_thread(self._post, _ndjson(df).encode())
+
+    def _post(self, body: bytes):
+        request = urllib.request.Request(self.url, data=body, headers={"Content-Type": "application/x-ndjson"})
+        with urllib.request.urlopen(request) as response:
+            response.read()
+
+    async def close(self):
+        pass
+
+
+def _ndjson(df: pd.DataFrame) -> str:
+    text = gen._text_ready(df).to_json(orient="records", lines=True, date_format="iso", date_unit="us")
+    return text if text.endswith("\n") else text + "\n"
+
+
+async def start_socket_stand_in(host: str = "127.0.0.1", port: int = 0) -> Tuple[asyncio.AbstractServer, Dict[str, int]]:
+    """Local TCP receiver that reads and counts NDJSON lines, standing in for an ingestion endpoint"""
+    received = {"events": 0}
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        while line := await reader.readline():
+            received["events"] += 1
+        writer.close()
+
+    server = await asyncio.start_server(handle, host, port)
+    return server, received
+
+
+def start_http_stand_in(host: str = "127.0.0.1", port: int = 0) -> Tuple[ThreadingHTTPServer, Dict[str, int]]:
+    """Local HTTP receiver (background thread) that accepts NDJSON POSTs and counts the lines"""
+    received = {"events": 0}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            received["events"] += body.count(b"\n")
+            self.send_response(204)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, received
+
+
+async def _run_bay(
+    bay: Bay, rate: float, tick: float, deadline: float, queue: asyncio.Queue, stats: StreamStats,
+):
+    """Emit the shots that are due on this bay's schedule every tick; a full queue blocks the bay"""
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    emitted = 0
+    while (now := loop.time()) < deadline:
+        due = int((now - started) * rate) - emitted
+        if due > 0:
+            batch = bay.shots(due, 1 / rate)
+            blocked_from = loop.time()
+            await queue.put((time.perf_counter(), batch))
+            stats.blocked_s += loop.time() - blocked_from
+            emitted += due
+        await asyncio.sleep(tick)
+
+
+async def _drain(queue: asyncio.Queue, sink, stats: StreamStats):
+    """Write whatever micro-batches are waiting as one sink write, so a slow sink coalesces instead of falling behind"""
+    done = False
+    while not done:
+        items = [await queue.get()]
+        while not queue.empty():
+            items.append(queue.get_nowait())
+        if items[-1] is None:
+            done = True
+            items.pop()
+        if not items:
+            continue
+        await sink.write(pd.concat([batch for _, batch in items], ignore_index=True))
+        written = time.perf_counter()
+        for created, batch in items:
+            stats.record(len(batch), written - created)
+
+
+async def _report(queue: asyncio.Queue, stats: StreamStats, every: float):
+    while True:
+        await asyncio.sleep(every)
+        elapsed = time.perf_counter() - stats.started
+        print(f"  {elapsed:6.1f}s  {stats.events:>10,} events  {stats.events / elapsed:>10,.0f} events/s  queue {queue.qsize()}")
+
+
+async def simulate(
+    bays: List[Bay],
+    sink,
+    rate: float,
+    duration: float,
+    tick: float = 0.1,
+    queue_size: int = 64,
+    report_every: float = 5.0,
+) -> Dict[str, Any]:
+    """Run every bay for duration seconds at rate/len(bays) events/s each, writing through one sink consumer"""
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    stats = StreamStats(rate)
+    consumer = asyncio.create_task(_drain(queue, sink, stats))
+    reporter = asyncio.create_task(_report(queue, stats, report_every))
+    deadline = loop.time() + duration
+    await asyncio.gather(*(_run_bay(bay, rate / len(bays), tick, deadline, queue, stats) for bay in bays))
+    await queue.put(None)
+    await consumer
+    reporter.cancel()
+    await sink.close()
+    return stats.summary()
+
+
+def load_players_and_bays(dims_dir: Path, n_bays: int, seed: int) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Players and bays from an earlier full run under dims_dir, or a fresh small set when none exists"""
+    players_path, bays_path = dims_dir / "dim_players.parquet", dims_dir / "dim_bays.parquet"
+    if players_path.exists() and bays_path.exists():
+        return pd.read_parquet(players_path), pd.read_parquet(bays_path).head(n_bays)
+    np.random.seed(seed)
+    random.seed(seed)
+    facilities_df = gen.generate_facilities(max(1, n_bays // 2))
+    return gen.generate_players(500), gen.generate_bays(facilities_df).head(n_bays)
+
+
+def _endpoint(value: str) -> Tuple[str, int]:
+    host, _, port = value.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Trackman Golf Simulator - real-time shot stream")
+    parser.add_argument("--bays", type=int, default=50, help="Number of concurrently emitting bays")
+    parser.add_argument("--rate", type=float, default=5000, help="Target events/sec across all bays")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds to stream for")
+    parser.add_argument("--tick", type=float, default=0.1, help="Seconds between a bay's emissions; due shots are sent as one micro-batch")
+    parser.add_argument("--queue-size", type=int, default=64, help="Micro-batches buffered before bays block (backpressure)")
+    parser.add_argument("--sink", choices=SINKS, default="ndjson", help="Where events go")
+    parser.add_argument("--output-dir", type=Path, default=gen.OUTPUT_DIR / "stream" / "shots", help="Directory for ndjson/parquet micro-batch files")
+    parser.add_argument("--rotate-rows", type=int, default=DEFAULT_ROTATE_ROWS, help="Roll to a new file after this many rows")
+    parser.add_argument("--rotate-seconds", type=float, default=DEFAULT_ROTATE_SECONDS, help="Roll to a new file after this many seconds")
+    parser.add_argument(
+        "--endpoint", default=None,
+        help="host:port for --sink socket or a URL for --sink http; without it a local stand-in receiver is started",
+    )
+    parser.add_argument("--dims-dir", type=Path, default=gen.OUTPUT_DIR / "dimensions", help="Where dim_players/dim_bays are read from")
+    parser.add_argument(
+        "--ball-flight", choices=gen.BALL_FLIGHT_MODES, default="empirical",
+        help="Shot outcome model (see generate_trackman_data.py); prefer lut over physics for small per-tick batches",
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--id-strategy", choices=gen.ID_STRATEGIES, default="seeded", help="Primary key format (see generate_trackman_data.py)")
+    parser.add_argument(
+        "--shard", type=int, default=0,
+        help=f"Id shard of this stream (0-{MAX_STREAM_SHARDS - 1}); give concurrent or repeated streams distinct shards "
+        "so int64/deterministic keys stay unique",
+    )
+    parser.add_argument("--report-every", type=float, default=5.0, help="Seconds between progress lines")
+    parser.add_argument("--stats-json", type=Path, default=None, help="Also write the final throughput/latency report to this file")
+    args = parser.parse_args(argv)
+    if not 0 <= args.shard < MAX_STREAM_SHARDS:
+        parser.error(f"--shard must be between 0 and {MAX_STREAM_SHARDS - 1}")
+    return args
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    players_df, bays_df = load_players_and_bays(args.dims_dir, args.bays, args.seed)
+    ids = gen.IdFactory(args.id_strategy, args.seed, shard=STREAM_SHARD_BASE + args.shard)
+    rngs = [np.random.default_rng(s) for s in np.random.SeedSequence(args.seed).spawn(len(bays_df))]
+    bays = [Bay(bay_id, players_df, rng, ids, args.ball_flight) for bay_id, rng in zip(bays_df["bay_id"], rngs)]
+    if args.ball_flight == "lut":
+        # Build the table before the clock starts rather than inside the first tick
+        default_flight_table()
+
+    stand_in = None
+    if args.sink == "ndjson":
+        sink = NDJSONSink(args.output_dir, args.rotate_rows, args.rotate_seconds)
+    elif args.sink == "parquet":
+        sink = ParquetSink(args.output_dir, args.rotate_rows, args.rotate_seconds)
+    elif args.sink == "socket":
+        if args.endpoint is None:
+            stand_in, received = await start_socket_stand_in()
+            host, port = stand_in.sockets[0].getsockname()[:2]
+        else:
+            host, port = _endpoint(args.endpoint)
+        sink = SocketSink(host, port)
+    else:
+        url = args.endpoint
+        if url is None:
+            stand_in, received = start_http_stand_in()
+            url = f"http://127.0.0.1:{stand_in.server_address[1]}/shots"
+        sink = HttpSink(url)
+
+    print(f"\nStreaming {args.rate:,.0f} events/s from {len(bays)} bays for {args.duration:g}s to {args.sink}...")
+    summary = await simulate(bays, sink, args.rate, args.duration, args.tick, args.queue_size, args.report_every)
+    if isinstance(sink, RotatingFileSink):
+        summary["files_written"] = sink.files_written
+    if stand_in is not None:
+        if args.sink == "socket":
+            await asyncio.sleep(0.1)  # let the receiver read the tail of the stream
+            stand_in.close()
+        else:
+            stand_in.shutdown()
+        summary["received_by_stand_in"] = received["events"]
+    return summary
+
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    print("=" * 70)
+    print("Trackman Golf Simulator - Real-time Shot Stream")
+    print("=" * 70)
+
+    summary = asyncio.run(run(args))
+
+    print("\n" + "=" * 70)
+    print("STREAM SUMMARY")
+    print("=" * 70)
+    print(pd.Series(summary).to_string())
+    if args.stats_json:
+        args.stats_json.write_text(json.dumps(summary, indent=2))
+        print(f"\nReport written to {args.stats_json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,641 @@
+"""
+Trackman Golf Simulator - Output Validation
+Checks every dimension and fact table a run wrote against a declared schema: column
+presence and types, nulls, value ranges (per club for shot metrics, from CLUB_SPECS),
+primary keys and referential integrity, so a bad run fails before it is uploaded
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+import generate_trackman_data as gen
+
+BATCH_ROWS = 250_000
+# Read one row group at a time instead of pre-buffering whole files: the stream
+# and sharded writers leave a single multi-GB file per table
+PARQUET_FORMAT = ds.ParquetFileFormat(default_fragment_scan_options=ds.ParquetFragmentScanOptions(pre_buffer=False))
+SCAN_READAHEAD = {"batch_readahead": 4, "fragment_readahead": 1}
+
+
+class Column:
+    """Declared type of one column plus optional bounds or allowed values.
+
+    kind is one of id, string, int, float, bool, date, timestamp; id columns are
+    strings, binary or integers depending on --id-strategy, float columns also accept
+    integers, and dictionary-encoded columns are checked by their value type.
+    """
+
+    def __init__(self, kind: str, nullable: bool = False, min=None, max=None, values=None):
+        self.kind = kind
+        self.nullable = nullable
+        self.min = min
+        self.max = max
+        self.values = values
+
+
+TYPE_CHECKS = {
+    "id": lambda t: pa.types.is_string(t) or pa.types.is_large_string(t) or pa.types.is_binary(t)
+    or pa.types.is_fixed_size_binary(t) or pa.types.is_integer(t),
+    "string": lambda t: pa.types.is_string(t) or pa.types.is_large_string(t),
+    "int": pa.types.is_integer,
+    "float": lambda t: pa.types.is_floating(t) or pa.types.is_integer(t),
+    "bool": pa.types.is_boolean,
+    "date": pa.types.is_date,
+    "timestamp": pa.types.is_timestamp,
+}
+
+SESSION_TYPE_IDS = [t["type_id"] for t in gen.SESSION_TYPES]
+SESSION_CATEGORIES = sorted({t["category"] for t in gen.SESSION_TYPES})
+GAME_TYPE_IDS = [g["game_type_id"] for g in gen.GAME_TYPES]
+TEES = ["Gold", "White", "Blue", "Red"]
+
+SCHEMAS: Dict[str, Dict[str, Column]] = {
+    "dim_players": {
+        "player_id": Column("id"),
+        "player_name": Column("string"),
+        "email": Column("string"),
+        "country": Column("string"),
+        "region": Column("string", values=list(gen.REGIONS)),
+        "handicap_index": Column("float", min=-5, max=54),
+        "skill_factor": Column("float", min=0, max=2),
+        "club_speed_base": Column("float", min=40, max=140),
+        "age": Column("int", min=5, max=110),
+        "membership_tier": Column("string", values=[t[0] for t in gen.SUBSCRIPTION_TIERS]),
+        "tee_preference": Column("string", values=TEES),
+        "created_at": Column("timestamp"),
+        "is_active": Column("bool"),
+        "is_guest": Column("bool"),
+    },
+    "dim_courses": {
+        "course_id": Column("string"),
+        "course_name": Column("string"),
+        "country": Column("string"),
+        "par": Column("int", min=54, max=74),
+        "yardage": Column("int", min=1000, max=9000),
+        "course_rating": Column("float"),
+        "slope_rating": Column("int", min=55, max=155),
+        "green_speed_stimp": Column("float", min=5, max=15),
+        "is_premium": Column("bool"),
+    },
+    "dim_course_holes": {
+        "course_id": Column("string"),
+        "hole_number": Column("int", min=1, max=18),
+        "par": Column("int", min=3, max=5),
+        "yardage": Column("int", min=50, max=700),
+        "stroke_index": Column("int", min=1, max=18),
+    },
+    "dim_clubs": {
+        "club_id": Column("string"),
+        "club_name": Column("string"),
+        "standard_loft": Column("float", min=0, max=65),
+    },
+    "dim_facilities": {
+        "facility_id": Column("id"),
+        "facility_name": Column("string"),
+        "facility_type": Column("string", values=gen.FACILITY_TYPES),
+        "region": Column("string", values=list(gen.REGIONS)),
+        "num_bays": Column("int", min=1),
+        "operating_hours_start": Column("int", min=0, max=23),
+        "operating_hours_end": Column("int", min=0, max=24),
+        "is_commercial": Column("bool"),
+        "opening_date": Column("date"),
+        "is_active": Column("bool"),
+    },
+    "dim_bays": {
+        "bay_id": Column("id"),
+        "facility_id": Column("id"),
+        "bay_name": Column("string"),
+        "bay_number": Column("int", min=1),
+        "simulator_model": Column("string", values=[m[0] for m in gen.SIMULATOR_MODELS]),
+        "installation_date": Column("date"),
+        "is_active": Column("bool"),
+        "hourly_rate": Column("float", min=0),
+    },
+    "dim_game_types": {
+        "game_type_id": Column("string"),
+        "name": Column("string"),
+        "min_shots": Column("int", min=1),
+        "max_shots": Column("int", min=1),
+    },
+    "fact_sessions": {
+        "session_id": Column("id"),
+        "player_id": Column("id"),
+        "facility_id": Column("id"),
+        "bay_id": Column("id"),
+        "session_type": Column("string", values=SESSION_TYPE_IDS),
+        "session_category": Column("string", values=SESSION_CATEGORIES),
+        "started_at": Column("timestamp"),
+        "ended_at": Column("timestamp"),
+        "duration_minutes": Column("int", min=1, max=24 * 60),
+        "session_date": Column("date"),
+        "day_of_week": Column("string", values=gen.WEEKDAY_NAMES),
+        "hour_of_day": Column("int", min=0, max=23),
+        "num_players": Column("int", min=1, max=4),
+        "is_logged_in": Column("bool"),
+        "is_guest": Column("bool"),
+    },
+    "fact_scorecards": {
+        "scorecard_id": Column("id"),
+        "session_id": Column("id"),
+        "player_id": Column("id"),
+        "course_id": Column("string"),
+        "tee": Column("string", values=TEES),
+        "holes_played": Column("int", min=1, max=18),
+        "total_strokes": Column("int", min=1),
+        "front_nine": Column("int", min=0),
+        "back_nine": Column("int", nullable=True, min=0),
+        "total_par": Column("int", min=1),
+        "score_vs_par": Column("int"),
+        "gir_percentage": Column("float", min=0, max=100),
+        "fir_percentage": Column("float", nullable=True, min=0, max=100),
+        "putts_total": Column("int", min=0),
+        "is_complete": Column("bool"),
+        "is_tournament": Column("bool", nullable=True),
+        "round_date": Column("date"),
+        "round_datetime": Column("timestamp"),
+    },
+    "fact_hole_scores": {
+        "hole_score_id": Column("id"),
+        "scorecard_id": Column("id"),
+        "session_id": Column("id"),
+        "player_id": Column("id"),
+        "course_id": Column("string"),
+        "hole_number": Column("int", min=1, max=18),
+        "par": Column("int", min=3, max=5),
+        "strokes": Column("int", min=1, max=15),
+        "putts": Column("int", min=0, max=6),
+        "gir": Column("bool"),
+        "fir": Column("bool", nullable=True),
+        "score_type": Column("string", values=list(gen.SCORE_TYPES)),
+        "vs_par": Column("int"),
+        "score_date": Column("date"),
+    },
+    "fact_shots": {
+        "shot_id": Column("id"),
+        "session_id": Column("id"),
+        "player_id": Column("id"),
+        "bay_id": Column("id"),
+        "club_id": Column("string", values=gen.CLUB_IDS),
+        "shot_number": Column("int", min=1),
+        "shot_timestamp": Column("timestamp"),
+        "shot_date": Column("date"),
+        "club_speed": Column("float", min=0, max=160),
+        "ball_speed": Column("float", min=0, max=240),
+        "smash_factor": Column("float", min=0, max=1.52),
+        "attack_angle": Column("float", min=-15, max=15),
+        "club_path": Column("float", min=-30, max=30),
+        "face_angle": Column("float", min=-30, max=30),
+        "face_to_path": Column("float", min=-60, max=60),
+        "spin_rate": Column("float", min=0),
+        "spin_axis": Column("float", min=-45, max=45),
+        "launch_angle": Column("float", min=0, max=45),
+        "apex_height": Column("float", min=0),
+        "carry_distance": Column("float", min=0),
+        "total_distance": Column("float", min=0),
+        "dynamic_loft": Column("float", min=-10, max=75),
+        "lateral_deviation": Column("float", min=-150, max=150),
+    },
+    "fact_game_sessions": {
+        "game_session_id": Column("id"),
+        "session_id": Column("id"),
+        "game_type_id": Column("string", values=GAME_TYPE_IDS),
+        "num_players": Column("int", min=1, max=4),
+        "num_shots": Column("int", min=0),
+        "score": Column("int", min=0),
+        "duration_minutes": Column("int", min=1),
+        "game_date": Column("date"),
+        "started_at": Column("timestamp"),
+    },
+    "fact_bay_bookings": {
+        "booking_id": Column("id"),
+        "bay_id": Column("id"),
+        "facility_id": Column("id"),
+        "booking_date": Column("date"),
+        "hour": Column("int", min=0, max=23),
+        "day_of_week": Column("string", values=gen.WEEKDAY_NAMES),
+        "is_weekend": Column("bool"),
+        "is_booked": Column("bool"),
+        "is_occupied": Column("bool"),
+        "session_type": Column("string", values=SESSION_TYPE_IDS),
+        "num_players": Column("int", min=1, max=4),
+        "revenue": Column("float", min=0),
+    },
+}
+
+PRIMARY_KEYS = {
+    "dim_players": ["player_id"],
+    "dim_courses": ["course_id"],
+    "dim_course_holes": ["course_id", "hole_number"],
+    "dim_clubs": ["club_id"],
+    "dim_facilities": ["facility_id"],
+    "dim_bays": ["bay_id"],
+    "dim_game_types": ["game_type_id"],
+    "fact_sessions": ["session_id"],
+    "fact_scorecards": ["scorecard_id"],
+    "fact_hole_scores": ["hole_score_id"],
+    "fact_shots": ["shot_id"],
+    "fact_game_sessions": ["game_session_id"],
+    "fact_bay_bookings": ["booking_id"],
+}
+
+# (child table, column, parent table, parent column)
+FOREIGN_KEYS = [
+    ("dim_bays", "facility_id", "dim_facilities", "facility_id"),
+    ("dim_course_holes", "course_id", "dim_courses", "course_id"),
+    ("fact_sessions", "player_id", "dim_players", "player_id"),
+    ("fact_sessions", "bay_id", "dim_bays", "bay_id"),
+    ("fact_sessions", "facility_id", "dim_facilities", "facility_id"),
+    ("fact_scorecards", "session_id", "fact_sessions", "session_id"),
+    ("fact_scorecards", "player_id", "dim_players", "player_id"),
+    ("fact_scorecards", "course_id", "dim_courses", "course_id"),
+    ("fact_hole_scores", "scorecard_id", "fact_scorecards", "scorecard_id"),
+    ("fact_hole_scores", "session_id", "fact_sessions", "session_id"),
+    ("fact_shots", "session_id", "fact_sessions", "session_id"),
+    ("fact_shots", "player_id", "dim_players", "player_id"),
+    ("fact_shots", "bay_id", "dim_bays", "bay_id"),
+    ("fact_shots", "club_id", "dim_clubs", "club_id"),
+    ("fact_game_sessions", "session_id", "fact_sessions", "session_id"),
+    ("fact_game_sessions", "game_type_id", "dim_game_types", "game_type_id"),
+    ("fact_bay_bookings", "bay_id", "dim_bays", "bay_id"),
+    ("fact_bay_bookings", "facility_id", "dim_facilities", "facility_id"),
+]
+
+# Per-club shot bounds, indexed like gen.CLUB_IDS: the generator clips spin to
+# 0.7x..1.3x of the club's spin range and smash to 1.52; carry may run past the
+# typical range under the physics model but not by more than half again
+CLUB_LIMITS = {
+    "spin_rate": (np.floor(gen.CLUB_TABLE["spin_min"] * 0.7), np.ceil(gen.CLUB_TABLE["spin_max"] * 1.3)),
+    "carry_distance": (np.zeros(len(gen.CLUB_IDS)), gen.CLUB_TABLE["distance_max"] * 1.5),
+    "smash_factor": (np.zeros(len(gen.CLUB_IDS)), np.full(len(gen.CLUB_IDS), 1.52)),
+}
+
+
+class ValidationIssue:
+    def __init__(self, table: str, check: str, detail: str, rows: int = 0):
+        self.table = table
+        self.check = check
+        self.detail = detail
+        self.rows = rows
+
+    def __str__(self):
+        rows = f" ({self.rows:,} rows)" if self.rows else ""
+        return f"{self.table}: {self.check}: {self.detail}{rows}"
+
+
+class ValidationReport:
+    """Issues found plus the row count checked per table"""
+
+    def __init__(self):
+        self.issues: List[ValidationIssue] = []
+        self.rows: Dict[str, int] = {}
+        self.seconds = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.issues
+
+    def add(self, table: str, check: str, detail: str, rows: int = 0):
+        self.issues.append(ValidationIssue(table, check, detail, rows))
+
+    def print_summary(self):
+        total = sum(self.rows.values())
+        status = "passed" if self.ok else f"FAILED with {len(self.issues)} issue(s)"
+        print(f"  Validated {len(self.rows)} tables, {total:,} rows in {self.seconds:.1f}s: {status}")
+        for issue in self.issues:
+            print(f"    - {issue}")
+
+
+def _plain(column):
+    """Dictionary-encoded arrays decoded to their values; anything else as is"""
+    if isinstance(column, pa.ChunkedArray):
+        if pa.types.is_dictionary(column.type):
+            return pa.chunked_array([c.dictionary_decode() for c in column.chunks], type=column.type.value_type)
+        return column
+    return column.dictionary_decode() if pa.types.is_dictionary(column.type) else column
+
+
+def _distinct(column) -> pa.Array:
+    """Distinct non-null values; for dictionary columns only the entries actually used"""
+    if isinstance(column, pa.ChunkedArray):
+        if column.num_chunks == 0:
+            return pa.array([], type=_value_type(column.type))
+        column = column.combine_chunks() if not pa.types.is_dictionary(column.type) else column.unify_dictionaries().combine_chunks()
+    if pa.types.is_dictionary(column.type):
+        column = column.dictionary.take(pc.unique(column.indices))
+    return pc.drop_null(pc.unique(column))
+
+
+def _value_type(data_type: pa.DataType) -> pa.DataType:
+    return data_type.value_type if pa.types.is_dictionary(data_type) else data_type
+
+
+def open_table(output_dir: Path, table: str) -> Optional[ds.Dataset]:
+    """The table as written by any engine and layout: one file, part files or date partitions.
+
+    Partition directories are not parsed into columns; every partition key is also
+    stored in the files themselves.
+    """
+    base = output_dir / ("dimensions" if table.startswith("dim_") else "facts")
+    for path, fmt in ((base / table, PARQUET_FORMAT), (base / f"{table}.parquet", PARQUET_FORMAT), (base / f"{table}.csv", "csv")):
+        if path.exists():
+            return ds.dataset(path, format=fmt, partitioning=None)
+    return None
+
+
+def check_schema(report: ValidationReport, table: str, schema: pa.Schema) -> List[str]:
+    """Column presence and types; returns the declared columns that can be value-checked"""
+    declared = SCHEMAS[table]
+    missing = [c for c in declared if c not in schema.names]
+    if missing:
+        report.add(table, "missing columns", ", ".join(missing))
+    usable = []
+    for name, column in declared.items():
+        if name not in schema.names:
+            continue
+        data_type = _value_type(schema.field(name).type)
+        if TYPE_CHECKS[column.kind](data_type):
+            usable.append(name)
+        else:
+            report.add(table, "type", f"{name} is {data_type}, expected {column.kind}")
+    return usable
+
+
+def check_values(report: ValidationReport, table: str, blocks: Iterable[pa.Table], columns: List[str]) -> int:
+    """Nulls, min/max bounds, allowed values and per-club bounds, one block of rows at a time"""
+    declared = SCHEMAS[table]
+    nulls = dict.fromkeys(columns, 0)
+    low = dict.fromkeys(columns, 0)
+    high = dict.fromkeys(columns, 0)
+    unknown: Dict[str, set] = {c: set() for c in columns if declared[c].values is not None}
+    club_bad = dict.fromkeys(CLUB_LIMITS, 0)
+    club_ids = pa.array(gen.CLUB_IDS)
+    rows = 0
+
+    for block in blocks:
+        rows += block.num_rows
+        for name in columns:
+            column = declared[name]
+            values = block.column(name)
+            nulls[name] += values.null_count
+            if column.min is not None:
+                low[name] += pc.sum(pc.less(values, column.min)).as_py() or 0
+            if column.max is not None:
+                high[name] += pc.sum(pc.greater(values, column.max)).as_py() or 0
+            if column.values is not None:
+                seen = _distinct(values)
+                outside = pc.filter(seen, pc.invert(pc.is_in(seen, value_set=pa.array(column.values, type=seen.type))))
+                unknown[name].update(outside.to_pylist())
+
+        if table == "fact_shots" and "club_id" in columns:
+            club = pc.fill_null(pc.index_in(_plain(block.column("club_id")), value_set=club_ids), -1).to_numpy()
+            known = club >= 0
+            for name, (lo, hi) in CLUB_LIMITS.items():
+                if name in columns:
+                    values = block.column(name).to_numpy(zero_copy_only=False)
+                    club_bad[name] += int((known & ((values < lo[club]) | (values > hi[club]))).sum())
+
+    for name in columns:
+        if nulls[name] and not declared[name].nullable:
+            report.add(table, "nulls", name, nulls[name])
+        if low[name]:
+            report.add(table, "range", f"{name} < {declared[name].min}", low[name])
+        if high[name]:
+            report.add(table, "range", f"{name} > {declared[name].max}", high[name])
+        if unknown.get(name):
+            report.add(table, "values", f"{name} has unexpected {sorted(map(str, unknown[name]))[:5]}")
+    for name, bad in club_bad.items():
+        if bad:
+            report.add(table, "club range", f"{name} outside the CLUB_SPECS bounds of its club", bad)
+    return rows
+
+
+HASH_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _mix(h: np.ndarray, word: np.ndarray) -> np.ndarray:
+    h = (h ^ word) * HASH_MULTIPLIER
+    return h ^ (h >> np.uint64(29))
+
+
+def _key_hashes(column: pa.Array) -> np.ndarray:
+    """64-bit hash per value of a key column, eight bytes at a time.
+
+    Integers are used as is; strings and binary ids are zero-padded to whole words
+    per value, so equal values hash equally whatever block they arrive in.
+    """
+    column = _plain(column)
+    if pa.types.is_integer(column.type):
+        return pc.fill_null(column, 0).to_numpy().astype(np.uint64)
+    n = len(column)
+    if pa.types.is_fixed_size_binary(column.type):
+        width = column.type.byte_width
+        data = np.frombuffer(column.buffers()[1], dtype=np.uint8)[column.offset * width:(column.offset + n) * width]
+        lengths = np.full(n, width)
+        padded = np.zeros((n, -(-width // 8) * 8), dtype=np.uint8)
+        padded[:, :width] = data.reshape(n, width)
+    else:
+        offset_type = np.int64 if pa.types.is_large_string(column.type) or pa.types.is_large_binary(column.type) else np.int32
+        offsets = np.frombuffer(column.buffers()[1], dtype=offset_type)[column.offset:column.offset + n + 1].astype(np.int64)
+        data = np.frombuffer(column.buffers()[2], dtype=np.uint8)[offsets[0]:offsets[-1]]
+        lengths = np.diff(offsets)
+        width = int(lengths.max()) if n else 0
+        padded = np.zeros((n, -(-width // 8) * 8), dtype=np.uint8)
+        if n and (lengths == width).all():
+            padded[:, :width] = data.reshape(n, width)
+        else:
+            rows = np.repeat(np.arange(n), lengths)
+            padded[rows, np.arange(len(data)) - np.repeat(offsets[:-1] - offsets[0], lengths)] = data
+    words = padded.view(np.uint64)
+    h = _mix(np.zeros(n, dtype=np.uint64), lengths.astype(np.uint64))
+    uniform = (lengths == width).all()
+    for j in range(words.shape[1]):
+        h = _mix(h, words[:, j]) if uniform else np.where(j * 8 < lengths, _mix(h, words[:, j]), h)
+    return h
+
+
+class KeyTracker:
+    """Duplicate count for a primary key seen block by block.
+
+    Only a 64-bit hash per row is kept, so checking a 10M-row fact table costs
+    80 MB rather than its id strings; the chance of a false duplicate from a hash
+    collision is about n**2 / 2**65 (under 1e-5 at 10M rows).
+    """
+
+    def __init__(self):
+        self.hashes: List[np.ndarray] = []
+
+    def add(self, keys: pa.Table):
+        h = np.zeros(keys.num_rows, dtype=np.uint64)
+        for column in keys.columns:
+            h = _mix(h, _key_hashes(column.combine_chunks()))
+        self.hashes.append(h)
+
+    def duplicates(self) -> int:
+        h = np.sort(np.concatenate(self.hashes)) if self.hashes else np.empty(0, dtype=np.uint64)
+        return int((h[1:] == h[:-1]).sum())
+
+
+def check_foreign_key(report: ValidationReport, child: str, column: str, parent: str, seen: pa.Array, allowed: pa.Array):
+    orphans = pc.filter(seen, pc.invert(pc.is_in(seen, value_set=allowed.cast(seen.type))))
+    if len(orphans):
+        report.add(child, "foreign key", f"{len(orphans):,} {column} value(s) missing from {parent}, e.g. {orphans[0].as_py()}")
+
+
+def bay_facility_mismatches(facts: pa.Table, bays: pa.Table) -> int:
+    """Rows whose facility_id is not the facility their bay belongs to (session -> bay -> facility)"""
+    position = pc.index_in(_plain(facts["bay_id"]), value_set=_plain(bays["bay_id"]).combine_chunks())
+    expected = pc.take(_plain(bays["facility_id"]), position)
+    return pc.sum(pc.not_equal(_plain(facts["facility_id"]), expected)).as_py() or 0
+
+
+def hole_totals(holes: pa.Table) -> pa.Table:
+    """Strokes summed and hole scores counted per scorecard"""
+    return pa.table({"scorecard_id": _plain(holes["scorecard_id"]), "strokes": holes["strokes"]}).group_by(
+        "scorecard_id"
+    ).aggregate([("strokes", "sum"), ("strokes", "count")])
+
+
+def check_scorecard_holes(report: ValidationReport, scorecards: pa.Table, totals: pa.Table):
+    """Each scorecard has holes_played hole scores whose strokes add up to total_strokes.
+
+    totals may hold several partial rows per scorecard (one per block of hole scores).
+    """
+    totals = totals.group_by("scorecard_id").aggregate([("strokes_sum", "sum"), ("strokes_count", "sum")])
+    cards = pa.table({
+        "scorecard_id": _plain(scorecards["scorecard_id"]),
+        "holes_played": scorecards["holes_played"],
+        "total_strokes": scorecards["total_strokes"],
+    })
+    joined = cards.join(totals, "scorecard_id", join_type="left outer")
+    bad_count = pc.sum(pc.not_equal(pc.fill_null(joined["strokes_count_sum"], 0), joined["holes_played"])).as_py() or 0
+    bad_total = pc.sum(pc.not_equal(pc.fill_null(joined["strokes_sum_sum"], 0), joined["total_strokes"])).as_py() or 0
+    if bad_count:
+        report.add("fact_scorecards", "scorecard -> hole scores", "hole score count differs from holes_played", bad_count)
+    if bad_total:
+        report.add("fact_scorecards", "scorecard -> hole scores", "summed hole strokes differ from total_strokes", bad_total)
+
+
+# Tables kept whole (just these columns) for the row-level cross checks; both are
+# small next to the fact tables checked against them
+ROW_CHECK_COLUMNS = {
+    "dim_bays": ["bay_id", "facility_id"],
+    "fact_scorecards": ["scorecard_id", "holes_played", "total_strokes"],
+}
+BAY_FACILITY_TABLES = ["fact_sessions", "fact_bay_bookings"]
+
+
+def _blocks(batches: Iterable[pa.RecordBatch], rows: int) -> Iterator[pa.Table]:
+    """Regroup scanner batches into tables of at least rows rows.
+
+    Date (and facility) partitioning can leave thousands of small files, and the
+    per-call overhead of the compute kernels would otherwise dominate.
+    """
+    pending, size = [], 0
+    for batch in batches:
+        pending.append(batch)
+        size += batch.num_rows
+        if size >= rows:
+            yield pa.Table.from_batches(pending).unify_dictionaries().combine_chunks()
+            pending, size = [], 0
+    if pending:
+        yield pa.Table.from_batches(pending).unify_dictionaries().combine_chunks()
+
+
+def validate_output(output_dir: Path, tables: Optional[List[str]] = None, batch_rows: int = BATCH_ROWS) -> ValidationReport:
+    """Validate the tables written under output_dir (all of SCHEMAS by default).
+
+    Each table is scanned once, in blocks of batch_rows, for its declared columns.
+    Per block it feeds the column checks, a hash per primary key, the distinct
+    values of its foreign-key columns and the bay -> facility and hole score
+    checks, so memory stays bounded by the distinct keys rather than the rows.
+    SCHEMAS lists parents before children, so a child's checks can use them directly.
+    """
+    started = time.perf_counter()
+    report = ValidationReport()
+    referenced = {(parent, column) for _, _, parent, column in FOREIGN_KEYS}
+    referenced |= {(child, column) for child, column, _, _ in FOREIGN_KEYS}
+    distinct: Dict[Tuple[str, str], List[pa.Array]] = {}
+    kept: Dict[str, pa.Table] = {}
+    partial_totals: List[pa.Table] = []
+    mismatches = {}
+
+    for table in tables or list(SCHEMAS):
+        dataset = open_table(output_dir, table)
+        if dataset is None:
+            report.add(table, "missing table", f"no output under {output_dir}")
+            continue
+        usable = check_schema(report, table, dataset.schema)
+        names = dataset.schema.names
+        primary = PRIMARY_KEYS[table] if set(PRIMARY_KEYS[table]) <= set(names) else []
+        tracked = [c for c in names if (table, c) in referenced]
+        row_columns = [c for c in ROW_CHECK_COLUMNS.get(table, []) if c in names]
+        wanted = list(dict.fromkeys(usable + primary + tracked + row_columns))
+        keys = KeyTracker()
+        rows = []
+        for column in tracked:
+            distinct[table, column] = []
+        if table in BAY_FACILITY_TABLES and "dim_bays" in kept and {"bay_id", "facility_id"} <= set(names):
+            mismatches[table] = 0
+
+        def scan():
+            for block in _blocks(dataset.to_batches(columns=wanted, **SCAN_READAHEAD), batch_rows):
+                if primary:
+                    keys.add(block.select(primary))
+                for column in tracked:
+                    distinct[table, column].append(_distinct(block[column]))
+                if row_columns:
+                    rows.append(block.select(row_columns))
+                if table in mismatches:
+                    mismatches[table] += bay_facility_mismatches(block, kept["dim_bays"])
+                if table == "fact_hole_scores" and {"scorecard_id", "strokes"} <= set(block.column_names):
+                    partial_totals.append(hole_totals(block))
+                yield block
+
+        report.rows[table] = check_values(report, table, scan(), usable)
+        duplicates = keys.duplicates() if primary else 0
+        if duplicates:
+            report.add(table, "primary key", f"{', '.join(primary)} not unique", duplicates)
+        if row_columns:
+            kept[table] = pa.concat_tables(rows).unify_dictionaries() if rows else dataset.schema.empty_table().select(row_columns)
+        if mismatches.get(table):
+            report.add(table, "bay -> facility", "facility_id differs from the bay's facility", mismatches[table])
+
+    for key, parts in distinct.items():
+        distinct[key] = pc.unique(pa.chunked_array(parts)) if parts else pa.array([])
+    for child, column, parent, parent_column in FOREIGN_KEYS:
+        seen, allowed = distinct.get((child, column)), distinct.get((parent, parent_column))
+        if seen is not None and allowed is not None:
+            check_foreign_key(report, child, column, parent, seen, allowed)
+    if "fact_scorecards" in kept and partial_totals:
+        check_scorecard_holes(report, kept["fact_scorecards"], pa.concat_tables(partial_totals))
+
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Validate generated Trackman tables before upload")
+    parser.add_argument("output_dir", type=Path, help="Directory holding dimensions/ and facts/ from a generator run")
+    parser.add_argument("--tables", nargs="+", choices=list(SCHEMAS), help="Only validate these tables")
+    parser.add_argument("--batch-rows", type=int, default=BATCH_ROWS, help="Rows per record batch for the column checks")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    print(f"Validating {args.output_dir}...")
+    report = validate_output(args.output_dir, args.tables, args.batch_rows)
+    report.print_summary()
+    sys.exit(0 if report.ok else 1)
+
+
+if __name__ == "__main__":
+    main()
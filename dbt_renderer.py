@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Compile the trackman_dbt models in process
+Renders each model with Jinja, giving it dbt's ref(), source(), this, config() and
+is_incremental(), plus any macros under the project's macro-paths. Schemas and
+materializations come from dbt_project.yml and sources from the models' .yml files.
+Relations resolve to TRACKMAN_DW.<SCHEMA>.<NAME>. Compiled SQL is cached per model
+and incremental flag, and Jinja bytecode is cached under target/, so deploying
+needs no dbt compile subprocess.
+"""
+import argparse
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import yaml
+
+PROJECT_DIR = Path(__file__).parent / "trackman_dbt"
+DATABASE = "TRACKMAN_DW"
+DEFAULT_SCHEMA = "PUBLIC"
+
+
+class Relation:
+    """A database object as dbt templates see it; renders as DATABASE.SCHEMA.IDENTIFIER"""
+
+    def __init__(self, database: str, schema: str, identifier: str):
+        self.database = database
+        self.schema = schema
+        self.identifier = identifier
+
+    def __str__(self) -> str:
+        return f"{self.database}.{self.schema}.{self.identifier}"
+
+
+class ModelNode:
+    """One model file: its project config merged with its own config() call, and what it refs"""
+
+    def __init__(self, name: str, template: str, layer: str, project_config: Dict[str, Any]):
+        self.name = name
+        self.template = template  # path relative to its model-path, as the Jinja loader names it
+        self.layer = layer
+        self.config = dict(project_config)
+        self.depends_on: Set[str] = set()
+        self.sources: Set[Tuple[str, str]] = set()
+
+    @property
+    def schema(self) -> str:
+        return str(self.config.get("schema") or DEFAULT_SCHEMA).upper()
+
+    @property
+    def materialized(self) -> str:
+        return self.config.get("materialized", "view")
+
+
+class ModelConfig:
+    """The config global: config(...) records settings on the model being rendered, config.get reads them"""
+
+    def __init__(self, project: "DbtProject"):
+        self._project = project
+
+    def __call__(self, **kwargs) -> str:
+        self._project._active_node().config.update(kwargs)
+        return ""
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._project._active_node().config.get(key, default)
+
+
+def project_config(models_config: Dict[str, Any], parts: List[str]) -> Dict[str, Any]:
+    """The +settings of dbt_project.yml that apply to a model in the directory parts, innermost last"""
+    config, level = {}, models_config
+    for part in [None] + parts:
+        if part is not None:
+            level = level.get(part)
+            if not isinstance(level, dict):
+                break
+        config.update({key[1:]: value for key, value in level.items() if key.startswith("+")})
+    return config
+
+
+class DbtProject:
+    """A dbt project parsed and rendered without dbt itself"""
+
+    def __init__(self, project_dir: Path = PROJECT_DIR, database: str = DATABASE):
+        import jinja2
+
+        self.project_dir = project_dir
+        self.database = database
+        self.settings = yaml.safe_load((project_dir / "dbt_project.yml").read_text())
+        model_dirs = [project_dir / p for p in self.settings.get("model-paths", ["models"])]
+        cache_dir = project_dir / self.settings.get("target-path", "target") / "jinja_cache"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self.env = jinja2.Environment(
+            loader=jinja2.FileSystemLoader([str(d) for d in model_dirs]),
+            bytecode_cache=jinja2.FileSystemBytecodeCache(str(cache_dir)),
+            undefined=jinja2.StrictUndefined,
+            keep_trailing_newline=True,
+        )
+        self._lock = threading.RLock()
+        self._active: List[Tuple[ModelNode, bool]] = []
+        self._compiled: Dict[Tuple[str, bool], str] = {}
+        self.env.globals.update(
+            ref=self._ref,
+            source=self._source,
+            config=ModelConfig(self),
+            is_incremental=lambda: self._active[-1][1],
+        )
+        self.source_meta: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.sources = self._load_sources(model_dirs)
+        self._load_macros()
+        self.nodes = self._load_nodes(model_dirs)
+
+    def _load_sources(self, model_dirs: List[Path]) -> Dict[Tuple[str, str], Relation]:
+        sources = {}
+        for model_dir in model_dirs:
+            for path in sorted(model_dir.rglob("*.yml")):
+                for source in (yaml.safe_load(path.read_text()) or {}).get("sources", []):
+                    for table in source.get("tables", []):
+                        sources[(source["name"], table["name"])] = Relation(
+                            source.get("database", self.database),
+                            str(source.get("schema", source["name"])).upper(),
+                            str(table.get("identifier", table["name"])).upper(),
+                        )
+                        self.source_meta[(source["name"], table["name"])] = table.get("meta") or {}
+        return sources
+
+    def _load_macros(self):
+        """Make every {% macro %} under the macro-paths callable from models, as dbt does"""
+        for macro_path in self.settings.get("macro-paths", ["macros"]):
+            for path in sorted((self.project_dir / macro_path).rglob("*.sql")):
+                module = self.env.from_string(path.read_text()).module
+                self.env.globals.update(
+                    {name: getattr(module, name) for name in dir(module) if not name.startswith("_")}
+                )
+
+    def _load_nodes(self, model_dirs: List[Path]) -> Dict[str, ModelNode]:
+        """Every model, its config() and refs recorded by rendering it with is_incremental() both ways"""
+        models_config = self.settings.get("models", {}).get(self.settings["name"], {})
+        nodes = {}
+        for model_dir in model_dirs:
+            for path in sorted(model_dir.rglob("*.sql")):
+                parts = list(path.relative_to(model_dir).parent.parts)
+                if path.stem in nodes:
+                    raise ValueError(f"Two models named {path.stem}: {nodes[path.stem].template} and {path}")
+                nodes[path.stem] = ModelNode(
+                    path.stem, path.relative_to(model_dir).as_posix(), parts[0] if parts else "",
+                    project_config(models_config, parts),
+                )
+        self.nodes = nodes
+        for node in nodes.values():
+            for incremental in (False, True):
+                self.compile(node.name, incremental)
+        # Parse-time SQL may have resolved refs before a later model's config() set its schema
+        self._compiled.clear()
+        return nodes
+
+    def _active_node(self) -> ModelNode:
+        return self._active[-1][0]
+
+    def _ref(self, *args: str) -> Relation:
+        name = args[-1]  # ref('model') or ref('package', 'model')
+        self._active_node().depends_on.add(name)
+        if name in self.nodes:
+            return self.relation(name)
+        return Relation(self.database, DEFAULT_SCHEMA, name.upper())
+
+    def _source(self, source_name: str, table_name: str) -> Relation:
+        if (source_name, table_name) not in self.sources:
+            raise ValueError(f"{self._active_node().name} uses unknown source('{source_name}', '{table_name}')")
+        self._active_node().sources.add((source_name, table_name))
+        return self.sources[(source_name, table_name)]
+
+    def relation(self, name: str) -> Relation:
+        node = self.nodes[name]
+        return Relation(self.database, node.schema, name.upper())
+
+    def compile(self, name: str, incremental: bool = False) -> str:
+        """The model's SQL with every Jinja expression rendered; is_incremental() returns incremental"""
+        key = (name, incremental)
+        if key not in self._compiled:
+            node = self.nodes[name]
+            with self._lock:
+                self._active.append((node, incremental))
+                try:
+                    sql = self.env.get_template(node.template).render(this=self.relation(name))
+                finally:
+                    self._active.pop()
+            self._compiled[key] = sql
+        return self._compiled[key]
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Print the trackman_dbt models compiled in process")
+    parser.add_argument("models", nargs="*", help="Models to print (default: all)")
+    parser.add_argument("--project-dir", type=Path, default=PROJECT_DIR, help="Directory holding dbt_project.yml")
+    parser.add_argument("--incremental", action="store_true", help="Render with is_incremental() true")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    project = DbtProject(args.project_dir)
+    for name in args.models or list(project.nodes):
+        node = project.nodes[name]
+        print(f"-- {project.relation(name)} ({node.materialized}, refs: {', '.join(sorted(node.depends_on)) or 'none'})")
+        print(project.compile(name, args.incremental).strip() + "\n")
+
+
+if __name__ == "__main__":
+    main()
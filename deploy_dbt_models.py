@@ -1,109 +1,833 @@
 #!/usr/bin/env python3
 """
 Deploy dbt models to Snowflake manually
-This script creates views and tables in the correct order: bronze -> silver -> gold
+Compiles the models in process (dbt_renderer) and creates each view or table as soon
+as everything it ref()s exists. Statements are submitted asynchronously and polled by
+query ID, so independent models run concurrently; ready views go out together as one
+multi-statement query. Query IDs and per-model timings are written to a run report.
+--duckdb runs the same deployment against a local DuckDB database over the
+generator's Parquet output, for testing without Snowflake.
+
+Incremental models (materialized='incremental') are created on the first deploy and
+afterwards MERGEd on their unique_key with only the rows their is_incremental() filter
+selects; --full-refresh rebuilds them from scratch.
+
+A manifest per target records the version of each deployed model, a hash of its
+rendered SQL, the files it reads from the stage and its parents' versions. Models whose
+version is unchanged and whose relation still exists are skipped. Editing one model
+redeploys only it and its downstream models (dbt's state:modified+), and new files in
+the stage redeploy the external source reading them, merge into the incremental models
+above it and rebuild what depends on those; --all deploys every model.
 """
+import argparse
+import collections
+import hashlib
+import itertools
+import json
 import os
+import queue
+import re
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from pathlib import Path
-import snowflake.connector
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from dbt_renderer import DATABASE, PROJECT_DIR, DbtProject
 
-# Connect to Snowflake
-conn = snowflake.connector.connect(
-    connection_name=os.getenv("SNOWFLAKE_CONNECTION_NAME") or "DEMO_USWEST"
+PROJECT_ROOT = Path(__file__).parent
+# Statement kind -> how a successful one is logged
+ACTIONS = {"create": "Created", "merge": "Merged into", "append": "Appended to", "stage": "Staged"}
+DEFAULT_WORKERS = 4
+DEFAULT_BATCH_SIZE = 50
+STAGE = f"{DATABASE}.PUBLIC.S3_SOURCE"
+PARQUET_FORMAT = f"(format_name = '{DATABASE}.STAGING.PARQUET_FORMAT')"  # decodes logical types, as the dim models' scans do
+# Seconds between query status checks: the first wait, doubling up to the longest
+POLL_SECONDS = (0.05, 1.0)
+MANIFEST_PATH = PROJECT_DIR / "target" / "deploy_manifest.json"
+RUN_REPORT_PATH = PROJECT_DIR / "target" / "deploy_run_report.json"
+print_lock = threading.Lock()
+
+STAGE_PATTERN = re.compile(r"FROM\s+@[\w.]+?S3_SOURCE/(\S+)\s*\(FILE_FORMAT\s*=>[^)]*\)", re.IGNORECASE)
+EXTERNAL_TABLE_PATTERN = re.compile(
+    r"CREATE OR REPLACE EXTERNAL TABLE (\S+).*?LOCATION = @[\w.]+?S3_SOURCE/(\S+)\s.*", re.DOTALL
 )
+# Type and columns of every existing table and view in the warehouse, in table order;
+# information_schema is TRACKMAN_DW.INFORMATION_SCHEMA on Snowflake and the global
+# information_schema on DuckDB
+EXISTING_RELATIONS_QUERY = """
+    SELECT c.table_schema, c.table_name, t.table_type, c.column_name
+    FROM {information_schema}.columns c
+    JOIN {information_schema}.tables t
+      ON t.table_catalog = c.table_catalog AND t.table_schema = c.table_schema AND t.table_name = c.table_name
+    WHERE c.table_catalog = '{database}'
+    ORDER BY c.table_schema, c.table_name, c.ordinal_position
+"""
+# information_schema table_type -> the object type models are created as
+RELATION_KINDS = {"BASE TABLE": "TABLE", "VIEW": "VIEW"}
 
-def execute_sql(sql, model_name):
-    """Execute SQL and handle errors"""
-    try:
+
+class Model:
+    """One compiled dbt model: its layer, the relation it creates and the models it ref()s"""
+
+    def __init__(self, project: DbtProject, name: str):
+        node = project.nodes[name]
+        self.project = project
+        self.name = name
+        self.layer = node.layer
+        self.schema = node.schema
+        self.config = node.config
+        self.materialized = node.materialized
+        self.kind = "VIEW" if self.materialized == "view" else "TABLE"
+        self.depends_on = set(node.depends_on)
+        self.relation = str(project.relation(name))
+
+    @property
+    def unique_key(self) -> List[str]:
+        key = self.config.get("unique_key") or []
+        return [key] if isinstance(key, str) else list(key)
+
+
+class SourceModel:
+    """A source() with an external_location in its meta, deployed as an external table ahead of its models.
+
+    Partition columns declared in the meta are computed from METADATA$FILENAME, so
+    filters on them (the silver date watermarks) prune stage files.
+    """
+
+    layer = "source"
+    materialized = "external"
+    unique_key: List[str] = []
+
+    def __init__(self, project: DbtProject, source: Tuple[str, str], kind: str = "EXTERNAL TABLE"):
+        relation = project.sources[source]
+        self.project = project
+        self.name = ".".join(source)
+        self.schema = relation.schema
+        self.config = project.source_meta[source]
+        self.kind = kind
+        self.depends_on: set = set()
+        self.relation = str(relation)
+
+
+class ModelResult:
+    def __init__(
+        self, name: str, status: str, seconds: float = 0.0, error: Optional[str] = None,
+        action: str = "create", query_id: Optional[str] = None,
+    ):
+        self.name = name
+        self.status = status  # success, error, skipped or unchanged
+        self.action = action  # create, merge or append
+        self.seconds = seconds
+        self.error = error
+        self.query_id = query_id
+
+
+def load_models(project_dir: Path = PROJECT_DIR, source_kind: str = "EXTERNAL TABLE") -> Dict[str, Model]:
+    """Every model in the dbt project plus the external sources they use, checked for unknown refs and cycles.
+
+    source_kind is what external sources appear as in information_schema on the target.
+    """
+    project = DbtProject(project_dir, DATABASE)
+    models = {name: Model(project, name) for name in project.nodes}
+    used = sorted({source for node in project.nodes.values() for source in node.sources})
+    for source in used:
+        if project.source_meta[source].get("external_location"):
+            source_model = SourceModel(project, source, source_kind)
+            models[source_model.name] = source_model
+            for node in project.nodes.values():
+                if source in node.sources:
+                    models[node.name].depends_on.add(source_model.name)
+    for model in models.values():
+        unknown = model.depends_on - models.keys()
+        if unknown:
+            raise ValueError(f"{model.name} refs unknown model(s): {', '.join(sorted(unknown))}")
+    topological_order(models)
+    return models
+
+
+def topological_order(models: Dict[str, Model]) -> List[str]:
+    """Model names with every model after the ones it refs; raises on a ref cycle"""
+    order, state = [], {}
+
+    def visit(name: str, trail: Tuple[str, ...]):
+        if state.get(name) == "done":
+            return
+        if state.get(name) == "visiting":
+            raise ValueError(f"ref() cycle: {' -> '.join(trail + (name,))}")
+        state[name] = "visiting"
+        for parent in sorted(models[name].depends_on):
+            visit(parent, trail + (name,))
+        state[name] = "done"
+        order.append(name)
+
+    for name in models:
+        visit(name, ())
+    return order
+
+
+def stage_paths(model: Model) -> List[str]:
+    """Paths under the S3_SOURCE stage the model reads directly: its external location or the stage scans in its SQL"""
+    if model.materialized == "external":
+        return [model.config["external_location"].lstrip("@").partition("/")[2]]
+    return sorted(set(STAGE_PATTERN.findall(model.project.compile(model.name))))
+
+
+def local_stage_state(stage_root: Path, paths: List[str]) -> Dict[str, str]:
+    """Hash of the name, size and modification time of every file under each path of a local stage"""
+    state = {}
+    for path in paths:
+        root = stage_root / path
+        files = sorted(root.rglob("*.parquet")) if root.is_dir() else [root] if root.exists() else []
+        listing = [(str(f.relative_to(stage_root)), f.stat().st_size, f.stat().st_mtime_ns) for f in files]
+        state[path] = hashlib.sha256(json.dumps(listing).encode()).hexdigest()[:16]
+    return state
+
+
+def snowflake_stage_state(submitter: Any, paths: List[str]) -> Dict[str, str]:
+    """Hash of the LIST output (name, size, md5, last modified) of each stage path, in one multi-statement query"""
+    if not paths:
+        return {}
+    state = {}
+    with submitter.connection() as conn:
         cursor = conn.cursor()
-        cursor.execute(sql)
-        print(f"✓ Created {model_name}")
-        return True
-    except Exception as e:
-        print(f"✗ Failed to create {model_name}: {str(e)}")
-        return False
-    finally:
-        cursor.close()
+        cursor.execute(";\n".join(f"LIST @{STAGE}/{path}" for path in paths), num_statements=len(paths))
+        for i, path in enumerate(paths):
+            if i:
+                cursor.nextset()
+            listing = sorted([str(value) for value in row[:4]] for row in cursor.fetchall())
+            state[path] = hashlib.sha256(json.dumps(listing).encode()).hexdigest()[:16]
+    return state
 
-def deploy_bronze_models():
-    """Deploy bronze layer views"""
-    print("\n" + "="*50)
-    print("BRONZE LAYER - Creating Views")
-    print("="*50)
-    
-    bronze_dir = Path("/Users/ulasbulut/Desktop/CoCo/Trackman/trackman_dbt/models/bronze")
-    for sql_file in sorted(bronze_dir.glob("*.sql")):
-        model_name = sql_file.stem
-        with open(sql_file, 'r') as f:
-            sql_content = f.read()
-        
-        create_view_sql = f"""
-        CREATE OR REPLACE VIEW TRACKMAN_DW.BRONZE.{model_name.upper()} AS
-        {sql_content}
+
+def external_table_statement(source: SourceModel) -> str:
+    """Snowflake external table over the source's stage location, partitioned as its meta declares"""
+    meta = source.config
+    location = meta["external_location"]
+    stage, _, path = location.lstrip("@").partition("/")
+    if "." not in stage:
+        stage = f"{DATABASE}.{source.schema}.{stage}"
+    partitions = meta.get("partitions", [])
+    columns = ",\n            ".join(f"{p['name']} {p['data_type']} AS ({p['expression']})" for p in partitions)
+    partition_by = f"PARTITION BY ({', '.join(p['name'] for p in partitions)})" if partitions else ""
+    return f"""
+        CREATE OR REPLACE EXTERNAL TABLE {source.relation} (
+            {columns}
+        )
+        {partition_by}
+        LOCATION = @{stage}/{path}
+        FILE_FORMAT = {meta.get("file_format", PARQUET_FORMAT)}
+        PATTERN = '.*[.]parquet'
+        AUTO_REFRESH = FALSE
         """
-        execute_sql(create_view_sql, f"BRONZE.{model_name}")
 
-def deploy_silver_models():
-    """Deploy silver layer tables"""
-    print("\n" + "="*50)
-    print("SILVER LAYER - Creating Tables")
-    print("="*50)
-    
-    silver_dir = Path("/Users/ulasbulut/Desktop/CoCo/Trackman/trackman_dbt/models/silver")
-    for sql_file in sorted(silver_dir.glob("*.sql")):
-        model_name = sql_file.stem
-        with open(sql_file, 'r') as f:
-            sql_content = f.read()
-        
-        # Remove dbt config blocks
-        import re
-        sql_content = re.sub(r'\{\{[^}]*config\([^}]*\)[^}]*\}\}', '', sql_content, flags=re.DOTALL)
-        
-        # Remove incremental blocks (we're doing full refresh)
-        sql_content = re.sub(r'\{\%\s*if\s+is_incremental\(\).*?\{\%\s*endif\s*\%\}', '', sql_content, flags=re.DOTALL)
-        
-        # Replace dbt ref() with actual table references
-        sql_content = sql_content.replace("{{ ref('", "TRACKMAN_DW.BRONZE.")
-        sql_content = sql_content.replace("') }}", "")
-        
-        create_table_sql = f"""
-        CREATE OR REPLACE TABLE TRACKMAN_DW.SILVER.{model_name.upper()} AS
-        {sql_content}
+
+def model_sql(model: Model) -> str:
+    """Everything the model's deployed definition depends on: its SQL with is_incremental() true, or its external table DDL"""
+    if model.materialized == "external":
+        return external_table_statement(model)
+    return model.project.compile(model.name, incremental=True)
+
+
+def create_statement(model: Model) -> str:
+    return f"""
+        CREATE OR REPLACE {model.kind} {model.relation} AS
+        {model.project.compile(model.name)}
+        """
+
+
+def merge_statement(model: Model, columns: List[str]) -> str:
+    """Write the model's incremental rows into its existing table.
+
+    With a unique_key, rows matching an existing key update it and the rest are
+    inserted; without one they are appended. columns are the target table's. When
+    every column is part of the key a match has nothing to update, so matched rows
+    are left alone.
+    """
+    source = model.project.compile(model.name, incremental=True)
+    column_list = ", ".join(columns)
+    if not model.unique_key:
+        return f"""
+        INSERT INTO {model.relation} ({column_list})
+        SELECT {column_list} FROM ({source}) AS source
+        """
+    keys = {key.upper() for key in model.unique_key}
+    on = " AND ".join(f"target.{key} = source.{key}" for key in model.unique_key)
+    updates = ", ".join(f"{column} = source.{column}" for column in columns if column.upper() not in keys)
+    when_matched = f"WHEN MATCHED THEN UPDATE SET {updates}" if updates else ""
+    values = ", ".join(f"source.{column}" for column in columns)
+    return f"""
+        MERGE INTO {model.relation} AS target
+        USING ({source}) AS source
+        ON {on}
+        {when_matched}
+        WHEN NOT MATCHED THEN INSERT ({column_list}) VALUES ({values})
         """
-        execute_sql(create_table_sql, f"SILVER.{model_name}")
 
-def deploy_gold_models():
-    """Deploy gold layer tables"""
+
+def plan_statement(
+    model: Model, existing: Dict[str, Tuple[str, List[str]]], full_refresh: bool = False,
+) -> Tuple[str, str]:
+    """(action, SQL) for one model: incremental models merge into their table once it exists"""
+    if model.materialized == "external":
+        return "stage", external_table_statement(model)
+    kind, columns = existing.get(model.relation, (None, []))
+    if model.materialized != "incremental" or full_refresh or kind != "TABLE":
+        return "create", create_statement(model)
+    return ("merge" if model.unique_key else "append"), merge_statement(model, columns)
+
+
+def model_versions(models: Dict[str, Model], render: Callable[[Model], str]) -> Dict[str, str]:
+    """Version of each model: a hash of its config, render(model) and the versions of the models it refs.
+
+    render covers the model's SQL and the state of the stage files it reads. A change
+    to either therefore changes the version of everything downstream of it.
+    """
+    versions = {}
+    for name in topological_order(models):
+        model = models[name]
+        digest = hashlib.sha256(json.dumps(model.config, sort_keys=True, default=str).encode())
+        digest.update(render(model).encode())
+        for parent in sorted(model.depends_on):
+            digest.update(f"{parent}={versions[parent]}".encode())
+        versions[name] = digest.hexdigest()[:16]
+    return versions
+
+
+def load_manifest(path: Path, target: str) -> Dict[str, Dict[str, Any]]:
+    """Model name -> manifest entry of the last successful deploy of each model to target"""
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text()).get("targets", {}).get(target, {})
+
+
+def save_manifest(path: Path, target: str, entries: Dict[str, Dict[str, Any]]):
+    manifest = json.loads(path.read_text()) if path.exists() else {"targets": {}}
+    manifest.setdefault("targets", {})[target] = entries
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+    tmp.replace(path)
+
+
+def modified_models(
+    models: Dict[str, Model],
+    versions: Dict[str, str],
+    manifest: Dict[str, Dict[str, Any]],
+    existing: Dict[str, Tuple[str, List[str]]],
+) -> List[str]:
+    """Models to deploy: any whose version differs from the manifest's or whose relation is missing"""
+    return [
+        name for name, model in models.items()
+        if manifest.get(name, {}).get("version") != versions[name]
+        or existing.get(model.relation, (None, []))[0] != model.kind
+    ]
+
+
+def update_manifest(
+    manifest: Dict[str, Dict[str, Any]],
+    models: Dict[str, Model],
+    versions: Dict[str, str],
+    results: Dict[str, ModelResult],
+) -> Dict[str, Dict[str, Any]]:
+    """The manifest after a deploy: deployed models get their new version, failed or skipped ones are dropped"""
+    entries = {name: entry for name, entry in manifest.items() if name in models}
+    deployed_at = time.strftime("%Y-%m-%dT%H:%M:%S%z")
+    for name, result in results.items():
+        if result.status == "success":
+            entries[name] = {
+                "version": versions[name],
+                "upstream": {parent: versions[parent] for parent in sorted(models[name].depends_on)},
+                "relation": models[name].relation,
+                "deployed_at": deployed_at,
+            }
+        elif result.status != "unchanged":
+            entries.pop(name, None)
+    return entries
+
+
+def duckdb_dialect(sql: str, stage_root: Path) -> str:
+    """Rewrite the Snowflake-only parts of a statement for DuckDB.
+
+    Stage scans become read_parquet over the same path under stage_root (a
+    directory's files at any depth, so date partitions are included). External
+    tables become views reading the path with hive partitioning, which derives the
+    partition columns from the directory names and prunes files filtered on them.
+    $1:col and value:col become col and CURRENT_TIMESTAMP() loses its parentheses.
+    """
+    def files(path: str) -> Path:
+        return stage_root / path / "**" / "*.parquet" if path.endswith("/") else stage_root / path
+
+    def scan(match):
+        return f"FROM read_parquet('{files(match.group(1))}', union_by_name = true, hive_partitioning = false)"
+
+    def external_table(match):
+        return (
+            f"CREATE OR REPLACE VIEW {match.group(1)} AS SELECT * "
+            f"FROM read_parquet('{files(match.group(2))}', union_by_name = true, hive_partitioning = true)"
+        )
+
+    sql = EXTERNAL_TABLE_PATTERN.sub(external_table, sql)
+    sql = STAGE_PATTERN.sub(scan, sql)
+    sql = re.sub(r"(?:\$1|\bvalue):(\w+)", r"\1", sql)
+    return sql.replace("CURRENT_TIMESTAMP()", "CURRENT_TIMESTAMP")
+
+
+def snowflake_connector() -> Callable[[], Any]:
+    import snowflake.connector
+
+    connection_name = os.getenv("SNOWFLAKE_CONNECTION_NAME") or "DEMO_USWEST"
+    return lambda: snowflake.connector.connect(connection_name=connection_name)
+
+
+def duckdb_connector(database: str, schemas: List[str]) -> Callable[[], Any]:
+    """Connections to one DuckDB instance with TRACKMAN_DW attached and the model schemas created"""
+    import duckdb
+
+    root = duckdb.connect()
+    root.execute(f"ATTACH '{database}' AS {DATABASE}")
+    for schema in schemas:
+        root.execute(f"CREATE SCHEMA IF NOT EXISTS {DATABASE}.{schema}")
+    return root.cursor
+
+
+class Statement:
+    """One model's DDL or DML, as handed to a submitter"""
+
+    def __init__(self, model: Model, action: str, sql: str):
+        self.model = model
+        self.action = action
+        self.sql = sql
+
+    @property
+    def label(self) -> str:
+        return f"{self.model.schema}.{self.model.name}"
+
+
+class SnowflakeSubmitter:
+    """Statements sent with execute_async on one connection and polled by query ID.
+
+    A batch of several statements goes out as one multi-statement query, so it
+    costs one round trip. If a batch fails its statements are resubmitted one by
+    one, which tells the failing model apart from the ones that ran before it;
+    they wait their turn so no more than workers queries run at once.
+    """
+
+    def __init__(self, connect: Callable[[], Any], workers: int = DEFAULT_WORKERS):
+        self._conn = connect()
+        self._workers = workers
+        self._in_flight: Dict[str, Tuple[List[Statement], float]] = {}
+        self._retries: List[Statement] = []
+        self._poll_seconds = POLL_SECONDS[0]
+        self.round_trips = 0
+
+    @contextmanager
+    def connection(self):
+        yield self._conn
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight) + len(self._retries)
+
+    def submit(self, batch: List[Statement]) -> str:
+        cursor = self._conn.cursor()
+        if len(batch) == 1:
+            cursor.execute_async(batch[0].sql)
+        else:
+            cursor.execute_async(";\n".join(s.sql for s in batch), num_statements=len(batch))
+        self.round_trips += 1
+        self._in_flight[cursor.sfqid] = (batch, time.perf_counter())
+        return cursor.sfqid
+
+    def _child_query_ids(self, query_id: str, count: int) -> List[str]:
+        """Query IDs of a multi-statement query's statements, or the parent's ID if they can't be read"""
+        cursor = self._conn.cursor()
+        cursor.get_results_from_sfqid(query_id)
+        ids = [cursor.sfqid]  # the cursor starts on the first statement's result
+        while cursor.nextset():
+            ids.append(cursor.sfqid)
+        return ids if len(ids) == count else [query_id] * count
+
+    def poll(self) -> List[Tuple[Statement, ModelResult]]:
+        """Results of the queries that have finished, after waiting between status checks if none have"""
+        finished = []
+        for query_id, (batch, submitted) in list(self._in_flight.items()):
+            if self._conn.is_still_running(self._conn.get_query_status(query_id)):
+                continue
+            del self._in_flight[query_id]
+            seconds = time.perf_counter() - submitted
+            try:
+                self._conn.get_query_status_throw_if_error(query_id)
+            except Exception as e:
+                if len(batch) > 1:
+                    log(f"! Batch {query_id} of {len(batch)} statements failed; resubmitting them one by one")
+                    self._retries.extend(batch)
+                    continue
+                finished.append((batch[0], ModelResult(batch[0].model.name, "error", seconds, str(e), batch[0].action, query_id)))
+                continue
+            ids = self._child_query_ids(query_id, len(batch)) if len(batch) > 1 else [query_id]
+            for statement, statement_id in zip(batch, ids):
+                finished.append((statement, ModelResult(statement.model.name, "success", seconds, action=statement.action, query_id=statement_id)))
+        while self._retries and len(self._in_flight) < self._workers:
+            self.submit([self._retries.pop(0)])
+        if finished or not self._in_flight:
+            self._poll_seconds = POLL_SECONDS[0]
+        else:
+            time.sleep(self._poll_seconds)
+            self._poll_seconds = min(self._poll_seconds * 2, POLL_SECONDS[1])
+        return finished
+
+    def server_seconds(self, query_ids: List[str]) -> Dict[str, float]:
+        """Warehouse-side elapsed time of each query, from this session's query history"""
+        if not query_ids:
+            return {}
+        cursor = self._conn.cursor()
+        cursor.execute(
+            f"SELECT query_id, total_elapsed_time / 1000 FROM TABLE({DATABASE}.INFORMATION_SCHEMA.QUERY_HISTORY_BY_SESSION(RESULT_LIMIT => 10000))"
+            f" WHERE query_id IN ({', '.join(repr(q) for q in query_ids)})"
+        )
+        return {query_id: float(seconds) for query_id, seconds in cursor.fetchall()}
+
+    def close(self):
+        for query_id in self._in_flight:
+            self._conn.cursor().execute(f"SELECT SYSTEM$CANCEL_QUERY('{query_id}')")
+        self._conn.close()
+
+
+class ConnectionPool:
+    """A fixed set of open connections, each used by one worker thread at a time"""
+
+    def __init__(self, connect: Callable[[], Any], size: int):
+        self._connections = [connect() for _ in range(size)]
+        self._idle: "queue.Queue[Any]" = queue.Queue()
+        for conn in self._connections:
+            self._idle.put(conn)
+
+    @contextmanager
+    def connection(self):
+        conn = self._idle.get()
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+    def close(self):
+        for conn in self._connections:
+            conn.close()
+
+
+class ThreadedSubmitter:
+    """The SnowflakeSubmitter interface for connectors without async queries (DuckDB).
+
+    Each batch runs on a worker thread and pooled connection, one statement
+    after another, and gets a local query ID per statement.
+    """
+
+    def __init__(self, connect: Callable[[], Any], workers: int):
+        self._pool = ConnectionPool(connect, workers)
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._in_flight: Dict[Any, List[Statement]] = {}
+        self._query_ids = itertools.count(1)
+        self.round_trips = 0
+
+    def connection(self):
+        return self._pool.connection()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+    def _run(self, batch: List[Statement]) -> List[ModelResult]:
+        results = []
+        with self._pool.connection() as conn:
+            for statement in batch:
+                query_id = f"local-{next(self._query_ids):04d}"
+                started = time.perf_counter()
+                cursor = conn.cursor()
+                try:
+                    cursor.execute(statement.sql)
+                    status, error = "success", None
+                except Exception as e:
+                    status, error = "error", str(e)
+                finally:
+                    cursor.close()
+                seconds = time.perf_counter() - started
+                results.append(ModelResult(statement.model.name, status, seconds, error, statement.action, query_id))
+        return results
+
+    def submit(self, batch: List[Statement]) -> str:
+        future = self._executor.submit(self._run, batch)
+        self.round_trips += 1
+        self._in_flight[future] = batch
+        return f"batch-{self.round_trips}"
+
+    def poll(self) -> List[Tuple[Statement, ModelResult]]:
+        done, _ = wait(self._in_flight, return_when=FIRST_COMPLETED)
+        return [pair for future in done for pair in zip(self._in_flight.pop(future), future.result())]
+
+    def server_seconds(self, query_ids: List[str]) -> Dict[str, float]:
+        return {}
+
+    def close(self):
+        self._executor.shutdown()
+        self._pool.close()
+
+
+def existing_relations(submitter: Any, information_schema: str) -> Dict[str, Tuple[str, List[str]]]:
+    """Relation -> (TABLE or VIEW, column names) of everything already in the warehouse"""
+    with submitter.connection() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(EXISTING_RELATIONS_QUERY.format(information_schema=information_schema, database=DATABASE))
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+    relations: Dict[str, Tuple[str, List[str]]] = {}
+    for schema, table, table_type, column in rows:
+        relation = f"{DATABASE}.{schema.upper()}.{table.upper()}"
+        relations.setdefault(relation, (RELATION_KINDS.get(table_type, table_type), []))[1].append(column)
+    return relations
+
+
+def log(message: str):
+    """print() from worker threads without interleaving lines"""
+    with print_lock:
+        print(message, flush=True)
+
+
+def descendants(models: Dict[str, Model], name: str) -> List[str]:
+    children = [m.name for m in models.values() if name in m.depends_on]
+    return children + [d for child in children for d in descendants(models, child)]
+
+
+def submissions(statements: List[Statement], batch_size: int) -> List[List[Statement]]:
+    """Views and external tables (metadata-only DDL) grouped batch_size to a round trip;
+    tables and merges sent alone so they run concurrently"""
+    cheap = [s for s in statements if s.model.kind != "TABLE"]
+    batches = [cheap[i:i + batch_size] for i in range(0, len(cheap), batch_size)]
+    return batches + [[s] for s in statements if s.model.kind == "TABLE"]
+
+
+def deploy(
+    models: Dict[str, Model],
+    submitter: Any,
+    workers: int = DEFAULT_WORKERS,
+    statement: Callable[[Model], Tuple[str, str]] = lambda model: plan_statement(model, {}),
+    selected: Optional[List[str]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Dict[str, ModelResult]:
+    """Create every selected model (all by default), each once the models it refs are in place.
+
+    Ready models are submitted without waiting on each other, up to workers
+    queries in flight, and the submitter is polled for the ones that finish.
+    Unselected models count as already deployed. A failed model's downstream
+    models are skipped; independent branches carry on.
+    """
+    selected = set(models if selected is None else selected)
+    results = {name: ModelResult(name, "unchanged", action="none") for name in models if name not in selected}
+    waiting_on = {name: models[name].depends_on - results.keys() for name in selected}
+    queued: List[List[Statement]] = []
+
+    def submit_ready():
+        ready = sorted(n for n, deps in waiting_on.items() if not deps)
+        for name in ready:
+            del waiting_on[name]
+        queued.extend(submissions([Statement(models[n], *statement(models[n])) for n in ready], batch_size))
+        while queued and submitter.in_flight < workers:
+            batch = queued.pop(0)
+            handle = submitter.submit(batch)
+            if len(batch) > 1:
+                log(f"→ Submitted {len(batch)} statements as {handle}")
+
+    submit_ready()
+    while submitter.in_flight:
+        for stmt, result in submitter.poll():
+            name = stmt.model.name
+            results[name] = result
+            if result.status == "success":
+                log(f"✓ {ACTIONS[result.action]} {stmt.label} ({result.seconds:.2f}s, query {result.query_id})")
+                for deps in waiting_on.values():
+                    deps.discard(name)
+                continue
+            log(f"✗ Failed to {result.action} {stmt.label}: {result.error}")
+            for child in descendants(models, name):
+                if child in waiting_on:
+                    del waiting_on[child]
+                    results[child] = ModelResult(child, "skipped", error=f"upstream {name} failed")
+                    log(f"- Skipped {models[child].schema}.{child} (upstream {name} failed)")
+        submit_ready()
+    return results
+
+
+def critical_path(models: Dict[str, Model], results: Dict[str, ModelResult]) -> Tuple[List[str], float]:
+    """The chain of refs with the largest summed wall time, which bounds the run time at any worker count"""
+    finish, via = {}, {}
+    for name in topological_order(models):
+        parent = max(models[name].depends_on, key=finish.get, default=None)
+        finish[name] = results[name].seconds + (finish[parent] if parent else 0.0)
+        via[name] = parent
+    if not finish:
+        return [], 0.0
+    end = max(finish, key=finish.get)
+    total, path = finish[end], []
+    while end:
+        path.append(end)
+        end = via[end]
+    return path[::-1], total
+
+
+def apply_server_timings(submitter: Any, results: Dict[str, ModelResult]):
+    """Replace client-side timings with the warehouse's elapsed time where each model has its own query ID"""
+    counts = collections.Counter(r.query_id for r in results.values() if r.query_id)
+    try:
+        server = submitter.server_seconds([q for q, n in counts.items() if n == 1])
+    except Exception as e:
+        log(f"! Could not read query history, keeping client-side timings: {e}")
+        return
+    for result in results.values():
+        if result.query_id in server:
+            result.seconds = server[result.query_id]
+
+
+def write_run_report(
+    path: Path, target: str, models: Dict[str, Model], results: Dict[str, ModelResult],
+    wall_seconds: float, round_trips: int,
+):
+    """JSON record of the run: every model's action, status, query ID and timing"""
+    report = {
+        "target": target,
+        "finished_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "wall_seconds": round(wall_seconds, 3),
+        "round_trips": round_trips,
+        "models": [
+            {
+                "name": r.name, "relation": models[r.name].relation, "action": r.action, "status": r.status,
+                "query_id": r.query_id, "seconds": round(r.seconds, 3), "error": r.error,
+            }
+            for r in sorted(results.values(), key=lambda r: r.name)
+        ],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2) + "\n")
+
+
+def print_report(models: Dict[str, Model], results: Dict[str, ModelResult], wall_seconds: float, workers: int, round_trips: int):
     print("\n" + "="*50)
-    print("GOLD LAYER - Creating Tables")
+    print("MODEL TIMINGS")
     print("="*50)
-    
-    gold_dir = Path("/Users/ulasbulut/Desktop/CoCo/Trackman/trackman_dbt/models/gold")
-    for sql_file in sorted(gold_dir.glob("*.sql")):
-        model_name = sql_file.stem
-        with open(sql_file, 'r') as f:
-            sql_content = f.read()
-        
-        # Replace dbt ref() with actual table references
-        sql_content = sql_content.replace("{{ ref('slv_", "TRACKMAN_DW.SILVER.SLV_")
-        sql_content = sql_content.replace("{{ ref('brz_", "TRACKMAN_DW.BRONZE.BRZ_")
-        sql_content = sql_content.replace("') }}", "")
-        
-        create_table_sql = f"""
-        CREATE OR REPLACE TABLE TRACKMAN_DW.GOLD.{model_name.upper()} AS
-        {sql_content}
-        """
-        execute_sql(create_table_sql, f"GOLD.{model_name}")
+    unchanged = sum(1 for r in results.values() if r.status == "unchanged")
+    for result in sorted(results.values(), key=lambda r: -r.seconds):
+        if result.status == "unchanged":
+            continue
+        print(
+            f"  {models[result.name].layer:<7} {result.name:<30} {result.action:<7} {result.status:<8}"
+            f" {result.seconds:>8.2f}s  {result.query_id or '-'}"
+        )
+    path, path_seconds = critical_path(models, results)
+    busy = sum(r.seconds for r in results.values())
+    if unchanged:
+        print(f"  ({unchanged} unchanged model(s) not redeployed)")
+    print(f"\nCritical path ({path_seconds:.2f}s): " + " -> ".join(f"{n} ({results[n].seconds:.2f}s)" for n in path))
+    print(f"Wall time {wall_seconds:.2f}s on {workers} worker(s); {busy:.2f}s of model time (x{busy / max(wall_seconds, 1e-9):.1f} overlap)")
+    executed = sum(1 for r in results.values() if r.query_id)
+    print(f"{executed} statement(s) in {round_trips} submission(s)")
 
-if __name__ == "__main__":
-    print("Starting dbt deployment to Snowflake...")
-    print(f"Using connection: {os.getenv('SNOWFLAKE_CONNECTION_NAME') or 'DEMO_USWEST'}")
-    
-    deploy_bronze_models()
-    deploy_silver_models()
-    deploy_gold_models()
-    
-    conn.close()
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Deploy the trackman_dbt models in dependency order")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Queries in flight at once")
+    parser.add_argument(
+        "--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+        help="Most view statements sent together in one multi-statement submission",
+    )
+    parser.add_argument("--project-dir", type=Path, default=PROJECT_DIR, help="Directory holding dbt_project.yml")
+    parser.add_argument(
+        "--duckdb", nargs="?", const=":memory:", default=None, metavar="PATH",
+        help="Deploy to a local DuckDB database instead of Snowflake (in memory unless PATH is given)",
+    )
+    parser.add_argument(
+        "--stage-root", type=Path, default=PROJECT_ROOT,
+        help="With --duckdb, the local directory standing in for the S3 stage (holds sample_data/)",
+    )
+    parser.add_argument(
+        "--full-refresh", action="store_true",
+        help="Rebuild incremental models from scratch instead of merging new rows into them (implies --all)",
+    )
+    parser.add_argument("--all", action="store_true", help="Deploy every model, including ones unchanged since the last deploy")
+    parser.add_argument("--manifest", type=Path, default=MANIFEST_PATH, help="Manifest of deployed model versions")
+    parser.add_argument("--run-report", type=Path, default=RUN_REPORT_PATH, help="JSON report of this run's queries and timings")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    models = load_models(args.project_dir, "VIEW" if args.duckdb else "EXTERNAL TABLE")
+    if args.duckdb:
+        print(f"Starting dbt deployment to DuckDB ({args.duckdb}) over {args.stage_root}...")
+        connect = duckdb_connector(args.duckdb, sorted({m.schema for m in models.values()}))
+        submitter_for = lambda workers: ThreadedSubmitter(connect, workers)
+        target = "duckdb:" + (args.duckdb if args.duckdb == ":memory:" else str(Path(args.duckdb).resolve()))
+        information_schema = "information_schema"
+        dialect = lambda sql: duckdb_dialect(sql, args.stage_root)
+        stage_state = lambda submitter, paths: local_stage_state(args.stage_root, paths)
+    else:
+        print("Starting dbt deployment to Snowflake...")
+        print(f"Using connection: {os.getenv('SNOWFLAKE_CONNECTION_NAME') or 'DEMO_USWEST'}")
+        connect = snowflake_connector()
+        submitter_for = lambda workers: SnowflakeSubmitter(connect, workers)
+        target = f"snowflake:{os.getenv('SNOWFLAKE_CONNECTION_NAME') or 'DEMO_USWEST'}"
+        information_schema = f"{DATABASE}.INFORMATION_SCHEMA"
+        dialect = lambda sql: sql
+        stage_state = snowflake_stage_state
+    workers = max(1, min(args.workers, len(models)))
+    print(f"{len(models)} models, {sum(len(m.depends_on) for m in models.values())} refs, {workers} worker(s)")
+
+    submitter = submitter_for(workers)
+    existing = existing_relations(submitter, information_schema)
+    paths = {name: stage_paths(model) for name, model in models.items()}
+    state = stage_state(submitter, sorted({path for model_paths in paths.values() for path in model_paths}))
+    versions = model_versions(
+        models,
+        lambda model: dialect(model_sql(model)) + "".join(f"\n-- @{STAGE}/{p}: {state[p]}" for p in paths[model.name]),
+    )
+    manifest = load_manifest(args.manifest, target)
+    if args.all or args.full_refresh:
+        selected = list(models)
+    else:
+        selected = modified_models(models, versions, manifest, existing)
+    print(f"Deploying {len(selected)} of {len(models)} model(s); {len(models) - len(selected)} unchanged since the last deploy")
+    incremental = [m for m in models.values() if m.materialized == "incremental" and m.name in selected]
+    if args.full_refresh:
+        print(f"Full refresh: rebuilding {len(incremental)} incremental model(s)")
+    elif incremental:
+        merging = sum(1 for m in incremental if existing.get(m.relation, (None, []))[0] == "TABLE")
+        print(f"{merging} of {len(incremental)} incremental model(s) already exist and will be merged")
+
+    def statement(model: Model) -> Tuple[str, str]:
+        action, sql = plan_statement(model, existing, args.full_refresh)
+        return action, dialect(sql)
+
+    started = time.perf_counter()
+    try:
+        results = deploy(models, submitter, workers, statement, selected, args.batch_size)
+        wall_seconds = time.perf_counter() - started
+        apply_server_timings(submitter, results)
+    finally:
+        submitter.close()
+    save_manifest(args.manifest, target, update_manifest(manifest, models, versions, results))
+    write_run_report(args.run_report, target, models, results, wall_seconds, submitter.round_trips)
+    print_report(models, results, wall_seconds, workers, submitter.round_trips)
+    print(f"Run report written to {args.run_report}")
+
+    failed = [r.name for r in results.values() if r.status in ("error", "skipped")]
     print("\n" + "="*50)
-    print("DEPLOYMENT COMPLETE!")
+    print(f"DEPLOYMENT FAILED: {len(failed)} model(s) not deployed" if failed else "DEPLOYMENT COMPLETE!")
     print("="*50)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
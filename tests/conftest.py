@@ -0,0 +1,6 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+# The generator modules import each other as top-level modules, as when run from data_generator/
+sys.path[:0] = [str(ROOT), str(ROOT / "data_generator")]
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from ball_flight import FLIGHT_COLUMNS, FlightTable, default_flight_table, simulate_flight
+
+
+def launch_conditions(n, seed=0):
+    """Ball speed, launch, spin, spin axis and start direction spanning driver to wedge"""
+    rng = np.random.default_rng(seed)
+    return (
+        rng.uniform(60, 180, n), rng.uniform(5, 35, n), rng.uniform(2000, 10000, n),
+        rng.uniform(-20, 20, n), rng.uniform(-5, 5, n),
+    )
+
+
+@pytest.mark.parametrize("column, mean_yd, max_yd", [("carry", 0.25, 2.5), ("total", 0.25, 1.5), ("apex", 0.1, 0.5), ("lateral", 0.1, 0.5)])
+def test_default_table_tracks_the_solver(column, mean_yd, max_yd):
+    shots = launch_conditions(5000)
+    error = np.abs(default_flight_table().lookup(*shots)[column] - simulate_flight(*shots)[column])
+    assert error.mean() < mean_yd
+    assert error.max() < max_yd
+
+
+def test_table_is_exact_on_its_grid_points():
+    table = FlightTable(speeds=[100, 150], launches=[10, 20], spins=[3000, 6000], axes=[0, 10])
+    shots = (np.array([100, 150, 150]), np.array([10, 20, 10]), np.array([3000, 6000, 6000]), np.array([0, 10, -10]))
+    expected, looked_up = simulate_flight(*shots), table.lookup(*shots)
+    for column in FLIGHT_COLUMNS:
+        np.testing.assert_allclose(looked_up[column], expected[column], atol=1e-9)
+
+
+def test_negative_spin_axis_mirrors_the_shot():
+    speed, launch, spin, axis, _ = launch_conditions(200, seed=1)
+    right = default_flight_table().lookup(speed, launch, spin, np.abs(axis))
+    left = default_flight_table().lookup(speed, launch, spin, -np.abs(axis))
+    np.testing.assert_allclose(left["lateral"], -right["lateral"])
+    np.testing.assert_allclose(left["carry"], right["carry"])
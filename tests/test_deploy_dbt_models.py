@@ -0,0 +1,232 @@
+import itertools
+import json
+from types import SimpleNamespace
+
+import duckdb
+import pytest
+
+import deploy_dbt_models as deploy
+
+PROJECT_YML = """
+name: 'demo'
+config-version: 2
+model-paths: ["models"]
+macro-paths: ["macros"]
+target-path: "target"
+models:
+  demo:
+    staging:
+      +schema: staging
+      +materialized: view
+    marts:
+      +schema: marts
+      +materialized: table
+"""
+
+ORDERS = """
+{{ config(materialized='incremental', unique_key='order_id') }}
+SELECT order_id, amount FROM {{ ref('stg_orders') }}
+"""
+
+
+def write_project(root, models):
+    """A dbt project under root with models given as {'staging/stg_x': sql}"""
+    (root / "macros").mkdir(parents=True, exist_ok=True)
+    (root / "dbt_project.yml").write_text(PROJECT_YML)
+    for path, sql in models.items():
+        file = root / "models" / f"{path}.sql"
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text(sql)
+    return root
+
+
+def run_deploy(tmp_path, project, *args):
+    """deploy_dbt_models.main against a DuckDB file in tmp_path; the run report's models by name"""
+    report = tmp_path / "report.json"
+    deploy.main([
+        "--duckdb", str(tmp_path / "dw.duckdb"), "--project-dir", str(project),
+        "--manifest", str(tmp_path / "manifest.json"), "--run-report", str(report), *args,
+    ])
+    return {m["name"]: m for m in json.loads(report.read_text())["models"]}
+
+
+def deploy_in_memory(project, **kwargs):
+    models = deploy.load_models(project, "VIEW")
+    submitter = deploy.ThreadedSubmitter(
+        deploy.duckdb_connector(":memory:", sorted({m.schema for m in models.values()})), 2
+    )
+    try:
+        return deploy.deploy(models, submitter, 2, **kwargs), submitter.round_trips
+    finally:
+        submitter.close()
+
+
+def test_unknown_ref_is_rejected(tmp_path):
+    project = write_project(tmp_path, {"staging/a": "SELECT * FROM {{ ref('missing') }}"})
+    with pytest.raises(ValueError, match="a refs unknown model"):
+        deploy.load_models(project)
+
+
+def test_ref_cycle_is_rejected(tmp_path):
+    project = write_project(tmp_path, {
+        "staging/a": "SELECT * FROM {{ ref('b') }}",
+        "staging/b": "SELECT * FROM {{ ref('a') }}",
+    })
+    with pytest.raises(ValueError, match="ref\\(\\) cycle"):
+        deploy.load_models(project)
+
+
+def test_failed_model_skips_its_downstream_models_only(tmp_path):
+    project = write_project(tmp_path, {
+        "staging/broken": "SELECT * FROM no_such_table",
+        "staging/fine": "SELECT 1 AS id",
+        "marts/after_broken": "SELECT * FROM {{ ref('broken') }}",
+        "marts/after_fine": "SELECT * FROM {{ ref('fine') }}",
+    })
+    results, _ = deploy_in_memory(project)
+
+    assert results["broken"].status == "error"
+    assert results["after_broken"].status == "skipped"
+    assert results["fine"].status == "success"
+    assert results["after_fine"].status == "success"
+
+
+def test_views_ready_together_share_one_submission(tmp_path):
+    project = write_project(tmp_path, {
+        **{f"staging/v{i}": f"SELECT {i} AS id" for i in range(3)},
+        "marts/t": "SELECT * FROM {{ ref('v0') }}",
+    })
+    results, round_trips = deploy_in_memory(project)
+    assert all(r.status == "success" for r in results.values())
+    assert round_trips == 2  # the three views, then the table
+
+    _, round_trips = deploy_in_memory(project, batch_size=2)
+    assert round_trips == 3
+
+
+def test_incremental_model_is_created_then_merged(tmp_path):
+    project = write_project(tmp_path / "project", {
+        "staging/stg_orders": "SELECT 1 AS order_id, 10 AS amount UNION ALL SELECT 2, 20",
+        "marts/orders": ORDERS,
+    })
+    assert run_deploy(tmp_path, project)["orders"]["action"] == "create"
+
+    write_project(project, {"staging/stg_orders": "SELECT 2 AS order_id, 25 AS amount UNION ALL SELECT 3, 30"})
+    assert run_deploy(tmp_path, project)["orders"]["action"] == "merge"
+
+    with duckdb.connect(str(tmp_path / "dw.duckdb")) as conn:
+        rows = conn.execute("SELECT order_id, amount FROM marts.orders ORDER BY order_id").fetchall()
+    assert rows == [(1, 10), (2, 25), (3, 30)]
+
+
+def test_editing_one_model_redeploys_it_and_its_downstream_models(tmp_path):
+    project = write_project(tmp_path / "project", {
+        "staging/stg_orders": "SELECT 1 AS order_id, 10 AS amount",
+        "staging/stg_customers": "SELECT 1 AS customer_id",
+        "marts/orders": ORDERS,
+        "marts/customers": "SELECT * FROM {{ ref('stg_customers') }}",
+    })
+    run_deploy(tmp_path, project)
+    assert {m["status"] for m in run_deploy(tmp_path, project).values()} == {"unchanged"}
+
+    write_project(project, {"staging/stg_orders": "SELECT 2 AS order_id, 20 AS amount"})
+    statuses = {name: m["status"] for name, m in run_deploy(tmp_path, project).items()}
+
+    assert statuses == {
+        "stg_orders": "success", "orders": "success", "stg_customers": "unchanged", "customers": "unchanged",
+    }
+
+
+class FakeSnowflakeConnection:
+    """The parts of snowflake.connector's connection SnowflakeSubmitter uses; every query finishes at once"""
+
+    def __init__(self, fail=()):
+        self.fail = set(fail)
+        self.queries = {}
+        self.children = {}
+        self.running = set()
+        self.max_running = 0
+        self._ids = itertools.count(1)
+
+    def cursor(self):
+        return FakeSnowflakeCursor(self)
+
+    def get_query_status(self, query_id):
+        return "SUCCESS"
+
+    def is_still_running(self, status):
+        return False
+
+    def get_query_status_throw_if_error(self, query_id):
+        self.running.discard(query_id)
+        if any(name in self.queries[query_id] for name in self.fail):
+            raise RuntimeError(f"query {query_id} failed")
+
+    def close(self):
+        pass
+
+
+class FakeSnowflakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.sfqid = None
+        self._pending = []
+
+    def execute_async(self, sql, num_statements=None):
+        self.sfqid = f"q{next(self.conn._ids)}"
+        self.conn.queries[self.sfqid] = sql
+        self.conn.running.add(self.sfqid)
+        self.conn.max_running = max(self.conn.max_running, len(self.conn.running))
+        if num_statements:
+            self.conn.children[self.sfqid] = [f"{self.sfqid}-{i}" for i in range(num_statements)]
+
+    def get_results_from_sfqid(self, query_id):
+        # Like the connector, the cursor lands on the first statement and nextset() moves on
+        self.sfqid, *self._pending = self.conn.children[query_id]
+
+    def nextset(self):
+        if not self._pending:
+            return None
+        self.sfqid = self._pending.pop(0)
+        return True
+
+
+def statement(name):
+    return deploy.Statement(SimpleNamespace(name=name, schema="BRONZE"), "create", f"CREATE VIEW {name}")
+
+
+def test_snowflake_batch_reports_each_statements_query_id():
+    conn = FakeSnowflakeConnection()
+    submitter = deploy.SnowflakeSubmitter(lambda: conn)
+    parent = submitter.submit([statement("a"), statement("b"), statement("c")])
+
+    results = submitter.poll()
+
+    assert [result.query_id for _, result in results] == [f"{parent}-0", f"{parent}-1", f"{parent}-2"]
+    assert submitter.round_trips == 1
+
+
+def test_snowflake_failed_batch_is_resubmitted_one_by_one():
+    conn = FakeSnowflakeConnection(fail={"CREATE VIEW b"})
+    submitter = deploy.SnowflakeSubmitter(lambda: conn)
+    submitter.submit([statement("a"), statement("b")])
+
+    assert submitter.poll() == []
+    results = {s.model.name: r for s, r in submitter.poll()}
+
+    assert results["a"].status == "success"
+    assert results["b"].status == "error"
+    assert submitter.round_trips == 3
+
+
+def test_snowflake_resubmissions_stay_within_the_worker_limit():
+    conn = FakeSnowflakeConnection(fail={"CREATE VIEW b"})
+    submitter = deploy.SnowflakeSubmitter(lambda: conn, workers=1)
+    submitter.submit([statement("a"), statement("b"), statement("c")])
+
+    results = {}
+    while submitter.in_flight:
+        results.update({s.model.name: r.status for s, r in submitter.poll()})
+
+    assert results == {"a": "success", "b": "error", "c": "success"}
+    assert conn.max_running == 1
@@ -0,0 +1,146 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+import generate_trackman_data as gen
+
+
+START, END = datetime(2024, 12, 1), datetime(2024, 12, 31)
+
+
+@pytest.fixture(scope="module")
+def dims():
+    rng = np.random.default_rng(1)
+    players = gen.generate_players(50, as_of=END, rng=rng)
+    bays = gen.generate_bays(gen.generate_facilities(5, as_of=END, rng=rng), as_of=END, rng=rng)
+    courses, holes = gen.generate_courses_and_holes()
+    return players, bays, courses, holes
+
+
+def arrow_types(df):
+    """Column name -> Arrow type as the table would be written to Parquet"""
+    return {field.name: field.type for field in pa.Table.from_pandas(df, preserve_index=False).schema}
+
+
+def shot_batch(seed, n=2000, ball_flight="empirical"):
+    club_idx = np.random.default_rng(seed).integers(0, len(gen.CLUB_NAMES), n)
+    return club_idx, gen.generate_shot_batch(0.6, 0.7, 100.0, club_idx, seed=seed, ball_flight=ball_flight)
+
+
+def test_shot_batch_is_reproducible_from_its_seed():
+    _, first = shot_batch(3)
+    _, again = shot_batch(3)
+    _, other = shot_batch(4)
+
+    assert first.keys() == set(gen.SHOT_METRIC_COLUMNS)
+    for column in first:
+        np.testing.assert_array_equal(first[column], again[column])
+    assert not np.array_equal(first["carry_distance"], other["carry_distance"])
+
+
+def test_shot_batch_stays_in_each_clubs_ranges():
+    club_idx, shots = shot_batch(5, n=20_000)
+    table = gen.CLUB_TABLE
+
+    for i, club in enumerate(gen.CLUB_NAMES):
+        mask = club_idx == i
+        carry = shots["carry_distance"][mask]
+        spin = shots["spin_rate"][mask]
+        assert mask.any(), club
+        assert (carry >= table["distance_min"][i] * 0.6 - 0.05).all(), club
+        assert (carry <= table["distance_max"][i] * 1.15 + 0.05).all(), club
+        assert (spin >= int(table["spin_min"][i] * 0.7) - 1).all(), club
+        assert (spin <= table["spin_max"][i] * 1.3).all(), club
+    assert (shots["total_distance"] >= shots["carry_distance"]).all()
+    assert ((shots["club_speed"] >= 40) & (shots["club_speed"] <= 130)).all()
+    assert (shots["smash_factor"] <= 1.52).all()
+
+
+def test_shot_batch_rejects_unknown_ball_flight():
+    with pytest.raises(ValueError, match="Unknown ball flight mode"):
+        gen.generate_shot_batch(0.5, 0.5, 100.0, np.zeros(3, dtype=int), seed=1, ball_flight="magic")
+
+
+def test_columnar_engine_writes_the_legacy_schema(dims):
+    legacy = gen.generate_sessions_comprehensive(*dims, START, END, target_sessions=400)
+    columnar = gen.generate_sessions_columnar(*dims, START, END, target_sessions=400, seed=1)
+
+    for table, old, new in zip(gen.SESSION_FACT_TABLES, legacy, columnar):
+        assert len(old) and len(new), table
+        assert arrow_types(new) == arrow_types(old), table
+
+
+def test_stream_writer_cuts_fixed_size_row_groups(tmp_path):
+    path = tmp_path / "part-0000.parquet"
+    with gen.ParquetStreamWriter(path, row_group_size=100) as writer:
+        for start in range(0, 350, 70):
+            writer.write(pd.DataFrame({"id": range(start, start + 70), "value": np.arange(70) * 0.5}))
+
+    metadata = pq.ParquetFile(path).metadata
+    assert [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)] == [100, 100, 100, 50]
+    assert pq.read_table(path).column("id").to_pylist() == list(range(350))
+    assert writer.rows_written == 350
+
+
+def test_stream_writer_close_with_only_empty_chunks_writes_an_empty_table(tmp_path):
+    path = tmp_path / "empty.parquet"
+    with gen.ParquetStreamWriter(path) as writer:
+        writer.write(pd.DataFrame({"id": pd.Series([], dtype="int64")}))
+
+    table = pq.read_table(path)
+    assert table.num_rows == 0
+    assert table.schema.field("id").type == pa.int64()
+
+
+def test_stream_writer_close_without_writes_creates_no_file(tmp_path):
+    path = tmp_path / "never.parquet"
+    gen.ParquetStreamWriter(path).close()
+    assert not path.exists()
+
+
+def test_sharded_output_does_not_depend_on_the_worker_count(dims, tmp_path):
+    def run(workers):
+        output_dir = tmp_path / f"workers{workers}"
+        counts = gen.generate_facts_sharded(
+            *dims, START, END, output_dir, target_sessions=120, shards=3, workers=workers, seed=9,
+        )
+        return counts, {path.relative_to(output_dir): pq.read_table(path) for path in sorted(output_dir.rglob("*.parquet"))}
+
+    counts_one, files_one = run(1)
+    counts_three, files_three = run(3)
+
+    assert counts_one == counts_three
+    assert files_one.keys() == files_three.keys()
+    assert len(files_one) > 3
+    for path, table in files_one.items():
+        assert table.equals(files_three[path]), path
+
+
+def id_values(ids):
+    return [bytes(v) if isinstance(v, (bytes, bytearray, memoryview)) else v for v in ids]
+
+
+@pytest.mark.parametrize("strategy", gen.ID_STRATEGIES)
+def test_ids_are_unique_within_and_across_shards(strategy):
+    values = []
+    for shard in (0, 1, 2, gen.STREAM_SHARD_BASE):
+        factory = gen.IdFactory(strategy, seed=42, shard=shard)
+        values += id_values(factory.take(5000))
+        values += id_values(factory.next() for _ in range(100))
+    assert len(set(values)) == len(values)
+
+
+@pytest.mark.parametrize("strategy", ["seeded", "deterministic", "binary", "int64"])
+def test_ids_are_reproducible_from_seed_and_shard(strategy):
+    first = id_values(gen.IdFactory(strategy, seed=7, shard=3).take(100))
+    assert first == id_values(gen.IdFactory(strategy, seed=7, shard=3).take(100))
+
+
+@pytest.mark.parametrize("strategy, shard", [("deterministic", 1 << 16), ("int64", 1 << 23), ("deterministic", -1)])
+def test_ids_reject_shards_outside_the_key_layout(strategy, shard):
+    with pytest.raises(ValueError, match="does not fit"):
+        gen.IdFactory(strategy, shard=shard)
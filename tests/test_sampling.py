@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from sampling import AliasTable, CategoricalSampler
+
+
+@pytest.mark.parametrize("weights", [[1, 1, 1, 1], [0.05, 0.35, 0.45, 0.15], [5, 0, 1, 0.5, 3], [1]])
+def test_alias_table_encodes_its_weights(weights):
+    table = AliasTable(weights)
+    expected = np.asarray(weights, dtype=float) / np.sum(weights)
+    np.testing.assert_allclose(table.probabilities(), expected)
+
+
+def test_alias_table_draws_follow_its_weights():
+    weights = np.array([0.05, 0.35, 0.45, 0.15])
+    draws = AliasTable(weights).sample(np.random.default_rng(0), 200_000)
+    np.testing.assert_allclose(np.bincount(draws, minlength=4) / len(draws), weights, atol=0.005)
+
+
+def test_alias_table_never_draws_zero_weights():
+    draws = AliasTable([0, 3, 0, 1]).sample(np.random.default_rng(1), 10_000)
+    assert set(np.unique(draws)) == {1, 3}
+
+
+@pytest.mark.parametrize("weights", [[], [-1, 2], [0, 0], [[1, 2]]])
+def test_alias_table_rejects_bad_weights(weights):
+    with pytest.raises(ValueError):
+        AliasTable(weights)
+
+
+def test_categorical_sampler_returns_values_and_is_seeded():
+    sampler = CategoricalSampler([(-2, 5), (5, 15), (15, 25)], [0.2, 0.5, 0.3])
+    first = sampler.sample(np.random.default_rng(7), 50)
+    again = sampler.sample(np.random.default_rng(7), 50)
+
+    assert all(value in [(-2, 5), (5, 15), (15, 25)] for value in first)
+    assert list(first) == list(again)
+    np.testing.assert_allclose(sampler.table.probabilities(), [0.2, 0.5, 0.3])
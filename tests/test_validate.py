@@ -0,0 +1,68 @@
+import shutil
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+import pytest
+
+import generate_trackman_data as gen
+from validate import validate_output
+
+
+@pytest.fixture(scope="module")
+def clean_run(tmp_path_factory):
+    output_dir = tmp_path_factory.mktemp("clean") / "sample_data"
+    gen.main([
+        "--sessions", "200", "--players", "40", "--facilities", "4", "--days", "10", "--end-date", "2024-12-31",
+        "--engine", "columnar", "--skip-validation", "--output-dir", str(output_dir),
+    ])
+    return output_dir
+
+
+@pytest.fixture
+def run_copy(clean_run, tmp_path):
+    return shutil.copytree(clean_run, tmp_path / "sample_data")
+
+
+def rewrite_first_file(output_dir, table, change):
+    path = sorted((output_dir / "facts" / table).rglob("*.parquet"))[0]
+    pq.write_table(change(pq.read_table(path)), path)
+
+
+def issue_checks(report):
+    return {(issue.table, issue.check) for issue in report.issues}
+
+
+def test_generated_run_passes(clean_run):
+    report = validate_output(clean_run)
+    assert report.ok, [str(issue) for issue in report.issues]
+    assert report.rows["fact_shots"] > 0
+
+
+def test_corrupted_shots_are_reported(run_copy):
+    def corrupt(table):
+        carry = table.column("carry_distance").to_pylist()
+        carry[0] = 9999.0
+        ids = table.column("shot_id").to_pylist()
+        ids[2] = ids[1]
+        table = table.set_column(table.schema.get_field_index("carry_distance"), "carry_distance", pa.array(carry))
+        return table.set_column(table.schema.get_field_index("shot_id"), "shot_id", pa.array(ids, table.schema.field("shot_id").type))
+
+    rewrite_first_file(run_copy, "fact_shots", corrupt)
+    checks = issue_checks(validate_output(run_copy, ["fact_shots"]))
+
+    assert ("fact_shots", "primary key") in checks
+    assert ("fact_shots", "club range") in checks
+
+
+def test_missing_column_and_unknown_foreign_key_are_reported(run_copy):
+    rewrite_first_file(run_copy, "fact_shots", lambda table: table.drop_columns(["spin_rate"]))
+    rewrite_first_file(run_copy, "fact_sessions", lambda table: table.set_column(
+        table.schema.get_field_index("player_id"), "player_id",
+        pc.if_else(pa.array([i == 0 for i in range(table.num_rows)]), "no-such-player", table.column("player_id")),
+    ))
+    report = validate_output(run_copy)
+
+    assert not report.ok
+    assert any(issue.table == "fact_shots" and "spin_rate" in issue.detail for issue in report.issues)
+    assert any(issue.table == "fact_sessions" and "player_id" in str(issue) for issue in report.issues)
@@ -1,15 +1,14 @@
 SELECT
-    $1:booking_id::VARCHAR AS booking_id,
-    $1:bay_id::VARCHAR AS bay_id,
-    $1:facility_id::VARCHAR AS facility_id,
-    $1:booking_date::DATE AS booking_date,
-    $1:hour::INT AS hour,
-    $1:day_of_week::VARCHAR AS day_of_week,
-    $1:is_weekend::BOOLEAN AS is_weekend,
-    $1:is_booked::BOOLEAN AS is_booked,
-    $1:is_occupied::BOOLEAN AS is_occupied,
-    $1:session_type::VARCHAR AS session_type,
-    $1:num_players::INT AS num_players,
-    $1:revenue::FLOAT AS revenue
-FROM @TRACKMAN_DW.PUBLIC.S3_SOURCE/sample_data/facts/fact_bay_bookings.parquet
-(FILE_FORMAT => 'TRACKMAN_DW.STAGING.PARQUET_FORMAT')
+    value:booking_id::VARCHAR AS booking_id,
+    value:bay_id::VARCHAR AS bay_id,
+    value:facility_id::VARCHAR AS facility_id,
+    COALESCE(booking_date, value:booking_date::DATE) AS booking_date,  -- from the path, or the file's column when unpartitioned
+    value:hour::INT AS hour,
+    value:day_of_week::VARCHAR AS day_of_week,
+    value:is_weekend::BOOLEAN AS is_weekend,
+    value:is_booked::BOOLEAN AS is_booked,
+    value:is_occupied::BOOLEAN AS is_occupied,
+    value:session_type::VARCHAR AS session_type,
+    value:num_players::INT AS num_players,
+    value:revenue::FLOAT AS revenue
+FROM {{ source('s3_source', 'fact_bay_bookings') }}
@@ -1,19 +1,18 @@
 SELECT
-    $1:hole_score_id::VARCHAR AS hole_score_id,
-    $1:scorecard_id::VARCHAR AS scorecard_id,
-    $1:session_id::VARCHAR AS session_id,
-    $1:player_id::VARCHAR AS player_id,
-    $1:course_id::VARCHAR AS course_id,
-    $1:hole_number::INT AS hole_number,
-    $1:par::INT AS par,
-    $1:yardage::INT AS yardage,
-    $1:stroke_index::INT AS stroke_index,
-    $1:strokes::INT AS strokes,
-    $1:putts::INT AS putts,
-    $1:gir::BOOLEAN AS gir,
-    $1:fir::BOOLEAN AS fir,
-    $1:score_type::VARCHAR AS score_type,
-    $1:vs_par::INT AS vs_par,
-    $1:score_date::DATE AS score_date
-FROM @TRACKMAN_DW.PUBLIC.S3_SOURCE/sample_data/facts/fact_hole_scores.parquet
-(FILE_FORMAT => 'TRACKMAN_DW.STAGING.PARQUET_FORMAT')
+    value:hole_score_id::VARCHAR AS hole_score_id,
+    value:scorecard_id::VARCHAR AS scorecard_id,
+    value:session_id::VARCHAR AS session_id,
+    value:player_id::VARCHAR AS player_id,
+    value:course_id::VARCHAR AS course_id,
+    value:hole_number::INT AS hole_number,
+    value:par::INT AS par,
+    value:yardage::INT AS yardage,
+    value:stroke_index::INT AS stroke_index,
+    value:strokes::INT AS strokes,
+    value:putts::INT AS putts,
+    value:gir::BOOLEAN AS gir,
+    value:fir::BOOLEAN AS fir,
+    value:score_type::VARCHAR AS score_type,
+    value:vs_par::INT AS vs_par,
+    COALESCE(score_date, value:score_date::DATE) AS score_date  -- from the path, or the file's column when unpartitioned
+FROM {{ source('s3_source', 'fact_hole_scores') }}